@@ -0,0 +1,31 @@
+"""
+gRPC client SDK.
+
+Selects the upb (C) protobuf backend unless PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is
+already set by the environment.
+
+protobuf reads that variable once, when google.protobuf is first imported. The generated
+*_pb2 modules come from the top-level "generated" package, which can be imported without
+going through grpc_client_sdk (a test or conftest importing generated.* first, for example).
+In that case the setting below has no effect, so this package must be imported before
+anything that imports protobuf. Set the environment variable instead to be sure.
+"""
+
+import os
+import logging
+
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+try:
+    from google.protobuf.internal import api_implementation
+except ImportError:
+    pass
+else:
+    # "cpp" is the legacy C++ extension; either native backend is fine
+    if api_implementation.Type() not in ("upb", "cpp"):
+        logging.getLogger(__name__).warning(
+            "protobuf is using the '%s' backend instead of a native one (upb/cpp); message building and "
+            "serialization will be significantly slower. The upb default only applies when grpc_client_sdk "
+            "is imported before protobuf; set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb to be sure",
+            api_implementation.Type()
+        )
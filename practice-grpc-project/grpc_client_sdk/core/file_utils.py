@@ -0,0 +1,25 @@
+"""
+File helpers shared by the service clients.
+"""
+
+import os
+from pathlib import Path
+from typing import Union
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def write_file_bytes(file_path: Union[str, Path], data: bytes) -> None:
+    """
+    Write bytes straight to a raw file descriptor, skipping BufferedWriter's extra copy.
+
+    A single write() is capped by the OS (about 2GB on Linux) and may be partial,
+    so the remainder is written in a loop; slicing the memoryview does not copy.
+    """
+    fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -24,6 +24,19 @@ class GrpcClient:
 
     DEFAULT_FALLBACK_PORTS = [50051, 50052, 50053, 55000, 55001]
 
+    # Shared by the sync channel and the grpc.aio channels services open to the same target,
+    # so large replies such as full-screen screenshots are not cut off at gRPC's 4MB default
+    CHANNEL_OPTIONS = [
+        ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
+        ("grpc.max_receive_message_length", 100 * 1024 * 1024),
+        ("grpc.keepalive_time_ms", 10000),
+        ("grpc.keepalive_timeout_ms", 5000),
+        ("grpc.keepalive_permit_without_calls", True),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.http2.min_time_between_pings_ms", 10000),
+        ("grpc.http2.min_ping_interval_without_data_ms", 300000)
+    ]
+
     def __init__(self, host: str, port: int, logger: Optional[Logger] = None):
         """
         Initialize the gRPC client with the specified host and port.
@@ -68,19 +81,7 @@ class GrpcClient:
 
             try:
                 self.logger.info(f"Attempting to connect to {target}")
-                self.channel = grpc.insecure_channel(
-                    target,
-                    options=[
-                        ("grpc.max_send_message_length", 100 * 1024 * 1024),  # 100MB
-                        ("grpc.max_receive_message_length", 100 * 1024 * 1024),
-                        ("grpc.keepalive_time_ms", 10000),
-                        ("grpc.keepalive_timeout_ms", 5000),
-                        ("grpc.keepalive_permit_without_calls", True),
-                        ("grpc.http2.max_pings_without_data", 0),
-                        ("grpc.http2.min_time_between_pings_ms", 10000),
-                        ("grpc.http2.min_ping_interval_without_data_ms", 300000)
-                    ]
-                )
+                self.channel = grpc.insecure_channel(target, options=self.CHANNEL_OPTIONS)
 
                 # Try to establish connection with a timeout
                 grpc.channel_ready_future(self.channel).result(timeout=5)
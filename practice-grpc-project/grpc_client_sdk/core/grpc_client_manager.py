@@ -1,9 +1,27 @@
-from typing import Dict, Any, Optional
+import asyncio
+import itertools
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+import grpc
 
 from grpc_client_sdk.core.grpc_client import GrpcClient
 from test_framework.utils import get_logger
 
 
+class _RoundRobinStub:
+    """Stub proxy that sends each RPC through the next stub of a channel pool."""
+
+    def __init__(self, stubs: List[Any]):
+        self._stubs = stubs
+        self._size = len(stubs)
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        self._counter = itertools.count()
+
+    def __getattr__(self, method: str) -> Any:
+        return getattr(self._stubs[next(self._counter) % self._size], method)
+
+
 class GrpcClientManager:
     """
     Registry and accessor for global gRPC clients.
@@ -25,13 +43,30 @@ class GrpcClientManager:
     _clients: Dict[str, GrpcClient] = {}
     _logger = get_logger('grpc_client_manager')
 
+    # One event loop thread serves every grpc.aio channel, so streams share it instead of
+    # each holding an OS thread; channels and stubs are created on first use
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _async_channels: Dict[str, Any] = {}
+    _async_stubs: Dict[Tuple[str, Any], Any] = {}
+    _async_lock = threading.Lock()
+
+    # Extra sync channels per client for high-concurrency services; each one gets its own
+    # subchannel pool so it opens a separate TCP connection instead of sharing the default one
+    POOL_SIZE = 4
+    _pool_sizes: Dict[str, int] = {}
+    _pooled_channels: Dict[str, List[grpc.Channel]] = {}
+    _pooled_stubs: Dict[Tuple[str, Any], _RoundRobinStub] = {}
+    _pool_lock = threading.Lock()
+
     @classmethod
-    def register_clients(cls, name: str, target: str) -> bool:
+    def register_clients(cls, name: str, target: str, pool_size: Optional[int] = None) -> bool:
         """
         Register a new gRPC client with specified name and target.
 
         :param name: Logical name of the client (e.g., "root", "username")
         :param target: host:port of the gRPC server (e.g., "localhost:50051")
+        :param pool_size: Number of channels get_pooled_stub() opens for this client (default POOL_SIZE).
+                          Ignored if the client is already registered.
         :return: True if the client was successfully registered, False otherwise.
         """
         if name in cls._clients:
@@ -50,6 +85,8 @@ class GrpcClientManager:
 
         # Store the connected client
         cls._clients[name] = client
+        if pool_size:
+            cls._pool_sizes[name] = pool_size
         cls._logger.info(f"Successfully registered client '{name}' at {host}:{client.actual_port}.")
         return True
 
@@ -97,6 +134,109 @@ class GrpcClientManager:
             cls._logger.error(f"Failed to get stub {stub_class.__name__} for client '{name}': {e}")
             raise
 
+    @classmethod
+    def get_pooled_stub(cls, name: str, stub_class: Any) -> Any:
+        """
+        Retrieve a stub that spreads RPCs round-robin over the client's channel pool
+        (pool_size from register_clients, else POOL_SIZE channels).
+
+        A single HTTP/2 connection serializes concurrent calls behind one flow-control window;
+        use this for services whose calls are issued concurrently from several threads.
+
+        :param name: Registered client name.
+        :param stub_class: gRPC-generated stub class.
+        :return: Stub proxy exposing the same methods as stub_class.
+        :raises RuntimeError: If client is not registered or not connected
+        """
+        key = (name, stub_class)
+        stub = cls._pooled_stubs.get(key)
+        if stub is not None:
+            return stub
+
+        # Goes through the reconnect logic and fails the same way as a plain stub would
+        cls.get_stub(name, stub_class)
+        client = cls._clients[name]
+
+        with cls._pool_lock:
+            channels = cls._pooled_channels.get(name)
+            if channels is None:
+                target = f"{client.host}:{client.actual_port}"
+                options = client.CHANNEL_OPTIONS + [("grpc.use_local_subchannel_pool", 1)]
+                pool_size = cls._pool_sizes.get(name, cls.POOL_SIZE)
+                channels = [grpc.insecure_channel(target, options=options) for _ in range(pool_size)]
+                cls._pooled_channels[name] = channels
+            return cls._pooled_stubs.setdefault(key, _RoundRobinStub([stub_class(channel) for channel in channels]))
+
+    @classmethod
+    def _close_pooled_channels(cls, name: str) -> None:
+        """Drop and close a client's pooled channels and the stubs built on them."""
+        with cls._pool_lock:
+            channels = cls._pooled_channels.pop(name, ())
+            for key in [key for key in cls._pooled_stubs if key[0] == name]:
+                del cls._pooled_stubs[key]
+        for channel in channels:
+            channel.close()
+
+    @classmethod
+    def get_event_loop(cls) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop shared by all grpc.aio channels, starting its thread on first use.
+
+        Schedule work on it with asyncio.run_coroutine_threadsafe().
+        """
+        with cls._async_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="grpc-aio-loop", daemon=True).start()
+                cls._loop = loop
+            return cls._loop
+
+    @classmethod
+    def get_async_stub(cls, name: str, stub_class: Any) -> Optional[Any]:
+        """
+        Retrieve a grpc.aio service stub for the registered client, bound to the shared event loop.
+
+        :param name: Registered client name.
+        :param stub_class: gRPC-generated stub class.
+        :return: Stub whose calls must be awaited on get_event_loop(), or None if the client is
+                 not registered or not connected.
+
+        Example:
+            stub = GrpcClientManager.get_async_stub("root", SomeServiceStub)
+            future = asyncio.run_coroutine_threadsafe(stub.SomeMethod(request), GrpcClientManager.get_event_loop())
+        """
+        key = (name, stub_class)
+        stub = cls._async_stubs.get(key)
+        if stub is not None:
+            return stub
+
+        client = cls.get_client(name)
+        if client is None or not client.connected:
+            return None
+
+        loop = cls.get_event_loop()
+
+        async def create_channel():
+            # An aio channel binds to the loop it is created on
+            return grpc.aio.insecure_channel(f"{client.host}:{client.actual_port}", options=client.CHANNEL_OPTIONS)
+
+        with cls._async_lock:
+            channel = cls._async_channels.get(name)
+            if channel is None:
+                channel = asyncio.run_coroutine_threadsafe(create_channel(), loop).result()
+                cls._async_channels[name] = channel
+            return cls._async_stubs.setdefault(key, stub_class(channel))
+
+    @classmethod
+    def _close_async_channel(cls, name: str) -> None:
+        """Drop a client's grpc.aio channel and stubs, closing the channel on the shared loop."""
+        with cls._async_lock:
+            channel = cls._async_channels.pop(name, None)
+            for key in [key for key in cls._async_stubs if key[0] == name]:
+                del cls._async_stubs[key]
+        if channel is not None:
+            asyncio.run_coroutine_threadsafe(channel.close(), cls._loop)
+
     @classmethod
     def remove_client(cls, name: str) -> bool:
         """
@@ -113,7 +253,10 @@ class GrpcClientManager:
                     client.channel.close()
             except Exception as e:
                 cls._logger.warning(f"Error closing connection for client '{name}': {e}")
-            
+
+            cls._close_async_channel(name)
+            cls._close_pooled_channels(name)
+            cls._pool_sizes.pop(name, None)
             del cls._clients[name]
             cls._logger.info(f"Removed client '{name}'")
             return True
@@ -126,5 +269,10 @@ class GrpcClientManager:
         """
         Clear all registered clients (mainly) for test teardown.
         """
+        for name in list(cls._async_channels):
+            cls._close_async_channel(name)
+        for name in list(cls._pooled_channels):
+            cls._close_pooled_channels(name)
+        cls._pool_sizes.clear()
         cls._clients.clear()
         cls._logger.info("Cleared all registered clients")
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator
 
 from generated import file_transfer_service_pb2
 from generated.file_transfer_service_pb2_grpc import FileTransferServiceStub
@@ -51,8 +51,10 @@ class FileTransferServiceClient:
     def connect(self) -> None:
         """
         Establishes the gRPC connection and stub for FileTransferService.
+        The stub spreads transfers over the client's channel pool, so concurrent large
+        transfers do not share one connection's flow-control window.
         """
-        self.stub = GrpcClientManager.get_stub(self.client_name, FileTransferServiceStub)
+        self.stub = GrpcClientManager.get_pooled_stub(self.client_name, FileTransferServiceStub)
 
     def download_file(self, remote_path: str, tail_bytes: Optional[str] = None) -> Optional[bytes]:
         """
@@ -135,6 +137,47 @@ class FileTransferServiceClient:
             self.logger.error(f"Download failed for '{remote_path}': {e}")
             return None
 
+    def download_file_stream(self, remote_path: str, tail_bytes: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Downloads a file from the macOS server, yielding each chunk as it arrives.
+        Unlike download_file, the file is never held in memory as a whole, so chunks can be
+        written to disk while the rest is still being received.
+
+        :param remote_path: Absolute path to the file on the macOS server.
+        :param tail_bytes: Optional. If specified, only the last N bytes of the file will be downloaded.
+        :return: Iterator over the file content chunks.
+        :raises RuntimeError: If the client is not connected or the server fails to provide the file.
+
+        Example:
+            client = FileTransferServiceClient(client_name="root")
+            client.connect()
+            with open('local_file.txt', 'wb') as f:
+                for chunk in client.download_file_stream('/path/to/remote/file.txt'):
+                    f.write(chunk)
+        """
+        if not self.stub:
+            raise RuntimeError("FileTransferServiceClient not connected.")
+
+        request = file_transfer_service_pb2.DownloadFileRequest(server_file_path=remote_path)
+        if tail_bytes:
+            request.tail_bytes = tail_bytes
+            self.logger.info(f"Requesting last {tail_bytes} bytes of {remote_path}")
+
+        metadata_received = False
+        for response in self.stub.DownloadFile(request):
+            if response.HasField("metadata"):
+                metadata = response.metadata
+                if not metadata.success:
+                    raise RuntimeError(f"Server failed to provide file: {metadata.error_message}")
+                metadata_received = True
+                self.logger.info(f"File metadata received: {metadata.filename} ({metadata.file_size} bytes)")
+
+            elif response.HasField("chunk_data"):
+                yield response.chunk_data
+
+        if not metadata_received:
+            raise RuntimeError("No file metadata received during download.")
+
     def upload_file(self, local_path: str, remote_path: str) -> bool:
         """
         Uploads a file to the macOS server using chunked streaming.
@@ -6,13 +6,25 @@ Reason: Combined production patterns from existing codebase with comprehensive f
 """
 
 import os
+import atexit
+import shutil
 import time
+import hashlib
+import subprocess
+import threading
+import logging
 import tempfile
 import asyncio
-from typing import Dict, Any, Optional, List, Union, Tuple, Generator
+import functools
+import itertools
+from typing import Dict, Any, Optional, List, Set, Sequence, Union, Tuple, Generator, AsyncIterator
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
+from collections import deque
 
+import grpc
+
+from grpc_client_sdk.core.file_utils import write_file_bytes
 from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
 from test_framework.utils import get_logger
 from test_framework.utils.logger_settings.logger_config import LoggerConfig
@@ -58,6 +70,420 @@ except ImportError:
             def __init__(self, **kwargs): pass
 
 
+# Module-level aliases so hot request builders resolve protobuf types with one global lookup
+_PB = gui_automation_service_pb2
+_GuiRequest = _PB.GuiRequest
+_GuiAction = _PB.GuiAction
+_GuiTarget = _PB.GuiTarget
+_GuiLoc = _PB.GuiLocation
+_GuiOpts = _PB.GuiOptions
+_CLICK = _PB.CLICK
+_DOUBLE_CLICK = _PB.DOUBLE_CLICK
+_TYPE_TEXT = _PB.TYPE_TEXT
+_KEY_PRESS = _PB.KEY_PRESS
+_DRAG = _PB.DRAG
+_SCROLL = _PB.SCROLL
+_HOVER = _PB.HOVER
+_FIND_ELEMENT = _PB.FIND_ELEMENT
+_COORDS = _PB.COORDINATES
+_IMAGE_MATCH = _PB.IMAGE_MATCH
+_TEXT_MATCH = _PB.TEXT_MATCH
+
+# Common key names mapped to macOS virtual key codes
+_KEY_MAP = {
+    "Return": "36", "Enter": "36",
+    "Tab": "48",
+    "Escape": "53", "Esc": "53",
+    "Space": "49",
+    "Delete": "51", "Backspace": "51",
+    "Up": "126", "Down": "125", "Left": "123", "Right": "124"
+}
+
+# Accepted scroll directions, normalised to the wire value the service expects
+_SCROLL_DIRECTIONS = {"up": "up", "down": "down", "left": "left", "right": "right"}
+
+# Shorter waits are folded into the next inter-operation delay rather than issued as their own sleep
+_MIN_SLEEP_SECONDS = 0.005
+
+# Option defaults for drag() and scroll(), merged with the caller's options once per call
+_DRAG_DEFAULTS = {"capture_before": False, "capture_after": False, "delay_after_ms": 300}
+_SCROLL_DEFAULTS = {"delay_after_ms": 200}
+
+# Failure result for drag/scroll/hover; RPC errors report their status code name instead of str(e)
+_ERR_TMPL = {"success": False, "message": "", "execution_time_ms": 0}
+
+# Template image bytes keyed by path, with (mtime_ns, size) to detect edits on disk
+_IMAGE_CACHE: Dict[str, Tuple[int, int, bytes]] = {}
+_IMAGE_CACHE_MAX_ENTRIES = 32
+
+
+def _read_image_bytes(image_path: Union[str, Path]) -> Optional[bytes]:
+    """
+    Return the bytes of an image file, reusing a cached copy while the file is unchanged.
+
+    Returns None if the file does not exist.
+    """
+    key = os.fspath(image_path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return None
+
+    cached = _IMAGE_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    with open(key, "rb") as f:
+        data = f.read()
+    if key not in _IMAGE_CACHE and len(_IMAGE_CACHE) >= _IMAGE_CACHE_MAX_ENTRIES:
+        del _IMAGE_CACHE[next(iter(_IMAGE_CACHE))]
+    _IMAGE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_pattern_path(pattern_name: str, patterns_dir: str, artifacts_dir: str) -> str:
+    """
+    Absolute path of a pattern image; relative pattern dirs live under the artifacts directory.
+
+    artifacts_dir is passed in (rather than read here) so it is part of the cache key.
+    """
+    patterns_path = Path(patterns_dir)
+    if not patterns_path.is_absolute():
+        patterns_path = Path(artifacts_dir) / patterns_path
+    return str(patterns_path / f"{pattern_name}.png")
+
+
+# Pattern files already seen on disk. Only positive results are remembered: a file removed
+# later is still reported as missing by click_image()/find_image() when they read it.
+_KNOWN_PATTERN_FILES = set()
+
+
+def _pattern_file_exists(pattern_file: str) -> bool:
+    if pattern_file in _KNOWN_PATTERN_FILES:
+        return True
+    if os.path.exists(pattern_file):
+        _KNOWN_PATTERN_FILES.add(pattern_file)
+        return True
+    return False
+
+
+def _compact_ops(operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fold standalone {"action": "delay"} entries into the preceding operation's delay_after_operation
+    and expand run-length encoded operations ({"repeat": n}) into n consecutive operations.
+
+    Delays before the first operation are folded forward into its delay_before_operation instead,
+    since batch requests have no builder for "delay". The caller's dicts are never modified; a
+    merged or expanded operation is a copy. Only a list made up entirely of delays is returned
+    with its delays as is.
+    """
+    if not any(op.get("action") == "delay" or "repeat" in op for op in operations):
+        return operations
+
+    compacted = []
+    leading_delay_ms = 0
+    for op in operations:
+        if op.get("action") == "delay":
+            if compacted:
+                prev = compacted[-1] = dict(compacted[-1])
+                prev["delay_after_operation"] = prev.get("delay_after_operation", 0) + op.get("duration_ms", 0)
+            else:
+                leading_delay_ms += op.get("duration_ms", 0)
+            continue
+
+        if "repeat" in op:
+            single = {key: value for key, value in op.items() if key != "repeat"}
+            compacted.extend([single] * op["repeat"])
+        else:
+            compacted.append(op)
+        if leading_delay_ms:
+            first = compacted[0] = dict(compacted[0])
+            first["delay_before_operation"] = first.get("delay_before_operation", 0) + leading_delay_ms
+            leading_delay_ms = 0
+
+    # Nothing to fold into; individual mode still runs these through _do_delay
+    return compacted or list(operations)
+
+
+class ScreenshotResult(dict):
+    """
+    Screenshot result dict whose image bytes can be read back from "file_path" on demand.
+
+    keys(), len(), dict(result) and json.dumps() only see "screenshot_data" when it was kept
+    in memory, but result["screenshot_data"] and result.get("screenshot_data") fall back to
+    load_screenshot_data() without storing the bytes. Callers that only check
+    success/file_path/screenshot_size never keep the image bytes alive.
+    """
+
+    def __missing__(self, key):
+        if key != "screenshot_data":
+            raise KeyError(key)
+        return self.load_screenshot_data()
+
+    def get(self, key, default=None):
+        if key == "screenshot_data" and not dict.__contains__(self, key):
+            return self.load_screenshot_data()
+        return dict.get(self, key, default)
+
+    def load_screenshot_data(self) -> bytes:
+        """Return the kept image bytes, or read them from "file_path" (b"" if neither exists)."""
+        data = dict.get(self, "screenshot_data")
+        if data is not None:
+            return data
+        file_path = dict.get(self, "file_path")
+        if not file_path:
+            return b""
+        try:
+            with open(file_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return b""
+
+
+@dataclass(slots=True)
+class OpResult:
+    """
+    Result of one operation inside a batch response.
+
+    Public methods return it converted with asdict(), so callers always get a plain dict
+    that supports item assignment and json.dumps().
+    """
+    success: bool
+    message: str
+    location: Optional[Tuple[int, int]]
+    execution_time_ms: int
+
+
+# AppleScript sources for window management. Arguments are passed through argv so the
+# source is constant and can be compiled once with osacompile and reused.
+_POSITION_WINDOW_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    set winX to (item 2 of argv) as integer
+    set winY to (item 3 of argv) as integer
+    tell application "System Events"
+        set targetApps to every application process whose name contains appName
+        if (count of targetApps) > 0 then
+            tell item 1 of targetApps
+                set frontmost to true
+                delay 0.5
+                try
+                    set position of front window to {winX, winY}
+                    return "Success: Positioned window at (" & winX & "," & winY & ")"
+                on error errMsg
+                    return "Error: " & errMsg
+                end try
+            end tell
+        else
+            return "Error: No applications found containing '" & appName & "'"
+        end if
+    end tell
+end run
+'''
+
+_POSITION_AND_RESIZE_WINDOW_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    set winX to (item 2 of argv) as integer
+    set winY to (item 3 of argv) as integer
+    set winWidth to (item 4 of argv) as integer
+    set winHeight to (item 5 of argv) as integer
+    tell application "System Events"
+        set targetApps to every application process whose name contains appName
+        if (count of targetApps) > 0 then
+            tell item 1 of targetApps
+                set frontmost to true
+                delay 0.5
+                try
+                    set position of front window to {winX, winY}
+                    set size of front window to {winWidth, winHeight}
+                    return "Success: Positioned window at (" & winX & "," & winY & ") and resized to " & winWidth & "x" & winHeight
+                on error errMsg
+                    return "Error: " & errMsg
+                end try
+            end tell
+        else
+            return "Error: No applications found containing '" & appName & "'"
+        end if
+    end tell
+end run
+'''
+
+_BRING_APP_TO_FRONT_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    tell application "System Events"
+        set targetApps to every application process whose name contains appName
+        if (count of targetApps) > 0 then
+            set frontmost of item 1 of targetApps to true
+            return "Success: Brought " & appName & " to front"
+        else
+            return "Error: No applications found containing '" & appName & "'"
+        end if
+    end tell
+end run
+'''
+
+_GET_WINDOW_INFO_SCRIPT = '''
+on run argv
+    set appName to item 1 of argv
+    tell application "System Events"
+        set targetApps to every application process whose name contains appName
+        if (count of targetApps) > 0 then
+            tell item 1 of targetApps
+                try
+                    set frontWindow to front window
+                    set windowTitle to title of frontWindow
+                    set windowPosition to position of frontWindow
+                    set windowSize to size of frontWindow
+                    set windowX to item 1 of windowPosition
+                    set windowY to item 2 of windowPosition
+                    set windowWidth to item 1 of windowSize
+                    set windowHeight to item 2 of windowSize
+
+                    return "Success|" & windowTitle & "|" & windowX & "|" & windowY & "|" & windowWidth & "|" & windowHeight
+                on error errMsg
+                    return "Error: " & errMsg
+                end try
+            end tell
+        else
+            return "Error: No applications found containing '" & appName & "'"
+        end if
+    end tell
+end run
+'''
+
+_CLICK_AND_TYPE_SCRIPT = '''
+on clearField()
+    tell application "System Events"
+        key code 0 using command down -- Cmd+A
+        delay 0.1
+    end tell
+end clearField
+
+on run argv
+    set clickX to (item 1 of argv) as integer
+    set clickY to (item 2 of argv) as integer
+    set delaySeconds to (item 3 of argv) as real
+    set clearFirst to (item 4 of argv) is "1"
+    set textToType to item 5 of argv
+    tell application "System Events"
+        -- Click at coordinates
+        click at {clickX, clickY}
+        delay delaySeconds
+
+        if clearFirst then my clearField()
+
+        -- Type the text
+        keystroke textToType
+
+        return "Success: Clicked at (" & clickX & "," & clickY & ") and typed text"
+    end tell
+end run
+'''
+
+
+def _applescript_escape(value: str) -> str:
+    """
+    Escape text for use inside an AppleScript string literal.
+
+    Line breaks become '" & return & "' so the literal stays on one line, which the
+    line-oriented "osascript -i" session requires.
+    """
+    value = value.replace("\\", "\\\\").replace('"', '\\"')
+    if "\n" in value or "\r" in value:
+        value = value.replace("\r\n", "\n").replace("\r", "\n").replace("\n", '" & return & "')
+    return value
+
+
+class _AppleScriptRunner:
+    """
+    Long-lived "osascript -i" child that runs compiled scripts without a fork/exec per call.
+
+    Each call sends one line, 'run script (POSIX file "...") with parameters {...}', followed by
+    a sentinel string literal, and reads stdout until the sentinel is echoed back.
+    """
+
+    _SENTINEL = "__END__"
+    # Closes the parameter list and appends the sentinel line
+    _SUFFIX = '}\n"' + _SENTINEL + '"\n'
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        # 'run script ... with parameters {' per compiled script path; only the arguments vary per call
+        self._prefixes: Dict[str, str] = {}
+
+    def _start(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        return self._proc
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return '"' + _applescript_escape(value) + '"'
+
+    @staticmethod
+    def _unquote(value: str) -> str:
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        return value
+
+    def run(self, script_path: str, args: List[str], timeout: float = 10) -> str:
+        """
+        Run a compiled script with string arguments and return its result as text.
+        """
+        prefix = self._prefixes.get(script_path)
+        if prefix is None:
+            prefix = self._prefixes[script_path] = (
+                "run script (POSIX file " + self._quote(script_path) + ") with parameters {"
+            )
+        command = "".join((prefix, ", ".join(map(self._quote, args)), self._SUFFIX))
+
+        with self._lock:
+            proc = self._start()
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            try:
+                proc.stdin.write(command)
+                proc.stdin.flush()
+
+                result = ""
+                while True:
+                    output = proc.stdout.readline()
+                    if not output:
+                        self._proc = None
+                        raise subprocess.TimeoutExpired(["osascript", "-i"], timeout)
+                    # Interactive mode prefixes prompts with ">> " and results with "=> "
+                    output = output.rstrip("\n")
+                    while output.startswith((">> ", "=> ")):
+                        output = output[3:]
+                    if self._SENTINEL in output:
+                        return self._unquote(result).strip()
+                    if output:
+                        result = output
+            except (OSError, ValueError):
+                self._proc = None
+                raise
+            finally:
+                timer.cancel()
+
+    def close(self):
+        """Terminate the osascript child, if running."""
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.terminate()
+            self._proc = None
+
+
 class GuiAutomationServiceClient:
     """
     Enhanced GUI Automation Service Client combining production patterns with comprehensive features.
@@ -99,6 +525,10 @@ class GuiAutomationServiceClient:
         result = client.click_image("/path/to/button.png", confidence=0.9)
     """
 
+    # Fixed attribute set: smaller instances and faster attribute access on the hot path
+    __slots__ = ("client_name", "logger", "stub", "async_stub", "_async_channel", "_async_loop",
+                 "_connected", "_ss_dir", "_ss_auto_dir")
+
     def __init__(self, client_name: str = "user", logger: Optional[object] = None):
         """
         Initialize the Enhanced GUI Automation Service Client.
@@ -110,7 +540,13 @@ class GuiAutomationServiceClient:
         self.client_name = client_name
         self.logger = logger or get_logger(f"GuiAutomationServiceClient[{client_name}]")
         self.stub = None
+        self.async_stub = None
+        # grpc.aio channel behind async_stub and the event loop it was created on
+        self._async_channel = None
+        self._async_loop = None
         self._connected = False
+        self._ss_dir: Optional[str] = None
+        self._ss_auto_dir: Optional[str] = None
 
         if not PROTOBUF_AVAILABLE:
             self.logger.warning("GUI Automation protobuf modules not available. Some features may be limited.")
@@ -130,6 +566,7 @@ class GuiAutomationServiceClient:
                 )
                 self.logger.info(f"GUI Automation Service connected for client '{self.client_name}'")
                 self._connected = True
+                self._prepare_screenshot_dirs()
                 return
             else:
                 raise RuntimeError("GUI Automation protobuf modules not available")
@@ -150,6 +587,7 @@ class GuiAutomationServiceClient:
                         self.stub = Mock()
                     self.logger.info(f"Mock GUI Automation Service connected for client '{self.client_name}'")
                     self._connected = True
+                    self._prepare_screenshot_dirs()
                     return
                 else:
                     raise e
@@ -159,20 +597,34 @@ class GuiAutomationServiceClient:
             self.logger.error(f"Failed to connect GUI Automation Service: {e}")
             raise RuntimeError(f"GUI Automation Service connection failed: {e}")
 
+    def _prepare_screenshot_dirs(self) -> None:
+        """Create the screenshot directories once so captures don't re-stat them on every call."""
+        self._ss_dir = os.path.join(LoggerConfig.ARTIFACTS_DIR, "screenshots")
+        self._ss_auto_dir = os.path.join(self._ss_dir, "auto")
+        os.makedirs(self._ss_auto_dir, exist_ok=True)
+
     def is_connected(self) -> bool:
         """Check if the service is connected."""
         return self._connected and self.stub is not None
 
     def _ensure_connected(self):
-        """Ensure the service is connected, attempt reconnection if needed."""
-        if not self.is_connected():
-            self.logger.warning(
-                f"GUI Automation Service not connected for client '{self.client_name}', attempting to reconnect..."
-            )
-            try:
-                self.connect()
-            except Exception as e:
-                raise RuntimeError(f"GUI Automation Service connection failed: {e}")
+        """
+        Ensure the service is connected, attempt reconnection if needed.
+
+        Callers test self._connected inline first, so this is only called when a reconnect is due.
+        """
+        # connect() sets the flag only once a stub exists and disconnect() clears both,
+        # so the flag alone is enough on the fast path.
+        if self._connected:
+            return
+
+        self.logger.warning(
+            f"GUI Automation Service not connected for client '{self.client_name}', attempting to reconnect..."
+        )
+        try:
+            self.connect()
+        except Exception as e:
+            raise RuntimeError(f"GUI Automation Service connection failed: {e}")
 
     # =============================================================================
     # Enhanced Basic GUI Operations (Production + New Features)
@@ -196,49 +648,68 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, location, and execution time
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        return self._click_coordinates_unchecked(
+            x, y, target_user, delay_after_ms, capture_after, max_retries, retry_delay_ms
+        )
 
+    def _click_coordinates_unchecked(self, x: int, y: int, target_user: str = "",
+                                    delay_after_ms: int = 300, capture_after: bool = False,
+                                    max_retries: int = 1, retry_delay_ms: int = 500) -> Dict[str, Any]:
+        """click_coordinates() without the connection check, for callers that already made it."""
         try:
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.CLICK
-                ),
-                target=gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.COORDINATES,
-                    coordinates=gui_automation_service_pb2.GuiLocation(x=x, y=y)
-                ),
-                target_user=target_user,
-                options=gui_automation_service_pb2.GuiOptions(
-                    delay_after_ms=delay_after_ms,
-                    capture_after=capture_after,
-                    max_retries=max_retries,
-                    retry_delay_ms=retry_delay_ms
-                )
+            request = self._make_click_request(
+                x, y, target_user, delay_after_ms, capture_after, max_retries, retry_delay_ms
             )
-
             response = self.stub.PerformAction(request)
-
-            result = {
-                "success": response.success,
-                "message": response.message,
-                "location": (response.result_location.x, response.result_location.y),
-                "execution_time_ms": response.execution_time_ms
-            }
-
-            if capture_after and response.screenshot_data:
-                result["screenshot_data"] = response.screenshot_data
-                result["screenshot_size"] = len(response.screenshot_data)
-
-            self.logger.info(f"Click at ({x}, {y}): {response.success} - {response.message}")
-            return result
+            return self._click_result(response, x, y, capture_after)
 
         except Exception as e:
             self.logger.error(f"Click coordinates failed: {e}")
             return {"success": False, "message": str(e), "location": (0, 0), "execution_time_ms": 0}
 
+    @staticmethod
+    def _make_click_request(x: int, y: int, target_user: str = "", delay_after_ms: int = 300,
+                            capture_after: bool = False, max_retries: int = 1,
+                            retry_delay_ms: int = 500) -> object:
+        """Build a coordinate click request; shared by the sync and async click paths."""
+        return _GuiRequest(
+            action=_GuiAction(type=_CLICK),
+            target=_GuiTarget(
+                type=_COORDS,
+                coordinates=_GuiLoc(x=x, y=y)
+            ),
+            target_user=target_user,
+            options=_GuiOpts(
+                delay_after_ms=delay_after_ms,
+                capture_after=capture_after,
+                max_retries=max_retries,
+                retry_delay_ms=retry_delay_ms
+            )
+        )
+
+    def _click_result(self, response: object, x: int, y: int, capture_after: bool) -> Dict[str, Any]:
+        """Convert a click response to the result dict returned by click_coordinates()."""
+        result = {
+            "success": response.success,
+            "message": response.message,
+            "location": (response.result_location.x, response.result_location.y),
+            "execution_time_ms": response.execution_time_ms
+        }
+
+        if capture_after and response.screenshot_data:
+            result["screenshot_data"] = response.screenshot_data
+            result["screenshot_size"] = len(response.screenshot_data)
+
+        self.logger.info("Click at (%s, %s): %s - %s", x, y, response.success, response.message)
+        return result
+
     def double_click_coordinates(self, x: int, y: int, target_user: str = "",
                                delay_after_ms: int = 300) -> Dict[str, Any]:
         """Enhanced double-click with the same error handling pattern."""
+        if not self._connected:
+            self._ensure_connected()
         return self._perform_coordinate_action(
             gui_automation_service_pb2.DOUBLE_CLICK, x, y, target_user, delay_after_ms
         )
@@ -246,15 +717,15 @@ class GuiAutomationServiceClient:
     def right_click_coordinates(self, x: int, y: int, target_user: str = "",
                               delay_after_ms: int = 300) -> Dict[str, Any]:
         """Enhanced right-click with the same error handling pattern."""
+        if not self._connected:
+            self._ensure_connected()
         return self._perform_coordinate_action(
             gui_automation_service_pb2.RIGHT_CLICK, x, y, target_user, delay_after_ms
         )
 
     def _perform_coordinate_action(self, action_type: int, x: int, y: int,
                                  target_user: str = "", delay_after_ms: int = 300) -> Dict[str, Any]:
-        """Helper method for coordinate-based actions with consistent error handling."""
-        self._ensure_connected()
-
+        """Helper method for coordinate-based actions with consistent error handling; callers check the connection."""
         try:
             request = gui_automation_service_pb2.GuiRequest(
                 action=gui_automation_service_pb2.GuiAction(type=action_type),
@@ -267,9 +738,10 @@ class GuiAutomationServiceClient:
             )
 
             response = self.stub.PerformAction(request)
-            action_name = gui_automation_service_pb2.ActionType.Name(action_type)
 
-            self.logger.info(f"{action_name} at ({x}, {y}): {response.success}")
+            if self.logger.isEnabledFor(logging.INFO):
+                action_name = gui_automation_service_pb2.ActionType.Name(action_type)
+                self.logger.info("%s at (%s, %s): %s", action_name, x, y, response.success)
             return {
                 "success": response.success,
                 "message": response.message,
@@ -300,16 +772,14 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, and execution time
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        return self._type_text_unchecked(text, target_user, delay_before_ms, clear_field)
 
+    def _type_text_unchecked(self, text: str, target_user: str = "", delay_before_ms: int = 100,
+                            clear_field: bool = False) -> Dict[str, Any]:
+        """type_text() without the connection check, for callers that already made it."""
         try:
-            # Clear field if requested
-            if clear_field:
-                clear_result = self.press_key("a", "command")  # Select all
-                if clear_result["success"]:
-                    time.sleep(0.1)
-                    self.press_key("51")  # Delete key
-
             request = gui_automation_service_pb2.GuiRequest(
                 action=gui_automation_service_pb2.GuiAction(
                     type=gui_automation_service_pb2.TYPE_TEXT,
@@ -323,9 +793,23 @@ class GuiAutomationServiceClient:
                 options=gui_automation_service_pb2.GuiOptions(delay_before_ms=delay_before_ms)
             )
 
-            response = self.stub.PerformAction(request)
+            if clear_field:
+                # Select all, delete and type in a single round-trip; the pause after
+                # select-all is applied server-side instead of sleeping here.
+                batch_request = gui_automation_service_pb2.GuiBatchRequest(
+                    operations=[
+                        self._build_key_press_request("a", "command", target_user, delay_after_ms=100),
+                        self._build_key_press_request("51", "", target_user),
+                        request
+                    ],
+                    target_user=target_user,
+                    stop_on_error=False
+                )
+                response = self.stub.PerformBatch(batch_request).operation_results[-1]
+            else:
+                response = self.stub.PerformAction(request)
 
-            self.logger.info(f"Type text '{text[:50]}...': {response.success}")
+            self.logger.info("Type text '%.50s...': %s", text, response.success)
             return {
                 "success": response.success,
                 "message": response.message,
@@ -336,6 +820,22 @@ class GuiAutomationServiceClient:
             self.logger.error(f"Type text failed: {e}")
             return {"success": False, "message": str(e), "execution_time_ms": 0}
 
+    def _build_key_press_request(self, key: str, modifiers: str, target_user: str,
+                                 delay_after_ms: int = 0) -> object:
+        """Build a KEY_PRESS request for use inside a batch."""
+        return gui_automation_service_pb2.GuiRequest(
+            action=gui_automation_service_pb2.GuiAction(
+                type=gui_automation_service_pb2.KEY_PRESS,
+                parameters={"key": key, "modifiers": modifiers}
+            ),
+            target=gui_automation_service_pb2.GuiTarget(
+                type=gui_automation_service_pb2.COORDINATES,
+                coordinates=gui_automation_service_pb2.GuiLocation(x=0, y=0)
+            ),
+            target_user=target_user,
+            options=gui_automation_service_pb2.GuiOptions(delay_after_ms=delay_after_ms)
+        )
+
     def press_key(self, key: str, modifiers: Union[str, List[str]] = "",
                  target_user: str = "") -> Dict[str, Any]:
         """
@@ -349,26 +849,18 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status and message
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        return self._press_key_unchecked(key, modifiers, target_user)
 
+    def _press_key_unchecked(self, key: str, modifiers: Union[str, List[str]] = "",
+                            target_user: str = "") -> Dict[str, Any]:
+        """press_key() without the connection check, for callers that already made it."""
         try:
-            # Handle both string and list modifiers
-            if isinstance(modifiers, list):
-                modifiers_str = " ".join(modifiers)
-            else:
-                modifiers_str = modifiers
-
-            # Map common key names to key codes
-            key_map = {
-                "Return": "36", "Enter": "36",
-                "Tab": "48",
-                "Escape": "53", "Esc": "53",
-                "Space": "49",
-                "Delete": "51", "Backspace": "51",
-                "Up": "126", "Down": "125", "Left": "123", "Right": "124"
-            }
+            # Handle both string and list modifiers (string is the common case)
+            modifiers_str = modifiers if isinstance(modifiers, str) else " ".join(modifiers)
 
-            actual_key = key_map.get(key, key)
+            actual_key = _KEY_MAP.get(key, key)
 
             request = gui_automation_service_pb2.GuiRequest(
                 action=gui_automation_service_pb2.GuiAction(
@@ -384,7 +876,7 @@ class GuiAutomationServiceClient:
 
             response = self.stub.PerformAction(request)
 
-            self.logger.info(f"Press key {key} ({modifiers_str}): {response.success}")
+            self.logger.info("Press key %s (%s): %s", key, modifiers_str, response.success)
             return {
                 "success": response.success,
                 "message": response.message,
@@ -421,17 +913,25 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, found location, and execution time
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        return self._click_image_unchecked(
+            image_path, confidence, search_region, target_user, delay_after_ms, capture_before,
+            capture_after, highlight_target, max_retries
+        )
 
+    def _click_image_unchecked(self, image_path: str, confidence: float = 0.8,
+                              search_region: Optional[Tuple[int, int, int, int]] = None,
+                              target_user: str = "", delay_after_ms: int = 300,
+                              capture_before: bool = False, capture_after: bool = False,
+                              highlight_target: bool = False, max_retries: int = 2) -> Dict[str, Any]:
+        """click_image() without the connection check, for callers that already made it."""
         try:
-            # Validate image path
             image_path = Path(image_path)
-            if not image_path.exists():
+            image_data = _read_image_bytes(image_path)
+            if image_data is None:
                 return {"success": False, "message": f"Image file not found: {image_path}"}
 
-            with open(image_path, "rb") as f:
-                image_data = f.read()
-
             # Build target with enhanced options
             target = gui_automation_service_pb2.GuiTarget(
                 type=gui_automation_service_pb2.IMAGE_MATCH,
@@ -472,10 +972,10 @@ class GuiAutomationServiceClient:
 
             if response.success:
                 result["location"] = (response.result_location.x, response.result_location.y)
-                self.logger.info(f"Click image '{image_path.name}': Found at {result['location']}")
+                self.logger.info("Click image '%s': Found at %s", image_path.name, result["location"])
             else:
                 result["location"] = None
-                self.logger.warning(f"Click image '{image_path.name}': {response.message}")
+                self.logger.warning("Click image '%s': %s", image_path.name, response.message)
 
             # Handle screenshots
             if response.screenshot_data:
@@ -510,16 +1010,15 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, and found location(s)
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
 
         try:
             image_path = Path(image_path)
-            if not image_path.exists():
+            image_data = _read_image_bytes(image_path)
+            if image_data is None:
                 return {"success": False, "message": f"Image file not found: {image_path}"}
 
-            with open(image_path, "rb") as f:
-                image_data = f.read()
-
             target = gui_automation_service_pb2.GuiTarget(
                 type=gui_automation_service_pb2.IMAGE_MATCH,
                 target_image=image_data,
@@ -551,14 +1050,14 @@ class GuiAutomationServiceClient:
 
             if response.success:
                 result["location"] = (response.result_location.x, response.result_location.y)
-                self.logger.info(f"Find image '{image_path.name}': Found at {result['location']}")
+                self.logger.info("Find image '%s': Found at %s", image_path.name, result["location"])
 
                 # Add additional match info if available
                 if response.result_data:
                     result["matches"] = dict(response.result_data)
             else:
                 result["location"] = None
-                self.logger.info(f"Find image '{image_path.name}': {response.message}")
+                self.logger.info("Find image '%s': %s", image_path.name, response.message)
 
             return result
 
@@ -572,7 +1071,7 @@ class GuiAutomationServiceClient:
 
     def take_screenshot(self, target_user: str = "", filename: str = "",
                        region: Optional[Tuple[int, int, int, int]] = None,
-                       auto_timestamp: bool = True) -> Dict[str, Any]:
+                       auto_timestamp: bool = True, include_data: bool = False) -> Dict[str, Any]:
         """
         Enhanced screenshot capture with automatic file management.
 
@@ -581,16 +1080,21 @@ class GuiAutomationServiceClient:
             filename: Name of the file to save (auto-generated if empty)
             region: Optional region to capture (x, y, width, height)
             auto_timestamp: Whether to add timestamp to filename
+            include_data: Keep the image bytes in the result as "screenshot_data". When False
+                (default) and the screenshot was saved, result["screenshot_data"] reads them back
+                from the file on each access.
 
         Returns:
-            Dict containing success status, message, screenshot data, and file path
+            ScreenshotResult containing success status, message, screenshot size, and file path
         """
-        self._ensure_connected()
-
-        # Setup screenshot directory
-        screenshot_dir = os.path.join(LoggerConfig.ARTIFACTS_DIR, "screenshots")
-        os.makedirs(screenshot_dir, exist_ok=True)
-
+        if not self._connected:
+            self._ensure_connected()
+        return self._take_screenshot_unchecked(target_user, filename, region, auto_timestamp, include_data)
+
+    def _take_screenshot_unchecked(self, target_user: str = "", filename: str = "",
+                                  region: Optional[Tuple[int, int, int, int]] = None,
+                                  auto_timestamp: bool = True, include_data: bool = False) -> Dict[str, Any]:
+        """take_screenshot() without the connection check, for callers that already made it."""
         # Generate filename if not provided
         if not filename:
             timestamp = int(time.time()) if auto_timestamp else ""
@@ -599,7 +1103,7 @@ class GuiAutomationServiceClient:
             name, ext = os.path.splitext(filename)
             filename = f"{name}_{int(time.time())}{ext}"
 
-        file_path = os.path.join(screenshot_dir, filename)
+        file_path = os.path.join(self._ss_dir, filename)
 
         try:
             # Build request for screenshot or region capture
@@ -626,39 +1130,38 @@ class GuiAutomationServiceClient:
             )
 
             response = self.stub.CaptureScreen(request)
+            screenshot_data = response.screenshot_data
 
-            result = {
-                "success": response.success,
-                "message": response.message,
-                "screenshot_data": response.screenshot_data,
-                "screenshot_size": len(response.screenshot_data)
-            }
+            result = ScreenshotResult(
+                success=response.success,
+                message=response.message,
+                screenshot_size=len(screenshot_data)
+            )
+            if include_data or not screenshot_data:
+                result["screenshot_data"] = screenshot_data
 
             # Save to file
-            if response.screenshot_data:
-                with open(file_path, 'wb') as f:
-                    f.write(response.screenshot_data)
+            if screenshot_data:
+                write_file_bytes(file_path, screenshot_data)
 
                 result["file_path"] = str(file_path)
-                region_str = f" (region {region})" if region else ""
-                self.logger.info(f"Screenshot saved to: {file_path}{region_str}")
+                if region:
+                    self.logger.info("Screenshot saved to: %s (region %s)", file_path, region)
+                else:
+                    self.logger.info("Screenshot saved to: %s", file_path)
 
             return result
 
         except Exception as e:
             self.logger.error(f"Take screenshot failed: {e}")
-            return {"success": False, "message": str(e), "screenshot_data": b"", "screenshot_size": 0}
+            return ScreenshotResult(success=False, message=str(e), screenshot_data=b"", screenshot_size=0)
 
     def _save_screenshot_automatically(self, screenshot_data: bytes, suggested_name: str) -> str:
         """Helper method to automatically save screenshots with proper naming."""
-        screenshot_dir = os.path.join(LoggerConfig.ARTIFACTS_DIR, "screenshots", "auto")
-        os.makedirs(screenshot_dir, exist_ok=True)
-
-        file_path = os.path.join(screenshot_dir, suggested_name)
-        with open(file_path, 'wb') as f:
-            f.write(screenshot_data)
+        file_path = os.path.join(self._ss_auto_dir, suggested_name)
+        write_file_bytes(file_path, screenshot_data)
 
-        self.logger.debug(f"Auto-saved screenshot: {file_path}")
+        self.logger.debug("Auto-saved screenshot: %s", file_path)
         return file_path
 
     # =============================================================================
@@ -682,159 +1185,296 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing overall success, operation count, and individual results
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        operations = _compact_ops(operations)
 
-        # Force individual operations if requested or if too many operations
-        if prefer_individual or not PROTOBUF_AVAILABLE or len(operations) > 10:
+        # Force individual operations if requested or if protobuf is unavailable
+        if prefer_individual or not PROTOBUF_AVAILABLE:
             return self._perform_individual_operations(operations, target_user, stop_on_error)
 
-        try:
-            # Build gRPC requests
-            gui_requests = []
-            for i, op in enumerate(operations):
-                request = self._build_request_from_operation(op, target_user)
-                if request:
-                    gui_requests.append(request)
-                else:
-                    self.logger.warning(f"Skipping invalid operation {i+1}: {op}")
+        # Large workflows go out as several PerformBatch calls rather than one RPC per operation
+        if len(operations) > self._MAX_BATCH_SIZE:
+            return self._perform_chunked_batches(operations, target_user, stop_on_error, timeout_seconds)
 
+        try:
+            gui_requests = self._build_requests(operations, target_user)
             if not gui_requests:
-                return {
-                    "overall_success": True,
-                    "successful_operations": 0,
-                    "failed_operations": 0,
-                    "operation_results": [],
-                    "message": "No valid operations to execute"
-                }
+                return self._empty_batch_result()
 
-            # Execute batch request
-            batch_request = gui_automation_service_pb2.GuiBatchRequest(
-                operations=gui_requests,
-                target_user=target_user,
-                stop_on_error=stop_on_error
-            )
+            return self._send_batch_requests(gui_requests, target_user, stop_on_error, timeout_seconds)
 
-            self.logger.info(f"Executing batch of {len(gui_requests)} operations...")
-            response = self.stub.PerformBatch(batch_request, timeout=timeout_seconds)
+        except Exception as e:
+            self.logger.warning("Batch operation failed, falling back to individual operations: %s", e)
+            return self._perform_individual_operations(operations, target_user, stop_on_error)
 
-            # Process results
-            result = {
-                "overall_success": response.overall_success,
-                "successful_operations": response.successful_operations,
-                "failed_operations": response.failed_operations,
-                "operation_results": []
-            }
+    # Largest number of operations sent in a single PerformBatch request
+    _MAX_BATCH_SIZE = 10
 
-            for op_response in response.operation_results:
-                op_result = {
-                    "success": op_response.success,
-                    "message": op_response.message,
-                    "location": (op_response.result_location.x, op_response.result_location.y),
-                    "execution_time_ms": op_response.execution_time_ms
-                }
-                result["operation_results"].append(op_result)
+    def _build_requests(self, operations: List[Dict[str, Any]], target_user: str) -> List[object]:
+        """Build gRPC requests for a batch, skipping operations that cannot be built."""
+        gui_requests = []
+        for i, op in enumerate(operations):
+            request = self._build_request_from_operation(op, target_user)
+            if request:
+                gui_requests.append(request)
+            else:
+                self.logger.warning("Skipping invalid operation %d: %s", i + 1, op)
+        return gui_requests
 
-            self.logger.info(
-                f"Batch completed: {response.successful_operations} successful, {response.failed_operations} failed"
-            )
-            return result
+    @staticmethod
+    def _empty_batch_result() -> Dict[str, Any]:
+        """Result for a batch in which no operation could be built."""
+        return {
+            "overall_success": True,
+            "successful_operations": 0,
+            "failed_operations": 0,
+            "operation_results": [],
+            "message": "No valid operations to execute"
+        }
+
+    def _send_batch_requests(self, gui_requests: List[object], target_user: str,
+                             stop_on_error: bool, timeout_seconds: int) -> Dict[str, Any]:
+        """
+        Send prepared requests in one PerformBatch call and convert the response to a result dict.
+        """
+        self.logger.info("Executing batch of %d operations...", len(gui_requests))
+        response = self.stub.PerformBatch(
+            self._make_batch_request(gui_requests, target_user, stop_on_error), timeout=timeout_seconds
+        )
+        return self._batch_result(response)
+
+    @staticmethod
+    def _make_batch_request(gui_requests: List[object], target_user: str, stop_on_error: bool) -> object:
+        """Wrap prepared requests in a GuiBatchRequest."""
+        return gui_automation_service_pb2.GuiBatchRequest(
+            operations=gui_requests,
+            target_user=target_user,
+            stop_on_error=stop_on_error
+        )
 
+    def _batch_result(self, response: object) -> Dict[str, Any]:
+        """Convert a PerformBatch response to the result dict returned by perform_batch_operations()."""
+        # result_location is fetched once per op for both coordinates
+        op_results = []
+        append_result = op_results.append
+        for op_response in response.operation_results:
+            loc = op_response.result_location
+            append_result(asdict(OpResult(
+                op_response.success,
+                op_response.message,
+                (loc.x, loc.y),
+                op_response.execution_time_ms
+            )))
+
+        self.logger.info(
+            "Batch completed: %d successful, %d failed", response.successful_operations, response.failed_operations
+        )
+        return {
+            "overall_success": response.overall_success,
+            "successful_operations": response.successful_operations,
+            "failed_operations": response.failed_operations,
+            "operation_results": op_results
+        }
+
+    def _perform_prepared_batch(self, gui_requests: List[object], operations: List[Dict[str, Any]],
+                                target_user: str = "", stop_on_error: bool = True,
+                                timeout_seconds: int = 60) -> Dict[str, Any]:
+        """
+        Send requests already built from operations, falling back to running operations individually.
+        """
+        if not self._connected:
+            self._ensure_connected()
+        if not gui_requests:
+            return self._empty_batch_result()
+
+        try:
+            return self._send_batch_requests(gui_requests, target_user, stop_on_error, timeout_seconds)
         except Exception as e:
-            self.logger.warning(f"Batch operation failed, falling back to individual operations: {e}")
+            self.logger.warning("Batch operation failed, falling back to individual operations: %s", e)
             return self._perform_individual_operations(operations, target_user, stop_on_error)
 
+    def _perform_chunked_batches(self, operations: List[Dict[str, Any]], target_user: str,
+                                 stop_on_error: bool, timeout_seconds: int) -> Dict[str, Any]:
+        """
+        Execute a large workflow as consecutive PerformBatch calls of at most _MAX_BATCH_SIZE operations.
+        """
+        return self._run_in_chunks(
+            len(operations),
+            lambda start, stop: self.perform_batch_operations(
+                operations[start:stop], target_user=target_user,
+                stop_on_error=stop_on_error, timeout_seconds=timeout_seconds
+            ),
+            stop_on_error
+        )
+
+    def _run_in_chunks(self, count: int, run_chunk, stop_on_error: bool) -> Dict[str, Any]:
+        """
+        Call run_chunk(start, stop) for each _MAX_BATCH_SIZE slice of count operations and merge the results.
+        """
+        successful_operations = 0
+        failed_operations = 0
+        operation_results = []
+
+        for start in range(0, count, self._MAX_BATCH_SIZE):
+            chunk_result = run_chunk(start, min(start + self._MAX_BATCH_SIZE, count))
+            successful_operations += chunk_result["successful_operations"]
+            failed_operations += chunk_result["failed_operations"]
+            operation_results.extend(chunk_result["operation_results"])
+
+            if stop_on_error and chunk_result["failed_operations"]:
+                self.logger.warning("Stopping after batch starting at operation %d due to stop_on_error=True", start + 1)
+                break
+
+        return {
+            "overall_success": failed_operations == 0,
+            "successful_operations": successful_operations,
+            "failed_operations": failed_operations,
+            "operation_results": operation_results,
+            "message": f"Batch operations completed: {successful_operations} successful, {failed_operations} failed"
+        }
+
+    def perform_batch_soa(self, action: str, xs: Sequence[int], ys: Sequence[int],
+                          delays: Optional[Sequence[int]] = None, target_user: str = "",
+                          stop_on_error: bool = True, timeout_seconds: int = 60) -> Dict[str, Any]:
+        """
+        Column-oriented batch for homogeneous coordinate clicks.
+
+        Takes parallel x, y and optional delay_after columns (lists, array.array or numpy int
+        arrays) instead of one dict per operation. The columns are validated once and each
+        request is filled straight from the cached prototype.
+
+        Args:
+            action: "click" or "double_click"
+            xs: X coordinates
+            ys: Y coordinates, same length as xs
+            delays: Optional delay_after values in milliseconds (default 300 each)
+            target_user: Target user for user agent routing
+            stop_on_error: Whether to stop on first error
+            timeout_seconds: Timeout for each PerformBatch call
+
+        Returns:
+            Dict in the same shape as perform_batch_operations()
+        """
+        if action not in ("click", "double_click"):
+            raise ValueError(f"perform_batch_soa supports 'click' and 'double_click', got: {action}")
+        count = len(xs)
+        if len(ys) != count or (delays is not None and len(delays) != count):
+            raise ValueError("xs, ys and delays must have the same length")
+
+        if not self._connected:
+            self._ensure_connected()
+
+        if not PROTOBUF_AVAILABLE:
+            return self._perform_individual_operations(
+                self._soa_operations(action, xs, ys, delays, 0, count), target_user, stop_on_error
+            )
+
+        def run_chunk(start: int, stop: int) -> Dict[str, Any]:
+            gui_requests = []
+            for i in range(start, stop):
+                request = self._copy_prototype(action, target_user)
+                coordinates = request.target.coordinates
+                coordinates.x = int(xs[i])
+                coordinates.y = int(ys[i])
+                request.options.delay_after_ms = 300 if delays is None else int(delays[i])
+                gui_requests.append(request)
+            try:
+                return self._send_batch_requests(gui_requests, target_user, stop_on_error, timeout_seconds)
+            except Exception as e:
+                self.logger.warning("Batch operation failed, falling back to individual operations: %s", e)
+                return self._perform_individual_operations(
+                    self._soa_operations(action, xs, ys, delays, start, stop), target_user, stop_on_error
+                )
+
+        return self._run_in_chunks(count, run_chunk, stop_on_error)
+
+    @staticmethod
+    def _soa_operations(action: str, xs: Sequence[int], ys: Sequence[int],
+                        delays: Optional[Sequence[int]], start: int, stop: int) -> List[Dict[str, Any]]:
+        """Expand rows start..stop of perform_batch_soa() columns into operation dicts for the individual path."""
+        return [
+            {
+                "action": action,
+                "x": int(xs[i]),
+                "y": int(ys[i]),
+                "delay_after": 300 if delays is None else int(delays[i])
+            }
+            for i in range(start, stop)
+        ]
+
     def _perform_individual_operations(self, operations: List[Dict[str, Any]],
                                      target_user: str = "", stop_on_error: bool = True) -> Dict[str, Any]:
         """
         Enhanced individual operation execution with progress tracking.
         """
-        self.logger.info(f"Executing {len(operations)} operations individually...")
+        if not self._connected:
+            self._ensure_connected()
+
+        total = len(operations)
+        self.logger.info("Executing %d operations individually...", total)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
         successful_operations = 0
         failed_operations = 0
-        operation_results = []
+        # Size is known up front; truncated below if stop_on_error ends the run early
+        operation_results = [None] * total
+        # Seconds slept past the last deadline (positive) or still owed from skipped short delays (negative)
+        sleep_carry = 0.0
 
         for i, op in enumerate(operations):
             try:
-                self.logger.debug(f"Executing operation {i+1}/{len(operations)}: {op.get('action', 'unknown')}")
-
                 action_type = op.get("action")
-                result = None
+                if debug_enabled:
+                    self.logger.debug("Executing operation %d/%d: %s", i + 1, total, action_type or "unknown")
+                handler = self._INDIVIDUAL_DISPATCH.get(action_type)
+
+                # Leading "delay" entries folded forward by _compact_ops
+                pre_delay_ms = op.get("delay_before_operation")
+                if pre_delay_ms:
+                    time.sleep(pre_delay_ms / 1000.0)
 
                 # Execute based on action type
-                if action_type == "click":
-                    result = self.click_coordinates(
-                        op["x"], op["y"],
-                        target_user=target_user,
-                        delay_after_ms=op.get("delay_after", 300)
-                    )
-                elif action_type == "double_click":
-                    result = self.double_click_coordinates(
-                        op["x"], op["y"],
-                        target_user=target_user,
-                        delay_after_ms=op.get("delay_after", 300)
-                    )
-                elif action_type == "type":
-                    result = self.type_text(
-                        op["text"],
-                        target_user=target_user,
-                        delay_before_ms=op.get("delay_before", 100),
-                        clear_field=op.get("clear_field", False)
-                    )
-                elif action_type == "key_press":
-                    result = self.press_key(
-                        op["key"],
-                        modifiers=op.get("modifiers", ""),
-                        target_user=target_user
-                    )
-                elif action_type == "click_text":
-                    result = self.click_text(
-                        op["text"],
-                        search_region=op.get("search_region"),
-                        target_user=target_user,
-                        delay_after_ms=op.get("delay_after", 300)
-                    )
-                elif action_type == "click_image":
-                    result = self.click_image(
-                        op["image_path"],
-                        confidence=op.get("confidence", 0.8),
-                        search_region=op.get("search_region"),
-                        target_user=target_user,
-                        delay_after_ms=op.get("delay_after", 300)
-                    )
-                elif action_type == "screenshot":
-                    result = self.take_screenshot(
-                        target_user=target_user,
-                        filename=op.get("filename", ""),
-                        region=op.get("region")
-                    )
+                if handler:
+                    result = handler(self, op, target_user)
                 else:
                     result = {"success": False, "message": f"Unknown action type: {action_type}"}
 
+                operation_results[i] = result or {"success": False, "message": "No result"}
+
                 # Track results
                 if result and result.get("success"):
                     successful_operations += 1
-                    self.logger.debug(f"Operation {i+1} succeeded: {result.get('message', 'OK')}")
+                    if debug_enabled:
+                        self.logger.debug("Operation %d succeeded: %s", i + 1, result.get("message", "OK"))
                 else:
                     failed_operations += 1
-                    self.logger.warning(f"Operation {i+1} failed: {result.get('message', 'Unknown error')}")
+                    self.logger.warning("Operation %d failed: %s", i + 1, operation_results[i].get("message", "Unknown error"))
                     if stop_on_error:
-                        self.logger.warning(f"Stopping at operation {i+1} due to stop_on_error=True")
+                        self.logger.warning("Stopping at operation %d due to stop_on_error=True", i + 1)
+                        del operation_results[i + 1:]
                         break
 
-                operation_results.append(result or {"success": False, "message": "No result"})
-
-                # Add inter-operation delay if specified
-                if op.get("delay_after_operation"):
-                    time.sleep(op["delay_after_operation"] / 1000.0)
+                # Add inter-operation delay if specified. Sleeping to a monotonic deadline lets
+                # oversleep and sub-threshold delays carry into the next delay instead of drifting.
+                delay_ms = op.get("delay_after_operation")
+                if delay_ms:
+                    deadline = time.monotonic() + delay_ms / 1000.0 - sleep_carry
+                    remaining = deadline - time.monotonic()
+                    if remaining >= _MIN_SLEEP_SECONDS:
+                        time.sleep(remaining)
+                        sleep_carry = time.monotonic() - deadline
+                    else:
+                        sleep_carry = -remaining
 
             except Exception as e:
-                self.logger.error(f"Operation {i+1} failed with exception: {e}")
+                self.logger.error("Operation %d failed with exception: %s", i + 1, e)
                 failed_operations += 1
-                operation_results.append({"success": False, "message": str(e)})
+                operation_results[i] = {"success": False, "message": str(e)}
 
                 if stop_on_error:
-                    self.logger.warning(f"Stopping at operation {i+1} due to exception and stop_on_error=True")
+                    self.logger.warning("Stopping at operation %d due to exception and stop_on_error=True", i + 1)
+                    del operation_results[i + 1:]
                     break
 
         return {
@@ -845,133 +1485,313 @@ class GuiAutomationServiceClient:
             "message": f"Individual operations completed: {successful_operations} successful, {failed_operations} failed"
         }
 
+    def _do_click(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "click" operation via _click_coordinates_unchecked()."""
+        return self._click_coordinates_unchecked(
+            op["x"], op["y"],
+            target_user=target_user,
+            delay_after_ms=op.get("delay_after", 300)
+        )
+
+    def _do_double_click(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "double_click" operation via _perform_coordinate_action()."""
+        return self._perform_coordinate_action(
+            _DOUBLE_CLICK, op["x"], op["y"],
+            target_user=target_user,
+            delay_after_ms=op.get("delay_after", 300)
+        )
+
+    def _do_type(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "type" operation via _type_text_unchecked()."""
+        return self._type_text_unchecked(
+            op["text"],
+            target_user=target_user,
+            delay_before_ms=op.get("delay_before", 100),
+            clear_field=op.get("clear_field", False)
+        )
+
+    def _do_key_press(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "key_press" operation via _press_key_unchecked()."""
+        return self._press_key_unchecked(
+            op["key"],
+            modifiers=op.get("modifiers", ""),
+            target_user=target_user
+        )
+
+    def _do_click_text(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "click_text" operation via _click_text_unchecked()."""
+        return self._click_text_unchecked(
+            op["text"],
+            search_region=op.get("search_region"),
+            target_user=target_user,
+            delay_after_ms=op.get("delay_after", 300)
+        )
+
+    def _do_click_image(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "click_image" operation via _click_image_unchecked()."""
+        return self._click_image_unchecked(
+            op["image_path"],
+            confidence=op.get("confidence", 0.8),
+            search_region=op.get("search_region"),
+            target_user=target_user,
+            delay_after_ms=op.get("delay_after", 300)
+        )
+
+    def _do_screenshot(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "screenshot" operation via _take_screenshot_unchecked()."""
+        return self._take_screenshot_unchecked(
+            target_user=target_user,
+            filename=op.get("filename", ""),
+            region=op.get("region")
+        )
+
+    def _do_drag(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "drag" operation via drag()."""
+        return self.drag(
+            op["from_x"], op["from_y"], op["to_x"], op["to_y"],
+            target_user=target_user,
+            duration_ms=op.get("duration_ms", 500),
+            delay_after_ms=op.get("delay_after", 300)
+        )
+
+    def _do_scroll(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "scroll" operation via scroll()."""
+        return self.scroll(
+            op["x"], op["y"],
+            direction=op.get("direction", "down"),
+            clicks=op.get("clicks", 3),
+            target_user=target_user,
+            delay_after_ms=op.get("delay_after", 200)
+        )
+
+    def _do_hover(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a "hover" operation via hover()."""
+        return self.hover(op["x"], op["y"], target_user=target_user, duration_ms=op.get("duration_ms", 1000))
+
+    def _do_delay(self, op: Dict[str, Any], target_user: str) -> Dict[str, Any]:
+        """Run a standalone "delay" operation (one that had no preceding operation to fold into)."""
+        duration_ms = op.get("duration_ms", 0)
+        time.sleep(duration_ms / 1000.0)
+        return {"success": True, "message": f"Waited {duration_ms}ms", "execution_time_ms": duration_ms}
+
+    # Individual-mode operation "action" -> handler. Handlers call the *_unchecked variants;
+    # _perform_individual_operations checks the connection once up front.
+    _INDIVIDUAL_DISPATCH = {
+        "click": _do_click,
+        "double_click": _do_double_click,
+        "type": _do_type,
+        "key_press": _do_key_press,
+        "click_text": _do_click_text,
+        "click_image": _do_click_image,
+        "screenshot": _do_screenshot,
+        "drag": _do_drag,
+        "scroll": _do_scroll,
+        "hover": _do_hover,
+        "delay": _do_delay,
+    }
+
     def _build_request_from_operation(self, operation: Dict[str, Any], target_user: str) -> Optional[object]:
         """Enhanced request builder with support for all operation types."""
-        action_type = operation.get("action")
+        # The dispatch lookup doubles as the validity check, so unknown actions exit before any proto work
+        builder = self._ACTION_BUILDERS.get(operation.get("action"))
+        if builder is None:
+            self.logger.warning("Unknown operation type for batch: %s", operation.get("action"))
+            return None
 
         try:
-            if action_type == "click":
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(type=gui_automation_service_pb2.CLICK),
-                    target=gui_automation_service_pb2.GuiTarget(
-                        type=gui_automation_service_pb2.COORDINATES,
-                        coordinates=gui_automation_service_pb2.GuiLocation(
-                            x=operation["x"], y=operation["y"]
-                        )
-                    ),
-                    target_user=target_user,
-                    options=gui_automation_service_pb2.GuiOptions(
-                        delay_before_ms=operation.get("delay_before", 0),
-                        delay_after_ms=operation.get("delay_after", 300),
-                        max_retries=operation.get("max_retries", 1)
-                    )
+            request = builder(self, operation, target_user)
+            # Folded "delay" entries run server-side around the action
+            if request is not None:
+                extra_delay_ms = operation.get("delay_after_operation")
+                if extra_delay_ms:
+                    request.options.delay_after_ms += extra_delay_ms
+                pre_delay_ms = operation.get("delay_before_operation")
+                if pre_delay_ms:
+                    request.options.delay_before_ms += pre_delay_ms
+            return request
+        except Exception as e:
+            self.logger.error("Failed to build request for operation %s: %s", operation.get("action"), e)
+            return None
+
+    # Prototype requests holding the constant fields of each coordinate-based action type.
+    # Callers copy them (see _copy_prototype), so a prototype is never mutated and needs no per-thread copy.
+    _request_prototypes: Dict[str, object] = {}
+
+    @classmethod
+    def _request_prototype(cls, action: str) -> object:
+        """Return the cached prototype request for a coordinate-based batch action."""
+        prototype = cls._request_prototypes.get(action)
+        if prototype is None:
+            if action == "click":
+                prototype = _GuiRequest(
+                    action=_GuiAction(type=_CLICK),
+                    target=_GuiTarget(type=_COORDS),
+                    options=_GuiOpts(max_retries=1)
                 )
-            elif action_type == "double_click":
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(type=gui_automation_service_pb2.DOUBLE_CLICK),
-                    target=gui_automation_service_pb2.GuiTarget(
-                        type=gui_automation_service_pb2.COORDINATES,
-                        coordinates=gui_automation_service_pb2.GuiLocation(
-                            x=operation["x"], y=operation["y"]
-                        )
-                    ),
-                    target_user=target_user,
-                    options=gui_automation_service_pb2.GuiOptions(
-                        delay_after_ms=operation.get("delay_after", 300)
-                    )
+            elif action == "double_click":
+                prototype = _GuiRequest(action=_GuiAction(type=_DOUBLE_CLICK), target=_GuiTarget(type=_COORDS))
+            elif action == "type":
+                prototype = _GuiRequest(
+                    action=_GuiAction(type=_TYPE_TEXT),
+                    target=_GuiTarget(type=_COORDS, coordinates=_GuiLoc(x=0, y=0))
                 )
-            elif action_type == "type":
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(
-                        type=gui_automation_service_pb2.TYPE_TEXT,
-                        parameters={"text": operation["text"]}
-                    ),
-                    target=gui_automation_service_pb2.GuiTarget(
-                        type=gui_automation_service_pb2.COORDINATES,
-                        coordinates=gui_automation_service_pb2.GuiLocation(x=0, y=0)
-                    ),
-                    target_user=target_user,
-                    options=gui_automation_service_pb2.GuiOptions(
-                        delay_before_ms=operation.get("delay_before", 100)
-                    )
+            elif action == "key_press":
+                prototype = _GuiRequest(
+                    action=_GuiAction(type=_KEY_PRESS),
+                    target=_GuiTarget(type=_COORDS, coordinates=_GuiLoc(x=0, y=0))
                 )
-            elif action_type == "key_press":
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(
-                        type=gui_automation_service_pb2.KEY_PRESS,
-                        parameters={
-                            "key": operation["key"],
-                            "modifiers": operation.get("modifiers", "")
-                        }
-                    ),
-                    target=gui_automation_service_pb2.GuiTarget(
-                        type=gui_automation_service_pb2.COORDINATES,
-                        coordinates=gui_automation_service_pb2.GuiLocation(x=0, y=0)
-                    ),
-                    target_user=target_user
+            elif action == "drag":
+                # Default options are baked in so _make_drag_request leaves them alone when unchanged
+                prototype = _GuiRequest(
+                    action=_GuiAction(type=_DRAG),
+                    target=_GuiTarget(type=_COORDS),
+                    options=_GuiOpts(delay_after_ms=_DRAG_DEFAULTS["delay_after_ms"])
                 )
-            elif action_type == "click_text":
-                target = gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.TEXT_MATCH,
-                    target_text=operation["text"]
+            elif action == "scroll":
+                prototype = _GuiRequest(
+                    action=_GuiAction(type=_SCROLL),
+                    target=_GuiTarget(type=_COORDS),
+                    options=_GuiOpts(delay_after_ms=_SCROLL_DEFAULTS["delay_after_ms"])
                 )
+            else:
+                prototype = _GuiRequest(action=_GuiAction(type=_HOVER), target=_GuiTarget(type=_COORDS))
+            cls._request_prototypes[action] = prototype
+        return prototype
+
+    def _copy_prototype(self, action: str, target_user: str) -> object:
+        """Copy a prototype request; one CopyFrom is cheaper than building the nested messages."""
+        request = _GuiRequest()
+        request.CopyFrom(self._request_prototype(action))
+        request.target_user = target_user
+        return request
+
+    def _build_click_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a coordinate click request from a batch operation."""
+        request = self._copy_prototype("click", target_user)
+        coordinates = request.target.coordinates
+        coordinates.x = operation["x"]
+        coordinates.y = operation["y"]
+        options = request.options
+        options.delay_before_ms = operation.get("delay_before", 0)
+        options.delay_after_ms = operation.get("delay_after", 300)
+        options.max_retries = operation.get("max_retries", 1)
+        return request
+
+    def _build_double_click_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a coordinate double-click request from a batch operation."""
+        request = self._copy_prototype("double_click", target_user)
+        coordinates = request.target.coordinates
+        coordinates.x = operation["x"]
+        coordinates.y = operation["y"]
+        request.options.delay_after_ms = operation.get("delay_after", 300)
+        return request
+
+    def _build_type_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a type-text request from a batch operation."""
+        request = self._copy_prototype("type", target_user)
+        request.action.parameters["text"] = operation["text"]
+        request.options.delay_before_ms = operation.get("delay_before", 100)
+        return request
+
+    def _build_key_press_operation_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a key-press request from a batch operation."""
+        request = self._copy_prototype("key_press", target_user)
+        parameters = request.action.parameters
+        parameters["key"] = operation["key"]
+        parameters["modifiers"] = operation.get("modifiers", "")
+        return request
+
+    def _build_click_text_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build an OCR text click request from a batch operation."""
+        target = _GuiTarget(
+            type=_TEXT_MATCH,
+            target_text=operation["text"]
+        )
 
-                # Add search region if specified
-                if operation.get("search_region"):
-                    x, y, w, h = operation["search_region"]
-                    target.search_region.CopyFrom(
-                        gui_automation_service_pb2.GuiLocation(x=x, y=y, width=w, height=h)
-                    )
+        # Add search region if specified
+        region = operation.get("search_region")
+        if region:
+            x, y, w, h = region
+            target.search_region.CopyFrom(
+                _GuiLoc(x=x, y=y, width=w, height=h)
+            )
 
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(type=gui_automation_service_pb2.CLICK),
-                    target=target,
-                    target_user=target_user,
-                    options=gui_automation_service_pb2.GuiOptions(
-                        delay_before_ms=operation.get("delay_before", 500),
-                        max_retries=operation.get("max_retries", 2)
-                    )
-                )
-            elif action_type == "click_image":
-                # Load image data
-                image_path = Path(operation["image_path"])
-                if not image_path.exists():
-                    self.logger.error(f"Image file not found: {image_path}")
-                    return None
+        return _GuiRequest(
+            action=_GuiAction(type=_CLICK),
+            target=target,
+            target_user=target_user,
+            options=_GuiOpts(
+                delay_before_ms=operation.get("delay_before", 500),
+                max_retries=operation.get("max_retries", 2)
+            )
+        )
 
-                with open(image_path, "rb") as f:
-                    image_data = f.read()
+    def _build_click_image_request(self, operation: Dict[str, Any], target_user: str) -> Optional[object]:
+        """Build an image-match click request from a batch operation."""
+        # Load image data
+        image_data = _read_image_bytes(operation["image_path"])
+        if image_data is None:
+            self.logger.error(f"Image file not found: {operation['image_path']}")
+            return None
 
-                target = gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.IMAGE_MATCH,
-                    target_image=image_data,
-                    confidence_threshold=operation.get("confidence", 0.8)
-                )
+        target = _GuiTarget(
+            type=_IMAGE_MATCH,
+            target_image=image_data,
+            confidence_threshold=operation.get("confidence", 0.8)
+        )
 
-                # Add search region if specified
-                if operation.get("search_region"):
-                    x, y, w, h = operation["search_region"]
-                    target.search_region.CopyFrom(
-                        gui_automation_service_pb2.GuiLocation(x=x, y=y, width=w, height=h)
-                    )
+        # Add search region if specified
+        region = operation.get("search_region")
+        if region:
+            x, y, w, h = region
+            target.search_region.CopyFrom(
+                _GuiLoc(x=x, y=y, width=w, height=h)
+            )
 
-                return gui_automation_service_pb2.GuiRequest(
-                    action=gui_automation_service_pb2.GuiAction(type=gui_automation_service_pb2.CLICK),
-                    target=target,
-                    target_user=target_user,
-                    options=gui_automation_service_pb2.GuiOptions(
-                        delay_after_ms=operation.get("delay_after", 300),
-                        max_retries=operation.get("max_retries", 2),
-                        capture_after=operation.get("capture_after", False)
-                    )
-                )
-            else:
-                self.logger.warning(f"Unknown operation type for batch: {action_type}")
-                return None
+        return _GuiRequest(
+            action=_GuiAction(type=_CLICK),
+            target=target,
+            target_user=target_user,
+            options=_GuiOpts(
+                delay_after_ms=operation.get("delay_after", 300),
+                max_retries=operation.get("max_retries", 2),
+                capture_after=operation.get("capture_after", False)
+            )
+        )
 
-        except Exception as e:
-            self.logger.error(f"Failed to build request for operation {action_type}: {e}")
-            return None
+    def _build_drag_operation_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a drag request from a batch operation."""
+        return self._make_drag_request(
+            operation["from_x"], operation["from_y"], operation["to_x"], operation["to_y"], target_user,
+            duration_ms=operation.get("duration_ms", 500),
+            delay_after_ms=operation.get("delay_after", 300)
+        )
+
+    def _build_scroll_operation_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a scroll request from a batch operation."""
+        return self._make_scroll_request(
+            operation["x"], operation["y"], operation.get("direction", "down"), operation.get("clicks", 3),
+            target_user, delay_after_ms=operation.get("delay_after", 200)
+        )
+
+    def _build_hover_operation_request(self, operation: Dict[str, Any], target_user: str) -> object:
+        """Build a hover request from a batch operation."""
+        return self._make_hover_request(
+            operation["x"], operation["y"], target_user, duration_ms=operation.get("duration_ms", 1000)
+        )
+
+    # Batch operation "action" -> request builder
+    _ACTION_BUILDERS = {
+        "click": _build_click_request,
+        "double_click": _build_double_click_request,
+        "type": _build_type_request,
+        "key_press": _build_key_press_operation_request,
+        "click_text": _build_click_text_request,
+        "click_image": _build_click_image_request,
+        "drag": _build_drag_operation_request,
+        "scroll": _build_scroll_operation_request,
+        "hover": _build_hover_operation_request,
+    }
 
     # =============================================================================
     # Enhanced Text-Based Operations with OCR
@@ -994,18 +1814,26 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, found location, and execution time
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
+        return self._click_text_unchecked(
+            text, search_region, target_user, delay_after_ms, case_sensitive, partial_match
+        )
 
+    def _click_text_unchecked(self, text: str, search_region: Optional[Tuple[int, int, int, int]] = None,
+                             target_user: str = "", delay_after_ms: int = 300,
+                             case_sensitive: bool = False, partial_match: bool = True) -> Dict[str, Any]:
+        """click_text() without the connection check, for callers that already made it."""
         try:
-            target = gui_automation_service_pb2.GuiTarget(
-                type=gui_automation_service_pb2.TEXT_MATCH,
+            target = _GuiTarget(
+                type=_TEXT_MATCH,
                 target_text=text
             )
 
             if search_region:
                 x, y, width, height = search_region
                 target.search_region.CopyFrom(
-                    gui_automation_service_pb2.GuiLocation(x=x, y=y, width=width, height=height)
+                    _GuiLoc(x=x, y=y, width=width, height=height)
                 )
 
             # Add text matching parameters
@@ -1015,14 +1843,14 @@ class GuiAutomationServiceClient:
             if partial_match:
                 parameters["partial_match"] = "true"
 
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.CLICK,
+            request = _GuiRequest(
+                action=_GuiAction(
+                    type=_CLICK,
                     parameters=parameters
                 ),
                 target=target,
                 target_user=target_user,
-                options=gui_automation_service_pb2.GuiOptions(
+                options=_GuiOpts(
                     delay_after_ms=delay_after_ms,
                     max_retries=2,
                     retry_delay_ms=1000
@@ -1064,18 +1892,19 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing success status, message, and found location(s)
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
 
         try:
-            target = gui_automation_service_pb2.GuiTarget(
-                type=gui_automation_service_pb2.TEXT_MATCH,
+            target = _GuiTarget(
+                type=_TEXT_MATCH,
                 target_text=text
             )
 
             if search_region:
                 x, y, width, height = search_region
                 target.search_region.CopyFrom(
-                    gui_automation_service_pb2.GuiLocation(x=x, y=y, width=width, height=height)
+                    _GuiLoc(x=x, y=y, width=width, height=height)
                 )
 
             # Add text matching parameters
@@ -1085,13 +1914,13 @@ class GuiAutomationServiceClient:
             if return_all_matches:
                 parameters["return_all"] = "true"
 
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.FIND_ELEMENT,
+            request = _GuiRequest(
+                action=_GuiAction(
+                    type=_FIND_ELEMENT,
                     parameters=parameters
                 ),
                 target=target,
-                options=gui_automation_service_pb2.GuiOptions(
+                options=_GuiOpts(
                     return_element_info=return_all_matches
                 )
             )
@@ -1116,13 +1945,69 @@ class GuiAutomationServiceClient:
 
             return result
 
-        except Exception as e:
-            self.logger.error(f"Find text failed: {e}")
-            return {"success": False, "message": str(e), "location": None}
+        except Exception as e:
+            self.logger.error(f"Find text failed: {e}")
+            return {"success": False, "message": str(e), "location": None}
+
+    # =============================================================================
+    # Enhanced Window Management and Positioning Operations
+    # =============================================================================
+
+    # Compiled .scpt paths keyed by source hash, shared by all client instances
+    _compiled_scripts: Dict[str, str] = {}
+
+    # Private directory created by this process for the compiled scripts, removed at exit
+    _compiled_scripts_dir: Optional[str] = None
+
+    # Persistent osascript session shared by all client instances
+    _applescript = _AppleScriptRunner()
+
+    @classmethod
+    def _compiled_applescript(cls, source: str) -> Optional[str]:
+        """
+        Compile an AppleScript source once with osacompile and return the .scpt path.
+
+        Scripts are compiled into a mkdtemp() directory owned by this process, so a file left in
+        the shared temp dir by another user or run is never executed.
+
+        Returns None when compilation fails so callers can fall back to "osascript -e".
+        """
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        path = cls._compiled_scripts.get(digest)
+        if path is not None:
+            return path
+
+        try:
+            if cls._compiled_scripts_dir is None:
+                cls._compiled_scripts_dir = tempfile.mkdtemp(prefix="_gui_scpt_")
+                atexit.register(shutil.rmtree, cls._compiled_scripts_dir, ignore_errors=True)
+            path = os.path.join(cls._compiled_scripts_dir, f"{digest}.scpt")
+            result = subprocess.run(
+                ["osacompile", "-o", path, "-e", source],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        cls._compiled_scripts[digest] = path
+        return path
 
-    # =============================================================================
-    # Enhanced Window Management and Positioning Operations
-    # =============================================================================
+    def _run_applescript(self, source: str, *args: Any, timeout: float = 10) -> str:
+        """
+        Run a parameterised AppleScript, passing args through argv, and return its stripped stdout.
+        """
+        argv = [str(arg) for arg in args]
+        compiled = self._compiled_applescript(source)
+        if compiled is not None:
+            return self._applescript.run(compiled, argv, timeout=timeout)
+        result = subprocess.run(
+            ["osascript", "-e", source, *argv], capture_output=True, text=True, timeout=timeout
+        )
+        return result.stdout.strip()
 
     def position_window(self, app_name: str = "Python", x: int = 100, y: int = 100, 
                        width: Optional[int] = None, height: Optional[int] = None) -> Dict[str, Any]:
@@ -1141,59 +2026,11 @@ class GuiAutomationServiceClient:
         """
         self.logger.info(f"Positioning {app_name} window at ({x}, {y})")
         
-        # Build AppleScript based on whether we're resizing
-        if width and height:
-            script = f'''
-            tell application "System Events"
-                set targetApps to every application process whose name contains "{app_name}"
-                if (count of targetApps) > 0 then
-                    tell item 1 of targetApps
-                        set frontmost to true
-                        delay 0.5
-                        try
-                            set position of front window to {{{x}, {y}}}
-                            set size of front window to {{{width}, {height}}}
-                            return "Success: Positioned window at ({x},{y}) and resized to {width}x{height}"
-                        on error errMsg
-                            return "Error: " & errMsg
-                        end try
-                    end tell
-                else
-                    return "Error: No applications found containing '{app_name}'"
-                end if
-            end tell
-            '''
-        else:
-            script = f'''
-            tell application "System Events"
-                set targetApps to every application process whose name contains "{app_name}"
-                if (count of targetApps) > 0 then
-                    tell item 1 of targetApps
-                        set frontmost to true
-                        delay 0.5
-                        try
-                            set position of front window to {{{x}, {y}}}
-                            return "Success: Positioned window at ({x},{y})"
-                        on error errMsg
-                            return "Error: " & errMsg
-                        end try
-                    end tell
-                else
-                    return "Error: No applications found containing '{app_name}'"
-                end if
-            end tell
-            '''
-        
         try:
-            import subprocess
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            message = result.stdout.strip()
+            if width and height:
+                message = self._run_applescript(_POSITION_AND_RESIZE_WINDOW_SCRIPT, app_name, x, y, width, height)
+            else:
+                message = self._run_applescript(_POSITION_WINDOW_SCRIPT, app_name, x, y)
             success = "Success" in message
             
             self.logger.info(f"Window positioning result: {message}")
@@ -1227,28 +2064,8 @@ class GuiAutomationServiceClient:
         """
         self.logger.info(f"Bringing {app_name} to front")
         
-        script = f'''
-        tell application "System Events"
-            set targetApps to every application process whose name contains "{app_name}"
-            if (count of targetApps) > 0 then
-                set frontmost of item 1 of targetApps to true
-                return "Success: Brought {app_name} to front"
-            else
-                return "Error: No applications found containing '{app_name}'"
-            end if
-        end tell
-        '''
-        
         try:
-            import subprocess
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            message = result.stdout.strip()
+            message = self._run_applescript(_BRING_APP_TO_FRONT_SCRIPT, app_name, timeout=5)
             success = "Success" in message
             
             self.logger.info(f"Bring to front result: {message}")
@@ -1284,38 +2101,10 @@ class GuiAutomationServiceClient:
         """
         self.logger.info(f"Click and type at ({x}, {y}): '{text[:20]}...'")
         
-        # Build AppleScript with optional field clearing
-        clear_commands = '''
-        -- Clear field first
-        key code 0 using command down -- Cmd+A
-        delay 0.1
-        ''' if clear_field else ''
-        
-        script = f'''
-        tell application "System Events"
-            -- Click at coordinates
-            click at {{{x}, {y}}}
-            delay {delay_ms / 1000.0}
-            
-            {clear_commands}
-            
-            -- Type the text
-            keystroke "{text}"
-            
-            return "Success: Clicked at ({x},{y}) and typed text"
-        end tell
-        '''
-        
         try:
-            import subprocess
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=10
+            message = self._run_applescript(
+                _CLICK_AND_TYPE_SCRIPT, x, y, delay_ms / 1000.0, int(bool(clear_field)), text
             )
-            
-            message = result.stdout.strip()
             success = "Success" in message
             
             if success:
@@ -1354,42 +2143,8 @@ class GuiAutomationServiceClient:
         """
         self.logger.info(f"Getting window info for {app_name}")
         
-        script = f'''
-        tell application "System Events"
-            set targetApps to every application process whose name contains "{app_name}"
-            if (count of targetApps) > 0 then
-                tell item 1 of targetApps
-                    try
-                        set frontWindow to front window
-                        set windowTitle to title of frontWindow
-                        set windowPosition to position of frontWindow
-                        set windowSize to size of frontWindow
-                        set windowX to item 1 of windowPosition
-                        set windowY to item 2 of windowPosition
-                        set windowWidth to item 1 of windowSize
-                        set windowHeight to item 2 of windowSize
-                        
-                        return "Success|" & windowTitle & "|" & windowX & "|" & windowY & "|" & windowWidth & "|" & windowHeight
-                    on error errMsg
-                        return "Error: " & errMsg
-                    end try
-                end tell
-            else
-                return "Error: No applications found containing '{app_name}'"
-            end if
-        end tell
-        '''
-        
         try:
-            import subprocess
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            message = result.stdout.strip()
+            message = self._run_applescript(_GET_WINDOW_INFO_SCRIPT, app_name, timeout=5)
             
             if message.startswith("Success|"):
                 # Parse the result
@@ -1436,6 +2191,61 @@ class GuiAutomationServiceClient:
     # New Advanced Operations (From New Implementation)
     # =============================================================================
 
+    def _perform_action(self, request: object) -> Dict[str, Any]:
+        """Send one prepared request through PerformAction and return the common result dict."""
+        response = self.stub.PerformAction(request)
+        return {
+            "success": response.success,
+            "message": response.message,
+            "execution_time_ms": response.execution_time_ms
+        }
+
+    def _make_drag_request(self, from_x: int, from_y: int, to_x: int, to_y: int, target_user: str,
+                           duration_ms: int = 500, capture_before: bool = False,
+                           capture_after: bool = False, delay_after_ms: int = 300) -> object:
+        """Build a drag request; shared by drag() and the batch builder."""
+        request = self._copy_prototype("drag", target_user)
+        coordinates = request.target.coordinates
+        coordinates.x = from_x
+        coordinates.y = from_y
+        parameters = request.action.parameters
+        parameters["to_x"] = str(to_x)
+        parameters["to_y"] = str(to_y)
+        parameters["duration_ms"] = str(duration_ms)
+        if capture_before or capture_after or delay_after_ms != _DRAG_DEFAULTS["delay_after_ms"]:
+            options = request.options
+            options.capture_before = capture_before
+            options.capture_after = capture_after
+            options.delay_after_ms = delay_after_ms
+        return request
+
+    def _make_scroll_request(self, x: int, y: int, direction: str, clicks: int, target_user: str,
+                             delay_after_ms: int = 200) -> object:
+        """Build a scroll request; shared by scroll() and the batch builder."""
+        wire_direction = _SCROLL_DIRECTIONS.get(direction) or _SCROLL_DIRECTIONS.get(direction.lower())
+        if wire_direction is None:
+            raise ValueError(f"Invalid scroll direction: {direction!r} (expected up, down, left or right)")
+
+        request = self._copy_prototype("scroll", target_user)
+        coordinates = request.target.coordinates
+        coordinates.x = x
+        coordinates.y = y
+        parameters = request.action.parameters
+        parameters["direction"] = wire_direction
+        parameters["clicks"] = str(clicks)
+        if delay_after_ms != _SCROLL_DEFAULTS["delay_after_ms"]:
+            request.options.delay_after_ms = delay_after_ms
+        return request
+
+    def _make_hover_request(self, x: int, y: int, target_user: str, duration_ms: int = 1000) -> object:
+        """Build a hover request; shared by hover() and the batch builder."""
+        request = self._copy_prototype("hover", target_user)
+        coordinates = request.target.coordinates
+        coordinates.x = x
+        coordinates.y = y
+        request.action.parameters["duration_ms"] = str(duration_ms)
+        return request
+
     def drag(self, from_x: int, from_y: int, to_x: int, to_y: int,
             target_user: str = "", duration_ms: int = 500, **options) -> Dict[str, Any]:
         """
@@ -1453,48 +2263,31 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing operation result
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
 
         try:
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.DRAG,
-                    parameters={
-                        "to_x": str(to_x),
-                        "to_y": str(to_y),
-                        "duration_ms": str(duration_ms)
-                    }
-                ),
-                target=gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.COORDINATES,
-                    coordinates=gui_automation_service_pb2.GuiLocation(x=from_x, y=from_y)
-                ),
-                target_user=target_user,
-                options=gui_automation_service_pb2.GuiOptions(
-                    capture_before=options.get('capture_before', False),
-                    capture_after=options.get('capture_after', False),
-                    delay_after_ms=options.get('delay_after_ms', 300)
-                )
-            )
-
-            response = self.stub.PerformAction(request)
-
-            result = {
-                "success": response.success,
-                "message": response.message,
-                "execution_time_ms": response.execution_time_ms
-            }
-
-            if response.success:
-                self.logger.info(f"Drag from ({from_x}, {from_y}) to ({to_x}, {to_y}): Success")
+            opts = _DRAG_DEFAULTS | options
+            result = self._perform_action(self._make_drag_request(
+                from_x, from_y, to_x, to_y, target_user, duration_ms,
+                capture_before=opts["capture_before"],
+                capture_after=opts["capture_after"],
+                delay_after_ms=opts["delay_after_ms"]
+            ))
+
+            if result["success"]:
+                self.logger.info("Drag from (%s, %s) to (%s, %s): Success", from_x, from_y, to_x, to_y)
             else:
-                self.logger.warning(f"Drag operation failed: {response.message}")
+                self.logger.warning("Drag operation failed: %s", result["message"])
 
             return result
 
+        except grpc.RpcError as e:
+            self.logger.error("Drag operation failed: %s", e.code().name)
+            return {**_ERR_TMPL, "message": e.code().name}
         except Exception as e:
-            self.logger.error(f"Drag operation failed: {e}")
-            return {"success": False, "message": str(e), "execution_time_ms": 0}
+            self.logger.error("Drag operation failed: %s", e)
+            return {**_ERR_TMPL, "message": str(e)}
 
     def scroll(self, x: int, y: int, direction: str = "down", clicks: int = 3,
               target_user: str = "", **options) -> Dict[str, Any]:
@@ -1512,45 +2305,28 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing operation result
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
 
         try:
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.SCROLL,
-                    parameters={
-                        "direction": direction,
-                        "clicks": str(clicks)
-                    }
-                ),
-                target=gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.COORDINATES,
-                    coordinates=gui_automation_service_pb2.GuiLocation(x=x, y=y)
-                ),
-                target_user=target_user,
-                options=gui_automation_service_pb2.GuiOptions(
-                    delay_after_ms=options.get('delay_after_ms', 200)
-                )
-            )
-
-            response = self.stub.PerformAction(request)
-
-            result = {
-                "success": response.success,
-                "message": response.message,
-                "execution_time_ms": response.execution_time_ms
-            }
+            opts = _SCROLL_DEFAULTS | options
+            result = self._perform_action(self._make_scroll_request(
+                x, y, direction, clicks, target_user, delay_after_ms=opts["delay_after_ms"]
+            ))
 
-            if response.success:
-                self.logger.info(f"Scroll {direction} {clicks} clicks at ({x}, {y}): Success")
+            if result["success"]:
+                self.logger.info("Scroll %s %s clicks at (%s, %s): Success", direction, clicks, x, y)
             else:
-                self.logger.warning(f"Scroll operation failed: {response.message}")
+                self.logger.warning("Scroll operation failed: %s", result["message"])
 
             return result
 
+        except grpc.RpcError as e:
+            self.logger.error("Scroll operation failed: %s", e.code().name)
+            return {**_ERR_TMPL, "message": e.code().name}
         except Exception as e:
-            self.logger.error(f"Scroll operation failed: {e}")
-            return {"success": False, "message": str(e), "execution_time_ms": 0}
+            self.logger.error("Scroll operation failed: %s", e)
+            return {**_ERR_TMPL, "message": str(e)}
 
     def hover(self, x: int, y: int, target_user: str = "", duration_ms: int = 1000) -> Dict[str, Any]:
         """
@@ -1565,39 +2341,25 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing operation result
         """
-        self._ensure_connected()
+        if not self._connected:
+            self._ensure_connected()
 
         try:
-            request = gui_automation_service_pb2.GuiRequest(
-                action=gui_automation_service_pb2.GuiAction(
-                    type=gui_automation_service_pb2.HOVER,
-                    parameters={"duration_ms": str(duration_ms)}
-                ),
-                target=gui_automation_service_pb2.GuiTarget(
-                    type=gui_automation_service_pb2.COORDINATES,
-                    coordinates=gui_automation_service_pb2.GuiLocation(x=x, y=y)
-                ),
-                target_user=target_user
-            )
-
-            response = self.stub.PerformAction(request)
-
-            result = {
-                "success": response.success,
-                "message": response.message,
-                "execution_time_ms": response.execution_time_ms
-            }
+            result = self._perform_action(self._make_hover_request(x, y, target_user, duration_ms))
 
-            if response.success:
-                self.logger.info(f"Hover at ({x}, {y}) for {duration_ms}ms: Success")
+            if result["success"]:
+                self.logger.info("Hover at (%s, %s) for %sms: Success", x, y, duration_ms)
             else:
-                self.logger.warning(f"Hover operation failed: {response.message}")
+                self.logger.warning("Hover operation failed: %s", result["message"])
 
             return result
 
+        except grpc.RpcError as e:
+            self.logger.error("Hover operation failed: %s", e.code().name)
+            return {**_ERR_TMPL, "message": e.code().name}
         except Exception as e:
-            self.logger.error(f"Hover operation failed: {e}")
-            return {"success": False, "message": str(e), "execution_time_ms": 0}
+            self.logger.error("Hover operation failed: %s", e)
+            return {**_ERR_TMPL, "message": str(e)}
 
     # =============================================================================
     # Context Manager Support
@@ -1622,6 +2384,7 @@ class GuiAutomationServiceClient:
         """Disconnect from the GUI Automation Service."""
         self._connected = False
         self.stub = None
+        self._close_async_channel()
         self.logger.info(f"GUI Automation Service disconnected for client '{self.client_name}'")
 
     # =============================================================================
@@ -1633,6 +2396,9 @@ class GuiAutomationServiceClient:
         """
         Click using pre-defined patterns/templates.
 
+        The pattern image is read locally (cached while the file is unchanged) and sent to the
+        service as bytes, so agent-routed target_user sessions do not need the file on the agent.
+
         Args:
             pattern_name: Name of the pattern (without .png extension)
             patterns_dir: Directory containing pattern images
@@ -1649,15 +2415,9 @@ class GuiAutomationServiceClient:
             # Use custom patterns directory
             result = client.click_pattern("close_button", patterns_dir="ui_patterns")
         """
-        # Build pattern path
-        patterns_path = Path(patterns_dir)
-        if not patterns_path.is_absolute():
-            # If relative path, make it relative to artifacts directory
-            patterns_path = Path(LoggerConfig.ARTIFACTS_DIR) / patterns_path
-        
-        pattern_file = patterns_path / f"{pattern_name}.png"
-        
-        if not pattern_file.exists():
+        pattern_file = _resolve_pattern_path(pattern_name, patterns_dir, LoggerConfig.ARTIFACTS_DIR)
+
+        if not _pattern_file_exists(pattern_file):
             return {
                 "success": False,
                 "message": f"Pattern file not found: {pattern_file}",
@@ -1665,14 +2425,16 @@ class GuiAutomationServiceClient:
                 "execution_time_ms": 0
             }
         
-        self.logger.info(f"Clicking pattern '{pattern_name}' from {pattern_file}")
-        return self.click_image(str(pattern_file), confidence=confidence, **options)
+        self.logger.info("Clicking pattern '%s' from %s", pattern_name, pattern_file)
+        return self.click_image(pattern_file, confidence=confidence, **options)
 
     def find_pattern(self, pattern_name: str, patterns_dir: str = "patterns",
                     confidence: float = 0.8, **options) -> Dict[str, Any]:
         """
         Find a pre-defined pattern without clicking.
 
+        Like click_pattern(), the pattern image is sent to the service as bytes.
+
         Args:
             pattern_name: Name of the pattern (without .png extension)
             patterns_dir: Directory containing pattern images
@@ -1682,22 +2444,17 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing search result
         """
-        # Build pattern path
-        patterns_path = Path(patterns_dir)
-        if not patterns_path.is_absolute():
-            patterns_path = Path(LoggerConfig.ARTIFACTS_DIR) / patterns_path
-        
-        pattern_file = patterns_path / f"{pattern_name}.png"
-        
-        if not pattern_file.exists():
+        pattern_file = _resolve_pattern_path(pattern_name, patterns_dir, LoggerConfig.ARTIFACTS_DIR)
+
+        if not _pattern_file_exists(pattern_file):
             return {
                 "success": False,
                 "message": f"Pattern file not found: {pattern_file}",
                 "location": None
             }
         
-        self.logger.info(f"Finding pattern '{pattern_name}' from {pattern_file}")
-        return self.find_image(str(pattern_file), confidence=confidence, **options)
+        self.logger.info("Finding pattern '%s' from %s", pattern_name, pattern_file)
+        return self.find_image(pattern_file, confidence=confidence, **options)
 
     def save_pattern(self, pattern_name: str, region: Tuple[int, int, int, int],
                     patterns_dir: str = "patterns") -> Dict[str, Any]:
@@ -1712,23 +2469,24 @@ class GuiAutomationServiceClient:
         Returns:
             Dict containing save result
         """
-        # Build pattern path
-        patterns_path = Path(patterns_dir)
-        if not patterns_path.is_absolute():
-            patterns_path = Path(LoggerConfig.ARTIFACTS_DIR) / patterns_path
-        
-        patterns_path.mkdir(parents=True, exist_ok=True)
-        pattern_file = patterns_path / f"{pattern_name}.png"
-        
+        pattern_file = _resolve_pattern_path(pattern_name, patterns_dir, LoggerConfig.ARTIFACTS_DIR)
+        os.makedirs(os.path.dirname(pattern_file), exist_ok=True)
+
         # Take screenshot of the region
-        result = self.take_screenshot(region=region, filename=str(pattern_file))
-        
+        result = self.take_screenshot(region=region, filename=pattern_file)
+
         if result["success"]:
-            self.logger.info(f"Saved pattern '{pattern_name}' to {pattern_file}")
+            # take_screenshot may save under its own name; only cache the path if it was written
+            saved_path = result.get("file_path")
+            if saved_path and os.path.abspath(saved_path) == os.path.abspath(pattern_file):
+                _KNOWN_PATTERN_FILES.add(pattern_file)
+            else:
+                _KNOWN_PATTERN_FILES.discard(pattern_file)
+            self.logger.info("Saved pattern '%s' to %s", pattern_name, pattern_file)
             return {
                 "success": True,
                 "message": f"Pattern saved successfully",
-                "pattern_path": str(pattern_file)
+                "pattern_path": pattern_file
             }
         else:
             return {
@@ -1741,45 +2499,187 @@ class GuiAutomationServiceClient:
     # Async/Await Support
     # =============================================================================
 
-    async def click_coordinates_async(self, x: int, y: int, **options) -> Dict[str, Any]:
-        """Async version of click_coordinates for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.click_coordinates, x, y, **options)
+    def connect_async(self) -> Optional[object]:
+        """
+        Create a grpc.aio stub on the registered client's target for native async calls.
+
+        Must be called from within the event loop that will use it. The stub is bound to that
+        loop; called from a different loop, the old channel is closed and a new one created.
+
+        Returns:
+            The async stub, or None when protobuf modules or a registered, connected client
+            are not available (the *_async methods then run the sync call in an executor)
+        """
+        loop = asyncio.get_running_loop()
+        if self.async_stub is not None:
+            if self._async_loop is loop:
+                return self.async_stub
+            self._close_async_channel()
+        if not PROTOBUF_AVAILABLE:
+            return None
+
+        client = GrpcClientManager.get_client(self.client_name)
+        if client is None or not client.connected:
+            return None
+
+        self._async_channel = grpc.aio.insecure_channel(
+            f"{client.host}:{client.actual_port}", options=client.CHANNEL_OPTIONS
+        )
+        self._async_loop = loop
+        self.async_stub = gui_automation_service_pb2_grpc.GuiAutomationServiceStub(self._async_channel)
+        self.logger.info(f"GUI Automation Service async stub created for client '{self.client_name}'")
+        return self.async_stub
+
+    def _close_async_channel(self):
+        """
+        Drop the async stub and close its grpc.aio channel on the loop it was created on.
+
+        The channel can only be closed while that loop is running; otherwise the reference is
+        dropped and grpc releases the channel when it is garbage collected.
+        """
+        channel, loop = self._async_channel, self._async_loop
+        self.async_stub = self._async_channel = self._async_loop = None
+        if channel is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(channel.close(), loop)
+
+    @staticmethod
+    async def _run_sync(func, *args, **kwargs) -> Dict[str, Any]:
+        """Run a blocking client method in the default executor (run_in_executor takes no kwargs)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def click_coordinates_async(self, x: int, y: int, target_user: str = "",
+                                      delay_after_ms: int = 300, capture_after: bool = False,
+                                      max_retries: int = 1, retry_delay_ms: int = 500) -> Dict[str, Any]:
+        """Async version of click_coordinates, awaiting the gRPC call on a grpc.aio channel."""
+        stub = self.connect_async()
+        if stub is None:
+            return await self._run_sync(
+                self.click_coordinates, x, y, target_user, delay_after_ms,
+                capture_after, max_retries, retry_delay_ms
+            )
+
+        try:
+            request = self._make_click_request(
+                x, y, target_user, delay_after_ms, capture_after, max_retries, retry_delay_ms
+            )
+            response = await stub.PerformAction(request)
+            return self._click_result(response, x, y, capture_after)
+
+        except Exception as e:
+            self.logger.error(f"Click coordinates failed: {e}")
+            return {"success": False, "message": str(e), "location": (0, 0), "execution_time_ms": 0}
 
     async def click_image_async(self, image_path: str, **options) -> Dict[str, Any]:
         """Async version of click_image for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.click_image, image_path, **options)
+        return await self._run_sync(self.click_image, image_path, **options)
 
     async def click_text_async(self, text: str, **options) -> Dict[str, Any]:
         """Async version of click_text for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.click_text, text, **options)
+        return await self._run_sync(self.click_text, text, **options)
 
     async def type_text_async(self, text: str, **options) -> Dict[str, Any]:
         """Async version of type_text for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.type_text, text, **options)
+        return await self._run_sync(self.type_text, text, **options)
 
     async def take_screenshot_async(self, **options) -> Dict[str, Any]:
         """Async version of take_screenshot for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.take_screenshot, **options)
+        return await self._run_sync(self.take_screenshot, **options)
+
+    async def perform_batch_operations_async(self, operations: List[Dict[str, Any]],
+                                             target_user: str = "", stop_on_error: bool = True,
+                                             timeout_seconds: int = 60,
+                                             prefer_individual: bool = False) -> Dict[str, Any]:
+        """
+        Async version of perform_batch_operations.
+
+        Batches of up to _MAX_BATCH_SIZE operations await PerformBatch directly on a grpc.aio
+        channel; larger or individual-mode runs, and failed batches, use the sync path in an executor.
+        """
+        # Same folding as the sync path, so delay entries survive and the size check sees the real count
+        operations = _compact_ops(operations)
+        stub = None
+        if not prefer_individual and len(operations) <= self._MAX_BATCH_SIZE:
+            stub = self.connect_async()
+        if stub is None:
+            return await self._run_sync(
+                self.perform_batch_operations, operations, target_user, stop_on_error,
+                timeout_seconds, prefer_individual
+            )
 
-    async def perform_batch_operations_async(self, operations: List[Dict[str, Any]], **options) -> Dict[str, Any]:
-        """Async version of perform_batch_operations for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.perform_batch_operations, operations, **options)
+        try:
+            gui_requests = self._build_requests(operations, target_user)
+            if not gui_requests:
+                return self._empty_batch_result()
+
+            self.logger.info("Executing batch of %d operations...", len(gui_requests))
+            response = await stub.PerformBatch(
+                self._make_batch_request(gui_requests, target_user, stop_on_error), timeout=timeout_seconds
+            )
+            return self._batch_result(response)
+
+        except Exception as e:
+            self.logger.warning("Batch operation failed, falling back to individual operations: %s", e)
+            return await self._run_sync(
+                self._perform_individual_operations, operations, target_user, stop_on_error
+            )
+
+    async def perform_batch_operations_stream(self, operations: List[Dict[str, Any]],
+                                              target_user: str = "", stop_on_error: bool = True,
+                                              timeout_seconds: int = 60) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute operations in order, yielding each operation's result as soon as it completes.
+
+        PerformBatch is a unary RPC, so operations are sent one at a time through PerformAction on
+        the grpc.aio channel. Breaking out of the loop stops before the next operation is sent.
+        Without an async stub the batch runs through perform_batch_operations_async and its
+        results are yielded afterwards. An operation that cannot be built yields a failed
+        "Invalid operation" result, so there is one result per operation.
+
+        Usage:
+            async for result in client.perform_batch_operations_stream(operations):
+                if not result["success"]:
+                    break
+        """
+        stub = self.connect_async()
+        if stub is None:
+            result = await self.perform_batch_operations_async(
+                operations, target_user, stop_on_error, timeout_seconds
+            )
+            for op_result in result["operation_results"]:
+                yield op_result
+            return
+
+        # One result per operation, in order, so results stay aligned with the operations
+        for i, operation in enumerate(_compact_ops(operations)):
+            try:
+                request = self._build_request_from_operation(operation, target_user)
+                if request is None:
+                    self.logger.warning("Invalid operation %d: %s", i + 1, operation)
+                    result = OpResult(False, "Invalid operation", None, 0)
+                else:
+                    response = await stub.PerformAction(request, timeout=timeout_seconds)
+                    loc = response.result_location
+                    result = OpResult(response.success, response.message, (loc.x, loc.y),
+                                      response.execution_time_ms)
+            except grpc.RpcError as e:
+                self.logger.error("Streamed %s failed: %s", operation.get("action"), e.code().name)
+                result = OpResult(False, e.code().name, None, 0)
+            except Exception as e:
+                self.logger.error("Operation %d failed with exception: %s", i + 1, e)
+                result = OpResult(False, str(e), None, 0)
+
+            yield asdict(result)
+            if not result.success and stop_on_error:
+                return
 
     async def find_image_async(self, image_path: str, **options) -> Dict[str, Any]:
         """Async version of find_image for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.find_image, image_path, **options)
+        return await self._run_sync(self.find_image, image_path, **options)
 
     async def find_text_async(self, text: str, **options) -> Dict[str, Any]:
         """Async version of find_text for concurrent operations."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.find_text, text, **options)
+        return await self._run_sync(self.find_text, text, **options)
 
 
 # =============================================================================
@@ -1789,6 +2689,8 @@ class GuiAutomationServiceClient:
 @dataclass
 class ConnectionPoolConfig:
     """Configuration for GUI Automation connection pool."""
+    # Registered GrpcClientManager name; every pooled client multiplexes over its single channel
+    client_name: str = "user"
     pool_size: int = 5
     max_retries: int = 3
     retry_delay: float = 1.0
@@ -1798,6 +2700,10 @@ class ConnectionPoolConfig:
 class GuiAutomationConnectionPool:
     """
     Connection pool for high-throughput GUI automation scenarios.
+
+    All pooled clients are bound to one registered client name, so they share its gRPC
+    channel and cached stub; HTTP/2 multiplexes their calls, and a pooled client is only
+    a lightweight wrapper, not a separate connection.
     
     Usage:
         pool = GuiAutomationConnectionPool(pool_size=10)
@@ -1813,16 +2719,18 @@ class GuiAutomationConnectionPool:
     
     def __init__(self, config: ConnectionPoolConfig = None):
         self.config = config or ConnectionPoolConfig()
-        self.available_clients: List[GuiAutomationServiceClient] = []
-        self.in_use_clients: List[GuiAutomationServiceClient] = []
+        # deque.pop()/append() are atomic, so the fast path needs no lock
+        self.available_clients: deque = deque()
+        self.in_use_clients: Set[GuiAutomationServiceClient] = set()
         self.logger = get_logger("GuiAutomationConnectionPool")
+        # Only serialises creating extra clients when the pool is empty
         self._lock = asyncio.Lock()
         self._initialize_pool()
     
     def _initialize_pool(self):
         """Initialize the connection pool with clients."""
         for i in range(self.config.pool_size):
-            client = GuiAutomationServiceClient(client_name=f"pool_client_{i}")
+            client = GuiAutomationServiceClient(client_name=self.config.client_name)
             try:
                 client.connect()
                 self.available_clients.append(client)
@@ -1830,87 +2738,84 @@ class GuiAutomationConnectionPool:
             except Exception as e:
                 self.logger.warning(f"Failed to initialize pool client {i}: {e}")
     
+    def _make_extra(self) -> Optional[GuiAutomationServiceClient]:
+        """
+        Make one attempt at creating a connected client beyond the pool size.
+
+        acquire() and acquire_sync() share this and only differ in how they wait between attempts.
+        """
+        client = GuiAutomationServiceClient(client_name=self.config.client_name)
+        try:
+            client.connect()
+        except Exception as e:
+            self.logger.warning(f"Failed to create additional client: {e}")
+            return None
+        self.logger.info("Created additional pool client due to high demand")
+        return client
+
     async def acquire(self) -> GuiAutomationServiceClient:
         """Acquire a client from the pool (async version)."""
-        async with self._lock:
-            if not self.available_clients:
+        try:
+            client = self.available_clients.pop()
+        except IndexError:
+            async with self._lock:
                 # Try to create a new client if pool is empty
                 for i in range(self.config.max_retries):
-                    try:
-                        client = GuiAutomationServiceClient(client_name=f"pool_client_extra_{i}")
-                        client.connect()
-                        self.logger.info(f"Created additional pool client due to high demand")
+                    client = self._make_extra()
+                    if client is not None:
                         return client
-                    except Exception as e:
-                        self.logger.warning(f"Failed to create additional client: {e}")
-                        if i < self.config.max_retries - 1:
-                            await asyncio.sleep(self.config.retry_delay)
-                
+                    if i < self.config.max_retries - 1:
+                        await asyncio.sleep(self.config.retry_delay)
+
                 raise RuntimeError("No available clients in pool and cannot create new ones")
-            
-            client = self.available_clients.pop()
-            self.in_use_clients.append(client)
-            return client
+
+        self.in_use_clients.add(client)
+        return client
     
     def acquire_sync(self) -> GuiAutomationServiceClient:
         """Acquire a client from the pool (synchronous version)."""
-        if not self.available_clients:
+        try:
+            client = self.available_clients.pop()
+        except IndexError:
             # Try to create a new client if pool is empty
             for i in range(self.config.max_retries):
-                try:
-                    client = GuiAutomationServiceClient(client_name=f"pool_client_extra_sync_{i}")
-                    client.connect()
-                    self.logger.info(f"Created additional pool client due to high demand")
+                client = self._make_extra()
+                if client is not None:
                     return client
-                except Exception as e:
-                    self.logger.warning(f"Failed to create additional client: {e}")
-                    if i < self.config.max_retries - 1:
-                        time.sleep(self.config.retry_delay)
-            
+                if i < self.config.max_retries - 1:
+                    time.sleep(self.config.retry_delay)
+
             raise RuntimeError("No available clients in pool and cannot create new ones")
-        
-        client = self.available_clients.pop()
-        self.in_use_clients.append(client)
+
+        self.in_use_clients.add(client)
         return client
     
     async def release(self, client: GuiAutomationServiceClient):
         """Release a client back to the pool (async version)."""
-        async with self._lock:
-            if client in self.in_use_clients:
-                self.in_use_clients.remove(client)
-                
-                # Check if client is still healthy
-                if client.is_connected():
-                    self.available_clients.append(client)
-                else:
-                    # Try to reconnect
-                    try:
-                        client.connect()
-                        self.available_clients.append(client)
-                        self.logger.debug("Reconnected client before returning to pool")
-                    except Exception as e:
-                        self.logger.warning(f"Failed to reconnect client, discarding: {e}")
+        self.release_sync(client)
     
     def release_sync(self, client: GuiAutomationServiceClient):
         """Release a client back to the pool (synchronous version)."""
-        if client in self.in_use_clients:
+        try:
             self.in_use_clients.remove(client)
-            
-            # Check if client is still healthy
-            if client.is_connected():
+        except KeyError:
+            return
+
+        # Check if client is still healthy
+        if client.is_connected():
+            self.available_clients.append(client)
+        else:
+            # Try to reconnect
+            try:
+                client.connect()
                 self.available_clients.append(client)
-            else:
-                # Try to reconnect
-                try:
-                    client.connect()
-                    self.available_clients.append(client)
-                    self.logger.debug("Reconnected client before returning to pool")
-                except Exception as e:
-                    self.logger.warning(f"Failed to reconnect client, discarding: {e}")
+                self.logger.debug("Reconnected client before returning to pool")
+            except Exception as e:
+                self.logger.warning(f"Failed to reconnect client, discarding: {e}")
     
     def close(self):
         """Close all clients in the pool."""
-        for client in self.available_clients + self.in_use_clients:
+        for client in itertools.chain(self.available_clients, self.in_use_clients):
             try:
                 client.disconnect()
             except:
@@ -2035,46 +2940,76 @@ class GuiWorkflowBuilder:
         self.client_name = client_name
         self.operations = []
         self.logger = get_logger(f"GuiWorkflowBuilder[{client_name}]")
+        # Created on first execute() and reused by later runs
+        self._client: Optional[GuiAutomationServiceClient] = None
+        # Requests built from self.operations on first execute(); reset whenever an operation is added
+        self._compiled: Optional[List[object]] = None
+
+    def _add(self, op: Dict[str, Any]):
+        """
+        Append an operation and invalidate the compiled requests.
+
+        Consecutive waits are merged into one, a click straight after a click at the same point
+        with no pause becomes a single double-click, and an operation identical to the previous one
+        increments that operation's "repeat" count instead of adding another entry.
+        """
+        self._compiled = None
+        if self.operations:
+            last = self.operations[-1]
+            if op["action"] == "delay" and last["action"] == "delay":
+                last["duration_ms"] += op["duration_ms"]
+                return self
+            if op["action"] == "click" and last == {"action": "click", "x": op["x"], "y": op["y"], "delay_after": 0}:
+                last["action"] = "double_click"
+                last["delay_after"] = op["delay_after"]
+                return self
+            repeat = last.pop("repeat", 1)
+            if last == op:
+                repeat += 1
+            else:
+                self.operations.append(op)
+            if repeat > 1:
+                last["repeat"] = repeat
+            return self
+
+        self.operations.append(op)
+        return self
 
     def click(self, x: int, y: int, delay_after: int = 300):
         """Add click operation to workflow."""
-        self.operations.append({
+        return self._add({
             "action": "click",
             "x": x,
             "y": y,
             "delay_after": delay_after
         })
-        return self
 
     def double_click(self, x: int, y: int, delay_after: int = 300):
         """Add double-click operation to workflow."""
-        self.operations.append({
+        return self._add({
             "action": "double_click",
             "x": x,
             "y": y,
             "delay_after": delay_after
         })
-        return self
 
     def type(self, text: str, clear_field: bool = False, delay_before: int = 100):
         """Add type operation to workflow."""
-        self.operations.append({
+        return self._add({
             "action": "type",
             "text": text,
             "clear_field": clear_field,
             "delay_before": delay_before
         })
-        return self
 
     def press_key(self, key: str, modifiers: str = "", delay_after: int = 200):
         """Add key press operation to workflow."""
-        self.operations.append({
+        return self._add({
             "action": "key_press",
             "key": key,
             "modifiers": modifiers,
             "delay_after": delay_after
         })
-        return self
 
     def click_text(self, text: str, search_region: Optional[Tuple[int, int, int, int]] = None,
                    delay_after: int = 300):
@@ -2086,8 +3021,7 @@ class GuiWorkflowBuilder:
         }
         if search_region:
             op["search_region"] = search_region
-        self.operations.append(op)
-        return self
+        return self._add(op)
 
     def click_image(self, image_path: str, confidence: float = 0.8,
                     search_region: Optional[Tuple[int, int, int, int]] = None,
@@ -2101,16 +3035,47 @@ class GuiWorkflowBuilder:
         }
         if search_region:
             op["search_region"] = search_region
-        self.operations.append(op)
-        return self
+        return self._add(op)
+
+    def drag(self, from_x: int, from_y: int, to_x: int, to_y: int,
+             duration_ms: int = 500, delay_after: int = 300):
+        """Add drag operation to workflow."""
+        return self._add({
+            "action": "drag",
+            "from_x": from_x,
+            "from_y": from_y,
+            "to_x": to_x,
+            "to_y": to_y,
+            "duration_ms": duration_ms,
+            "delay_after": delay_after
+        })
+
+    def scroll(self, x: int, y: int, direction: str = "down", clicks: int = 3, delay_after: int = 200):
+        """Add scroll operation to workflow."""
+        return self._add({
+            "action": "scroll",
+            "x": x,
+            "y": y,
+            "direction": direction,
+            "clicks": clicks,
+            "delay_after": delay_after
+        })
+
+    def hover(self, x: int, y: int, duration_ms: int = 1000):
+        """Add hover operation to workflow."""
+        return self._add({
+            "action": "hover",
+            "x": x,
+            "y": y,
+            "duration_ms": duration_ms
+        })
 
     def wait(self, duration_ms: int):
         """Add wait/delay operation to workflow."""
-        self.operations.append({
+        return self._add({
             "action": "delay",
             "duration_ms": duration_ms
         })
-        return self
 
     def screenshot(self, filename: str = "", region: Optional[Tuple[int, int, int, int]] = None):
         """Add screenshot operation to workflow."""
@@ -2119,25 +3084,42 @@ class GuiWorkflowBuilder:
             op["filename"] = filename
         if region:
             op["region"] = region
-        self.operations.append(op)
-        return self
+        return self._add(op)
 
     def execute(self, stop_on_error: bool = True, timeout_seconds: int = 60) -> Dict[str, Any]:
         """Execute the built workflow."""
         if not self.operations:
             return {"success": True, "message": "No operations to execute", "operation_results": []}
 
-        client = GuiAutomationServiceClient(self.client_name)
-        client.connect()
+        if self._client is None:
+            self._client = GuiAutomationServiceClient(self.client_name)
+            self._client.connect()
 
         self.logger.info(f"Executing workflow with {len(self.operations)} operations")
-        return client.perform_batch_operations(
-            self.operations,
+
+        # Single-batch workflows are compiled to requests once and resent as-is on later runs
+        operations = _compact_ops(self.operations)
+        if PROTOBUF_AVAILABLE and len(operations) <= GuiAutomationServiceClient._MAX_BATCH_SIZE:
+            if self._compiled is None:
+                self._compiled = self._client._build_requests(operations, "")
+            return self._client._perform_prepared_batch(
+                self._compiled, operations, stop_on_error=stop_on_error, timeout_seconds=timeout_seconds
+            )
+
+        return self._client.perform_batch_operations(
+            operations,
             stop_on_error=stop_on_error,
             timeout_seconds=timeout_seconds
         )
 
+    def close(self):
+        """Disconnect the client used by execute(), if one was created."""
+        if self._client is not None:
+            self._client.disconnect()
+            self._client = None
+
     def clear(self):
         """Clear all operations from the workflow."""
         self.operations.clear()
+        self._compiled = None
         return self
\ No newline at end of file
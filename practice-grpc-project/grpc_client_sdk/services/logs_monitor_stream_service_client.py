@@ -7,10 +7,15 @@ entries as they appear in real-time.
 """
 
 import time
+import asyncio
 import threading
+import functools
 import uuid
-from datetime import datetime
-from typing import Optional, List, Dict, Callable, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Optional, List, Dict, Callable, Any, Sequence
 
 import grpc
 from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
@@ -18,6 +23,59 @@ from test_framework.utils import get_logger
 from test_framework.utils.handlers.file_analayzer.parser import LogParser
 from test_framework.utils.handlers.file_analayzer.extractor import LogExtractor
 
+# Upper bound on entries kept per stream; the oldest are dropped once it is reached
+_MAX_BUFFERED_ENTRIES = 10000
+
+# Existing entries older than this before the tap are not considered for correlation
+_CORRELATION_LOOKBACK = timedelta(seconds=60)
+
+# Responses a stream may have queued for parsing before its reader waits for the oldest
+_MAX_PENDING_PARSES = 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse a "YYYY-MM-DD HH:MM:SS[.ffffff]" log timestamp, or return None if it is not in that form.
+
+    The fixed-width fields are sliced directly; strptime is only the fallback for anything else.
+    """
+    s = timestamp_str
+    if len(s) >= 19 and s[4] == '-' and s[7] == '-' and s[10] == ' ' and s[13] == ':' and s[16] == ':':
+        fraction = s[20:]
+        if len(s) == 19 or (s[19] == '.' and 0 < len(fraction) <= 6 and fraction.isdigit()):
+            try:
+                return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                                int(fraction.ljust(6, '0')) if fraction else 0)
+            except ValueError:
+                pass
+
+    for fmt in ('%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d %H:%M:%S'):
+        try:
+            return datetime.strptime(timestamp_str, fmt)
+        except ValueError:
+            pass
+    return None
+
+
+def _compile_criteria(structured_criteria: Dict[str, Any]) -> Callable[[Any], bool]:
+    """
+    Build a predicate for structured_criteria.
+
+    Field getters and lowercased needles are prepared once per stream; an entry matches when
+    every field exists and contains its value, compared case-insensitively.
+    """
+    checks = [(attrgetter(field), str(value).lower()) for field, value in structured_criteria.items()]
+
+    def matches(entry: Any) -> bool:
+        try:
+            return all(needle in str(get(entry)).lower() for get, needle in checks)
+        except AttributeError:
+            return False
+
+    return matches
+
 
 class LogsMonitoringServiceClient:
     """
@@ -27,6 +85,17 @@ class LogsMonitoringServiceClient:
     millisecond-level timing precision for automation testing.
     """
 
+    # Shared by all clients; both are safe to use from several threads, so the line regex is
+    # compiled once per process
+    _PARSER = LogParser()
+    _EXTRACTOR = LogExtractor()
+
+    # Stream request message class, resolved from the generated module on first use
+    _stream_request_cls = None
+
+    # Parses raw lines for every stream of every client so the gRPC readers only read
+    _parse_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="log-parse")
+
     def __init__(self, client_name: str = "root", logger: Optional[object] = None):
         """Initialize the streaming client."""
         self.client_name = client_name
@@ -35,9 +104,10 @@ class LogsMonitoringServiceClient:
         self.active_streams: Dict[str, Dict] = {}
         self.stream_lock = threading.Lock()
         self.connected = False
-        self.parser = LogParser()  # For parsing raw log lines
-        self.extractor = LogExtractor()  # For structured filtering
-        self.stop_flags: Dict[str, bool] = {}  # Track which streams should stop
+        self.parser = self._PARSER  # For parsing raw log lines
+        self.extractor = self._EXTRACTOR  # For structured filtering
+        # grpc.aio stub on the manager's shared event loop; created on first stream
+        self.async_stub = None
 
     def connect(self) -> None:
         """
@@ -62,6 +132,20 @@ class LogsMonitoringServiceClient:
             self.stub = None
             self.connected = False
 
+    def _async_stream_stub(self) -> Optional[object]:
+        """
+        Return a grpc.aio stub on the event loop GrpcClientManager shares between all streams.
+
+        Returns None when the registered client is not connected; streams then fall back to one
+        reader thread each.
+        """
+        if self.async_stub is None:
+            from generated import log_streaming_service_pb2_grpc
+            self.async_stub = GrpcClientManager.get_async_stub(
+                self.client_name, log_streaming_service_pb2_grpc.LogStreamingServiceStub
+            )
+        return self.async_stub
+
     def stream_entries_for_tap_correlation(self,
                                            tap_start_time: datetime,
                                            expected_patterns: List[str],
@@ -72,7 +156,9 @@ class LogsMonitoringServiceClient:
         Stream log entries and correlate with tap timing.
 
         This is the key method for solving automation timing problems.
-        Uses real-time streaming for millisecond-level precision.
+        Uses real-time streaming for millisecond-level precision. Entries are matched as the
+        stream delivers them, and the call returns once every pattern has been seen or
+        correlation_window_seconds has elapsed.
         """
         if not self.connected or not self.stub:
             self.logger.warning("Streaming service not connected - falling back to polling")
@@ -96,48 +182,54 @@ class LogsMonitoringServiceClient:
             'streaming_available': True
         }
 
+        found_entries = correlation_results['found_entries']
+        pending = {i: pattern.lower() for i, pattern in enumerate(expected_patterns)}
+        results_lock = threading.Lock()
+        all_found = threading.Event()
+        if not pending:
+            all_found.set()
+
+        def correlate_entry(entry):
+            """Check each streamed entry against the patterns that have not matched yet."""
+            message = entry.message.lower()
+            with results_lock:
+                for i, lowered in list(pending.items()):
+                    if lowered in message:
+                        del pending[i]
+                        entry_time = self._parse_entry_timestamp(entry.timestamp)
+                        found_entries[f"pattern_{i}"] = {
+                            'entry': entry,
+                            'pattern_matched': expected_patterns[i],
+                            'delay_seconds': (entry_time - tap_start_time).total_seconds(),
+                            'correlation_time': entry_time,
+                            'message': entry.message
+                        }
+                if not pending:
+                    all_found.set()
+
         try:
-            # Use the real streaming service with tap correlation
+            # Use the real streaming service with tap correlation; entries are matched as they arrive
             stream_id = self.stream_log_entries(
                 log_file_path=log_file_path,
                 filter_patterns=expected_patterns,
                 include_existing=True,
-                entry_callback=None,  # We'll process entries directly
-                structured_criteria=structured_criteria
+                entry_callback=correlate_entry,
+                structured_criteria=structured_criteria,
+                since=tap_start_time - _CORRELATION_LOOKBACK
             )
 
             if stream_id and stream_id != "placeholder_stream_id":
-                start_time = time.time()
-                found_count = 0
-
-                # Monitor the stream for correlation
-                with self.stream_lock:
-                    if stream_id in self.active_streams:
-                        stream_info = self.active_streams[stream_id]
-                        entries = stream_info.get('entries', [])
-
-                        for i, pattern in enumerate(expected_patterns):
-                            for entry in entries:
-                                if pattern.lower() in entry.message.lower():
-                                    entry_time = self._parse_entry_timestamp(entry.timestamp)
-                                    delay_seconds = (entry_time - tap_start_time).total_seconds()
-
-                                    correlation_results['found_entries'][f"pattern_{i}"] = {
-                                        'entry': entry,
-                                        'pattern_matched': pattern,
-                                        'delay_seconds': delay_seconds,
-                                        'correlation_time': entry_time,
-                                        'message': entry.message
-                                    }
-                                    found_count += 1
-                                    break
-
-                correlation_results['search_completed'] = found_count == len(expected_patterns)
-                correlation_results['timeout_reached'] = time.time() - start_time >= correlation_window_seconds
+                # Returns as soon as the last pattern is seen, or when the window runs out
+                completed = all_found.wait(timeout=correlation_window_seconds)
 
                 # Stop the stream
                 self.stop_log_stream(stream_id)
 
+                with results_lock:
+                    found_count = len(found_entries)
+                correlation_results['search_completed'] = found_count == len(expected_patterns)
+                correlation_results['timeout_reached'] = not completed
+
                 self.logger.info(f"Tap correlation found {found_count}/{len(expected_patterns)} patterns")
 
         except Exception as e:
@@ -151,8 +243,16 @@ class LogsMonitoringServiceClient:
                            filter_patterns: Optional[List[str]] = None,
                            include_existing: bool = False,
                            entry_callback: Optional[Callable] = None,
-                           structured_criteria: Optional[Dict] = None) -> str:
-        """Start streaming log entries using the real gRPC service."""
+                           structured_criteria: Optional[Dict] = None,
+                           max_entries: int = _MAX_BUFFERED_ENTRIES,
+                           since: Optional[datetime] = None) -> str:
+        """
+        Start streaming log entries using the real gRPC service.
+
+        The stream keeps at most max_entries entries, dropping the oldest first. When since is
+        given, entries timestamped before it are skipped; entries without a parseable
+        timestamp are kept.
+        """
         if not self.connected or not self.stub:
             self.logger.warning("Streaming service not connected")
             return "placeholder_stream_id"
@@ -161,27 +261,80 @@ class LogsMonitoringServiceClient:
             from generated import log_streaming_service_pb2
 
             # Create the streaming request - handle both old and new protobuf formats
-            try:
-                # Try new format first
-                request = log_streaming_service_pb2.LogStreamRequest(
-                    log_file_path=log_file_path,
-                    filter_patterns=filter_patterns or [],
-                    include_existing=include_existing,
-                    start_from_timestamp=0  # Start from beginning if including existing
-                )
-            except AttributeError:
-                # Fallback to old format if new protobuf not available
-                self.logger.warning("Using old protobuf format - please regenerate stubs")
-                request = log_streaming_service_pb2.StreamLogRequest(
-                    log_file_path=log_file_path,
-                    filter_patterns=filter_patterns or [],
-                    include_existing=include_existing,
-                    start_from_timestamp=0
+            request = self._stream_request_class(log_streaming_service_pb2)(
+                log_file_path=log_file_path,
+                filter_patterns=filter_patterns or [],
+                include_existing=include_existing,
+                start_from_timestamp=0  # Start from beginning if including existing
+            )
+
+            # Servers whose request carries structured_criteria drop non-matching lines before
+            # sending them; the client-side check below still applies for servers that do not
+            if structured_criteria and 'structured_criteria' in request.DESCRIPTOR.fields_by_name:
+                request.structured_criteria.update(
+                    {field: str(value) for field, value in structured_criteria.items()}
                 )
 
             # Start the stream
             stream_id = str(uuid.uuid4())
-            entries_buffer = []
+            # Appended only under the stream's delivery lock, and deque.append is atomic, so readers need no lock
+            entries_buffer = deque(maxlen=max_entries)
+            matches_criteria = _compile_criteria(structured_criteria) if structured_criteria else None
+
+            # Parses submitted to the pool, oldest first; each finished parse delivers every
+            # finished parse at the head, so entries keep arrival order
+            pending_parses = deque()
+            parse_slots = threading.BoundedSemaphore(_MAX_PENDING_PARSES)
+            delivery_lock = threading.Lock()
+
+            def deliver_parsed(_future=None):
+                """Deliver the parsed entries of finished parses at the head of the queue."""
+                with delivery_lock:
+                    while pending_parses and pending_parses[0].done():
+                        future = pending_parses.popleft()
+                        parse_slots.release()
+                        try:
+                            deliver_entries(future.result())
+                        except Exception as delivery_error:
+                            self.logger.error(f"Error in stream processor: {delivery_error}")
+
+            def submit_parse(response):
+                """Queue a response for parsing; the caller's parse slot is released if that fails."""
+                queued = False
+                try:
+                    future = self._parse_pool.submit(self._parse_response, response)
+                    # Queued before the callback is attached so its delivery finds it
+                    pending_parses.append(future)
+                    queued = True
+                finally:
+                    if not queued:
+                        parse_slots.release()
+                future.add_done_callback(deliver_parsed)
+
+            def deliver_entries(parsed_entries):
+                """Filter, store and hand on parsed entries."""
+                for parsed_entry in parsed_entries:
+                    if not parsed_entry:
+                        continue
+
+                    if since is not None:
+                        entry_time = _parse_timestamp(parsed_entry.timestamp)
+                        if entry_time is not None and entry_time < since:
+                            continue
+
+                    # Skip entry if it doesn't match structured criteria
+                    if matches_criteria and not matches_criteria(parsed_entry):
+                        continue
+
+                    # Store parsed entry (active_streams holds this same buffer)
+                    entries_buffer.append(parsed_entry)
+
+                    # Call the callback if provided
+                    if entry_callback:
+                        entry_callback(parsed_entry)
+
+            # Set by stop_log_stream; only the reader thread polls it, event loop tasks are cancelled
+            stop_event = threading.Event()
 
             def stream_processor():
                 """Process streaming responses in a separate thread."""
@@ -195,76 +348,69 @@ class LogsMonitoringServiceClient:
                         if stream_id in self.active_streams:
                             self.active_streams[stream_id]['grpc_call'] = grpc_call
                     
-                    # Process streaming responses
+                    # Process streaming responses; parsing runs on the shared parse pool while this
+                    # thread keeps reading, and results are delivered in arrival order
                     for response in grpc_call:
                         # Check if we should stop (thread-safe check)
-                        if self.stop_flags.get(stream_id, False):
+                        if stop_event.is_set():
                             self.logger.info(f"Stream {stream_id} stopping due to stop flag")
                             break
-                            
-                        parsed_entry = None
-
-                        # Handle both old and new response formats
-                        if hasattr(response, 'raw_line'):
-                            # New format: parse raw line into LogEntry
-                            parsed_entry = self.parser.parse_line(response.raw_line, response.line_number)
-                        elif hasattr(response, 'message'):
-                            # Old format: response already has parsed fields
-                            parsed_entry = response
-
-                        if parsed_entry:
-                            # Apply structured filtering if criteria provided
-                            if structured_criteria:
-                                # Check if entry matches structured criteria
-                                matches = True
-                                for field, value in structured_criteria.items():
-                                    if hasattr(parsed_entry, field):
-                                        entry_value = str(getattr(parsed_entry, field)).lower()
-                                        if str(value).lower() not in entry_value:
-                                            matches = False
-                                            break
-                                    else:
-                                        matches = False
-                                        break
-                                
-                                # Skip entry if it doesn't match criteria
-                                if not matches:
-                                    continue
-                            
-                            # Store parsed entry
-                            entries_buffer.append(parsed_entry)
-
-                            # Call the callback if provided
-                            if entry_callback:
-                                entry_callback(parsed_entry)
-
-                            # Store in active streams (check if still active)
-                            with self.stream_lock:
-                                if stream_id in self.active_streams:
-                                    self.active_streams[stream_id]['entries'].append(parsed_entry)
+
+                        # Waits for the oldest parse when too many are queued
+                        parse_slots.acquire()
+                        submit_parse(response)
 
                 except grpc.RpcError as stream_error:
                     self.logger.info(f"Stream {stream_id} ended: {stream_error}")
                 except Exception as process_error:
                     self.logger.error(f"Error in stream processor: {process_error}")
                 finally:
-                    # Clean up stop flag
-                    with self.stream_lock:
-                        self.stop_flags.pop(stream_id, None)
                     self.logger.debug(f"Stream processor {stream_id} thread finished")
 
+            async def async_stream_processor():
+                """Process streaming responses as a task on the shared event loop."""
+                loop = asyncio.get_running_loop()
+                try:
+                    async for response in async_stub.StreamLogEntries(request):
+                        if not parse_slots.acquire(blocking=False):
+                            # Parsers are behind; wait for a slot without blocking other streams
+                            slot = loop.run_in_executor(None, parse_slots.acquire)
+                            try:
+                                await asyncio.shield(slot)
+                            except asyncio.CancelledError:
+                                # The executor still takes the slot; give it back once it has
+                                slot.add_done_callback(lambda _slot: parse_slots.release())
+                                raise
+                        submit_parse(response)
+
+                except grpc.RpcError as stream_error:
+                    self.logger.info(f"Stream {stream_id} ended: {stream_error}")
+                except Exception as process_error:
+                    self.logger.error(f"Error in stream processor: {process_error}")
+                finally:
+                    self.logger.debug(f"Stream processor {stream_id} task finished")
+
+            async_stub = self._async_stream_stub()
+
             # Store stream info
             with self.stream_lock:
-                self.active_streams[stream_id] = {
+                stream_info = self.active_streams[stream_id] = {
                     'file_path': log_file_path,
                     'filters': filter_patterns or [],
                     'entries': entries_buffer,
-                    'thread': threading.Thread(target=stream_processor),
+                    'stop_event': stop_event,
                     'start_time': time.time()
                 }
 
-                # Start the processing thread
-                self.active_streams[stream_id]['thread'].start()
+                if async_stub is not None:
+                    # Cancelling the task cancels the underlying call
+                    stream_info['task'] = asyncio.run_coroutine_threadsafe(
+                        async_stream_processor(), GrpcClientManager.get_event_loop()
+                    )
+                else:
+                    # Start the processing thread
+                    stream_info['thread'] = threading.Thread(target=stream_processor)
+                    stream_info['thread'].start()
 
             self.logger.info(f"Started log stream {stream_id} for {log_file_path}")
             return stream_id
@@ -276,19 +422,46 @@ class LogsMonitoringServiceClient:
             self.logger.error(f"Error starting log stream: {e}")
             return "placeholder_stream_id"
 
+    def _stream_request_class(self, pb2_module: Any) -> Any:
+        """Return the stream request class; stubs generated from the old proto call it StreamLogRequest."""
+        request_cls = LogsMonitoringServiceClient._stream_request_cls
+        if request_cls is None:
+            request_cls = getattr(pb2_module, 'LogStreamRequest', None)
+            if request_cls is None:
+                # Fallback to old format if new protobuf not available
+                self.logger.warning("Using old protobuf format - please regenerate stubs")
+                request_cls = pb2_module.StreamLogRequest
+            LogsMonitoringServiceClient._stream_request_cls = request_cls
+        return request_cls
+
+    def _parse_response(self, response: Any) -> Sequence[Any]:
+        """Parse one streamed response into log entries; runs on the parse pool."""
+        # Handle batched, new and old response formats
+        if hasattr(response, 'raw_lines'):
+            # Batched format: several raw lines per response
+            return list(map(self.parser.parse_line, response.raw_lines, response.line_numbers))
+        if hasattr(response, 'raw_line'):
+            # New format: parse raw line into LogEntry
+            return (self.parser.parse_line(response.raw_line, response.line_number),)
+        if hasattr(response, 'message'):
+            # Old format: response already has parsed fields
+            return (response,)
+        return ()
+
     def stop_log_stream(self, stream_id: str) -> bool:
         """Stop a specific log stream."""
         if not self.connected or not self.stub:
             return True  # Nothing to stop
 
         try:
-            # Set stop flag first to signal the stream processor to stop
-            self.stop_flags[stream_id] = True
-            
             # Cancel gRPC call if available
             with self.stream_lock:
                 if stream_id in self.active_streams:
                     stream_info = self.active_streams[stream_id]
+                    # Signal the stream processor to stop first
+                    stream_info['stop_event'].set()
+                    if 'task' in stream_info:
+                        stream_info['task'].cancel()
                     if 'grpc_call' in stream_info:
                         try:
                             stream_info['grpc_call'].cancel()
@@ -321,9 +494,6 @@ class LogsMonitoringServiceClient:
 
         except Exception as e:
             self.logger.error(f"Error stopping log stream {stream_id}: {e}")
-            # Make sure to clean up stop flag even if error occurs
-            with self.stream_lock:
-                self.stop_flags.pop(stream_id, None)
             return False
 
     def stop_all_streams(self) -> None:
@@ -337,18 +507,13 @@ class LogsMonitoringServiceClient:
         self.logger.info("Stopped all log streams")
 
     def _parse_entry_timestamp(self, timestamp_str: str) -> datetime:
-        """Parse timestamp string from log entry."""
-        try:
-            # Handle the format: "2024-01-15 10:30:45.123"
-            return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S.%f')
-        except ValueError:
-            try:
-                # Fallback format without microseconds
-                return datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                # If all else fails, return current time
-                self.logger.warning(f"Could not parse timestamp: {timestamp_str}")
-                return datetime.now()
+        """Parse timestamp string from log entry, e.g. "2024-01-15 10:30:45.123"."""
+        parsed = _parse_timestamp(timestamp_str)
+        if parsed is None:
+            # If all else fails, return current time
+            self.logger.warning(f"Could not parse timestamp: {timestamp_str}")
+            return datetime.now()
+        return parsed
 
     def get_active_streams(self) -> Dict[str, Dict]:
         """Get information about currently active streams."""
@@ -159,4 +159,53 @@ class ScreenCaptureServiceClient:
 
         except Exception as e:
             self.logger.error(f"Exception during OCR: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def capture_and_extract_text(
+            self,
+            capture_region: bool = False,
+            region_x: int = 10,
+            region_y: int = 10,
+            region_width: int = 400,
+            region_height: int = 400,
+            save_path: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Captures a screenshot and runs OCR on it in one call.
+        OCR is pointed at the file the server just saved, so the image bytes are not sent back
+        to the server; they are only uploaded if the server reported no file path.
+
+        :param capture_region: If True, captures a specific region; otherwise, captures the entire screen.
+        :param region_x: X-coordinate of the top-left corner of the capture region.
+        :param region_y: Y-coordinate of the top-left corner of the capture region.
+        :param region_width: Width of the capture region.
+        :param region_height: Height of the capture region.
+        :param save_path: Optional path to save the captured image on the macOS machine.
+
+        :return:
+        Optional[dict]: None if the capture fails, otherwise the capture_screenshot() result plus:
+                - "extracted_text": str, or None if OCR fails
+
+        Example:
+            client = ScreenCaptureServiceClient(client_name="user")
+            client.connect()
+            result = client.capture_and_extract_text(capture_region=True, region_x=100, region_y=100)
+            if result and result["extracted_text"]:
+                print(f"Extracted text: {result['extracted_text']}")
+        """
+        screenshot = self.capture_screenshot(
+            capture_region=capture_region,
+            region_x=region_x,
+            region_y=region_y,
+            region_width=region_width,
+            region_height=region_height,
+            save_path=save_path
+        )
+        if not screenshot:
+            return None
+
+        if screenshot["file_path"]:
+            screenshot["extracted_text"] = self.extract_text_from_screenshot(file_path=screenshot["file_path"])
+        else:
+            screenshot["extracted_text"] = self.extract_text_from_screenshot(image_data=screenshot["image_data"])
+        return screenshot
@@ -13,12 +13,21 @@ Python convenience - All logic stays in familiar Python
 Easy extension - Add methods without touching server
 """
 
+import asyncio
+import functools
+import itertools
 import json
+import os
 import time
 import tempfile
-from typing import Dict, Any, Optional, List, Union, Tuple
-from pathlib import Path
+import textwrap
+import threading
+from collections import UserDict, UserList
+from typing import Dict, Any, Optional, List, Mapping, Sequence, Union, Tuple
 
+import grpc
+
+from grpc_client_sdk.core.file_utils import write_file_bytes
 from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
 from test_framework.utils import get_logger
 
@@ -29,6 +38,278 @@ try:
 except ImportError:
     PROTOBUF_AVAILABLE = False
 
+# get_page_info() info type name -> PageInfoRequest enum value
+_INFO_TYPE_MAP = {
+    "url": web_automation_service_pb2.URL,
+    "title": web_automation_service_pb2.TITLE,
+    "user_agent": web_automation_service_pb2.USER_AGENT,
+    "viewport_size": web_automation_service_pb2.VIEWPORT_SIZE,
+    "scroll_position": web_automation_service_pb2.SCROLL_POSITION,
+    "performance_metrics": web_automation_service_pb2.PERFORMANCE_METRICS
+} if PROTOBUF_AVAILABLE else {}
+
+# orjson is optional; its decode errors subclass ValueError like json's, so callers catch ValueError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Scripts at least this long are sent gzip-compressed; below it compression costs more than it saves
+_COMPRESS_SCRIPT_MIN_CHARS = 4096
+
+
+class _LazyList(UserList):
+    """
+    List wrapper over a protobuf repeated field, copied into a real list on first access.
+
+    Most callers only check "success", so the copy is skipped unless the list is used.
+    """
+
+    def __init__(self, source: Sequence = ()):
+        self._source = source
+
+    @functools.cached_property
+    def data(self) -> list:
+        return list(self._source)
+
+
+class _LazyDict(UserDict):
+    """Dict wrapper over a protobuf map field, copied into a real dict on first access."""
+
+    def __init__(self, source: Mapping = ()):
+        self._source = source
+
+    @functools.cached_property
+    def data(self) -> dict:
+        return dict(self._source)
+
+
+@functools.lru_cache(maxsize=None)
+def _static_script_request(script: str) -> object:
+    """
+    Prebuilt ScriptRequest for a constant script with execute_script's default options.
+
+    Shared across clients and threads, so it is only ever passed to the stub, never mutated.
+    """
+    return web_automation_service_pb2.ScriptRequest(script=script, timeout_ms=30000, return_value=True)
+
+
+# =============================================================================
+# String Literal Escaping
+# =============================================================================
+
+# Escapes values placed inside single-quoted JS string literals in the templates below.
+# U+2028/U+2029 end a line inside a string literal in pre-ES2019 engines.
+_JS_STR_ESC = str.maketrans({
+    "\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r",
+    "\u2028": "\\u2028", "\u2029": "\\u2029"
+})
+
+# Escapes values placed inside double-quoted AppleScript string literals
+_AS_STR_ESC = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+
+# =============================================================================
+# JavaScript Templates
+# =============================================================================
+
+# Built once at import; each call only fills in its values with %-formatting.
+# Dedented so the per-call script sent to the server carries no source indentation.
+
+_CLICK_ELEMENT_JS = textwrap.dedent("""
+    (function() {
+        const startTime = Date.now();
+        const timeout = %(timeout)d;
+
+        function tryClick() {
+            const element = document.querySelector('%(selector)s');
+            if (element) {
+                element.click();
+                return {success: true, message: 'Element clicked successfully'};
+            } else if (Date.now() - startTime < timeout) {
+                setTimeout(tryClick, 100);
+                return null;
+            } else {
+                return {success: false, message: 'Element not found within timeout'};
+            }
+        }
+
+        return tryClick();
+    })();
+""").strip()
+
+_TYPE_TEXT_JS = textwrap.dedent("""
+    (function() {
+        const element = document.querySelector('%(selector)s');
+        if (element) {
+            element.focus();%(clear)s
+            element.value = '%(text)s';
+
+            // Trigger input events
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+
+            return {success: true, message: 'Text typed successfully'};
+        } else {
+            return {success: false, message: 'Element not found'};
+        }
+    })();
+""").strip()
+
+# type_text() variants, keyed by clear_first
+_TYPE_TEXT_JS_BY_CLEAR = {
+    True: _TYPE_TEXT_JS.replace("%(clear)s", "\n        element.value = '';"),
+    False: _TYPE_TEXT_JS.replace("%(clear)s", ""),
+}
+
+_WAIT_FOR_ELEMENT_JS = textwrap.dedent("""
+    (function() {
+        return new Promise((resolve) => {
+            const startTime = Date.now();
+            const timeout = %(timeout)d;
+
+            function check() {
+                const element = document.querySelector('%(selector)s');
+                if (element) {
+                    resolve({success: true, message: 'Element found'});
+                } else if (Date.now() - startTime < timeout) {
+                    setTimeout(check, 100);
+                } else {
+                    resolve({success: false, message: 'Element not found within timeout'});
+                }
+            }
+
+            check();
+        });
+    })();
+""").strip()
+
+_GET_ELEMENT_TEXT_JS = textwrap.dedent("""
+    (function() {
+        const element = document.querySelector('%(selector)s');
+        if (element) {
+            return {
+                success: true,
+                text: element.textContent || element.innerText,
+                message: 'Text retrieved successfully'
+            };
+        } else {
+            return {success: false, message: 'Element not found'};
+        }
+    })();
+""").strip()
+
+_SCROLL_TO_ELEMENT_JS = textwrap.dedent("""
+    (function() {
+        const element = document.querySelector('%(selector)s');
+        if (element) {
+            element.scrollIntoView({behavior: 'smooth', block: 'center'});
+            return {success: true, message: 'Scrolled to element'};
+        } else {
+            return {success: false, message: 'Element not found'};
+        }
+    })();
+""").strip()
+
+_WAIT_FOR_PAGE_LOAD_JS = textwrap.dedent("""
+    (function() {
+        if (document.readyState === 'complete') {
+            return {success: true, message: 'Page already loaded'};
+        }
+
+        return new Promise((resolve) => {
+            window.addEventListener('load', () => {
+                resolve({success: true, message: 'Page loaded successfully'});
+            });
+
+            // Timeout after 30 seconds
+            setTimeout(() => {
+                resolve({success: false, message: 'Page load timeout'});
+            }, 30000);
+        });
+    })();
+""").strip()
+
+# click_coordinates_macos() click type -> AppleScript, %-formatted with (x, y)
+_MACOS_CLICK_SCRIPTS = {
+    "single": 'tell application "System Events" to click at {%s, %s}',
+    "double": 'tell application "System Events" to double click at {%s, %s}',
+    "right": 'tell application "System Events" to right click at {%s, %s}'
+}
+
+_SYSTEM_INFO_SCRIPT = "uname -a && sw_vers && whoami && hostname"
+
+# Workflow actions that run entirely in page JS and can share one ExecuteScript call.
+# navigate is excluded: it unloads the page, and the rest of the bundle with it.
+_BUNDLED_ACTIONS = frozenset(("click", "type", "wait"))
+
+# Runs a list of click/type/wait steps in one script and returns their results as a JSON array.
+# %(steps)s is a JSON array, so selectors and text need no further escaping.
+_WORKFLOW_BUNDLE_JS = textwrap.dedent("""
+    (async function() {
+        const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+        async function waitFor(selector, timeout) {
+            const startTime = Date.now();
+            for (;;) {
+                const element = document.querySelector(selector);
+                if (element || Date.now() - startTime >= timeout) {
+                    return element;
+                }
+                await sleep(100);
+            }
+        }
+
+        const actions = {
+            click: async (step) => {
+                const element = await waitFor(step.selector, step.timeout);
+                if (!element) {
+                    return {success: false, message: 'Element not found within timeout'};
+                }
+                element.click();
+                return {success: true, message: 'Element clicked successfully'};
+            },
+            type: async (step) => {
+                const element = document.querySelector(step.selector);
+                if (!element) {
+                    return {success: false, message: 'Element not found'};
+                }
+                element.focus();
+                element.value = step.text;
+                element.dispatchEvent(new Event('input', {bubbles: true}));
+                element.dispatchEvent(new Event('change', {bubbles: true}));
+                return {success: true, message: 'Text typed successfully'};
+            },
+            wait: async (step) => {
+                if (await waitFor(step.selector, step.timeout)) {
+                    return {success: true, message: 'Element found'};
+                }
+                return {success: false, message: 'Element not found within timeout'};
+            }
+        };
+
+        const results = [];
+        for (const step of %(steps)s) {
+            const startTime = Date.now();
+            let result;
+            try {
+                result = await actions[step.action](step);
+            } catch (e) {
+                result = {success: false, message: String(e)};
+            }
+            result.execution_time_ms = Date.now() - startTime;
+            results.push(result);
+            if (!result.success && step.stop) {
+                break;
+            }
+            if (step.delay) {
+                await sleep(step.delay);
+            }
+        }
+        return JSON.stringify(results);
+    })();
+""").strip()
+
 
 class WebAutomationClient:
     """
@@ -61,21 +342,26 @@ class WebAutomationClient:
         self.logger = logger or get_logger(f"WebAutomationClient[{client_name}]")
         self.stub = None
         self._connected = False
+        # Per-thread request messages, cleared and refilled on each call instead of rebuilt
+        self._requests = threading.local()
+        # Screenshot directories already created by this client, so repeat saves skip the mkdir syscall
+        self._created_dirs = set()
 
     def connect(self) -> None:
         """Establish connection to the Web Automation gRPC service"""
         try:
             if PROTOBUF_AVAILABLE:
-                self.stub = GrpcClientManager.get_stub(
+                # Pooled so concurrent workflows are not serialized on one HTTP/2 connection
+                self.stub = GrpcClientManager.get_pooled_stub(
                     self.client_name,
                     web_automation_service_pb2_grpc.WebAutomationServiceStub
                 )
-                self.logger.info(f"Web Automation Service connected for client '{self.client_name}'")
+                self.logger.info("Web Automation Service connected for client '%s'", self.client_name)
                 self._connected = True
             else:
                 raise RuntimeError("Web Automation protobuf modules not available")
         except Exception as e:
-            self.logger.error(f"Failed to connect Web Automation Service: {e}")
+            self.logger.error("Failed to connect Web Automation Service: %s", e)
             raise RuntimeError(f"Web Automation Service connection failed: {e}")
 
     def is_connected(self) -> bool:
@@ -88,6 +374,40 @@ class WebAutomationClient:
             self.logger.warning("Web Automation Service not connected, attempting to reconnect...")
             self.connect()
 
+    def _invoke(self, method: str, request: object, **kwargs) -> object:
+        """
+        Call a stub method, retrying once if the server is UNAVAILABLE
+
+        The pooled stub sends the retry over the next channel. If that also fails the client
+        is marked disconnected, so the next call reconnects first.
+        """
+        try:
+            return getattr(self.stub, method)(request, **kwargs)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNAVAILABLE:
+                raise
+            self.logger.warning("%s unavailable, retrying once", method)
+
+        try:
+            return getattr(self.stub, method)(request, **kwargs)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:
+                self._connected = False
+            raise
+
+    def _reused_request(self, name: str, message_cls: type) -> object:
+        """Return this thread's cleared request message for name, creating it on first use.
+
+        Safe to reuse because the unary stub call serializes the request before returning.
+        """
+        request = getattr(self._requests, name, None)
+        if request is None:
+            request = message_cls()
+            setattr(self._requests, name, request)
+        else:
+            request.Clear()
+        return request
+
     # =============================================================================
     # Core Low-Level Methods (Direct Server Communication)
     # =============================================================================
@@ -104,49 +424,75 @@ class WebAutomationClient:
             return_value: Whether to return the script result
             
         Returns:
-            Dict with success, message, result_value, execution_time_ms, console_output
+            Dict with success, message, result_value, execution_time_ms, console_output, metadata.
+            console_output and metadata behave as a list and a dict; the response fields are
+            copied into them on first access, so use list()/dict() for json.dumps().
+            Failed calls also carry status_code, the gRPC status name ("" if no RPC status)
         """
         self._ensure_connected()
 
         try:
-            request = web_automation_service_pb2.ScriptRequest(
-                script=script,
-                target_user=target_user,
-                timeout_ms=timeout_ms,
-                return_value=return_value
-            )
+            request = self._reused_request("script", web_automation_service_pb2.ScriptRequest)
+            request.script = script
+            request.target_user = target_user
+            request.timeout_ms = timeout_ms
+            request.return_value = return_value
+        except Exception as e:
+            return self._script_error(str(e))
+
+        return self._send_script_request(request, compress=len(script) >= _COMPRESS_SCRIPT_MIN_CHARS)
 
-            response = self.stub.ExecuteScript(request)
+    def _execute_static_script(self, script: str) -> Dict[str, Any]:
+        """Execute a constant script with default options, reusing its prebuilt request"""
+        self._ensure_connected()
+        return self._send_script_request(_static_script_request(script))
+
+    def _send_script_request(self, request: object, compress: bool = False) -> Dict[str, Any]:
+        """Send a filled ScriptRequest and convert the response to the execute_script result dict"""
+        try:
+            if compress:
+                response = self._invoke("ExecuteScript", request, compression=grpc.Compression.Gzip)
+            else:
+                response = self._invoke("ExecuteScript", request)
 
             result = {
                 "success": response.success,
                 "message": response.message,
                 "result_value": response.result_value,
                 "execution_time_ms": response.execution_time_ms,
-                "console_output": list(response.console_output),
-                "metadata": dict(response.metadata)
+                # Copied from the response on first access: most callers only check success
+                "console_output": _LazyList(response.console_output),
+                "metadata": _LazyDict(response.metadata)
             }
 
             if response.success:
-                self.logger.debug(f"Script executed successfully in {response.execution_time_ms}ms")
+                self.logger.debug("Script executed successfully in %dms", response.execution_time_ms)
             else:
-                self.logger.warning(f"Script execution failed: {response.message}")
+                self.logger.warning("Script execution failed: %s", response.message)
 
             return result
 
+        except grpc.RpcError as e:
+            return self._script_error(f"{e.code().name}: {e.details()}", e.code().name)
         except Exception as e:
-            self.logger.error(f"Execute script failed: {e}")
-            return {
-                "success": False,
-                "message": str(e),
-                "result_value": "",
-                "execution_time_ms": 0,
-                "console_output": [],
-                "metadata": {}
-            }
+            return self._script_error(str(e))
+
+    def _script_error(self, message: str, status_code: str = "") -> Dict[str, Any]:
+        """Log a failed script execution and build its result dict"""
+        self.logger.error("Execute script failed: %s", message)
+        return {
+            "success": False,
+            "message": message,
+            "status_code": status_code,
+            "result_value": "",
+            "execution_time_ms": 0,
+            "console_output": _LazyList(),
+            "metadata": _LazyDict()
+        }
 
     def take_screenshot(self, target_user: str = "", region: Optional[Tuple[int, int, int, int]] = None,
-                       format: str = "png", save_path: Optional[str] = None) -> Dict[str, Any]:
+                       format: str = "png", save_path: Optional[str] = None,
+                       return_bytes: bool = True) -> Dict[str, Any]:
         """
         Take screenshot using the server
         
@@ -155,28 +501,32 @@ class WebAutomationClient:
             region: Optional region (x, y, width, height)
             format: Image format (png, jpeg)
             save_path: Optional path to save screenshot
+            return_bytes: Include image_data in the result (default True). Pass False together
+                with save_path to write the image to disk without also keeping it in the result
             
         Returns:
-            Dict with success, message, image_data, width, height, file_path (if saved)
+            Dict with success, message, image_data (b"" if not returned), width, height, file_path (if saved);
+            status_code (gRPC status name) when the RPC failed
         """
         self._ensure_connected()
 
         try:
-            request = web_automation_service_pb2.ScreenshotRequest(
-                target_user=target_user,
-                format=format
-            )
+            request = self._reused_request("screenshot", web_automation_service_pb2.ScreenshotRequest)
+            request.target_user = target_user
+            request.format = format
 
             if region:
                 request.region.x, request.region.y = region[0], region[1]
                 request.region.width, request.region.height = region[2], region[3]
 
-            response = self.stub.TakeScreenshot(request)
+            response = self._invoke("TakeScreenshot", request)
+            # Read the payload once: every access to a bytes field makes a new copy of it
+            image_data = response.image_data
 
             result = {
                 "success": response.success,
                 "message": response.message,
-                "image_data": response.image_data,
+                "image_data": image_data if return_bytes else b"",
                 "width": response.width,
                 "height": response.height,
                 "format": response.format,
@@ -186,20 +536,34 @@ class WebAutomationClient:
             }
 
             # Save to file if requested
-            if response.success and save_path and response.image_data:
-                save_path = Path(save_path)
-                save_path.parent.mkdir(parents=True, exist_ok=True)
+            if response.success and save_path and image_data:
+                save_path = os.fspath(save_path)
+                parent = os.path.dirname(save_path)
+                if parent not in self._created_dirs:
+                    if parent:
+                        os.makedirs(parent, exist_ok=True)
+                    self._created_dirs.add(parent)
                 
-                with open(save_path, 'wb') as f:
-                    f.write(response.image_data)
+                write_file_bytes(save_path, image_data)
                 
-                result["file_path"] = str(save_path)
-                self.logger.info(f"Screenshot saved to: {save_path}")
+                result["file_path"] = save_path
+                self.logger.info("Screenshot saved to: %s", save_path)
 
             return result
 
+        except grpc.RpcError as e:
+            self.logger.error("Take screenshot failed: %s: %s", e.code().name, e.details())
+            return {
+                "success": False,
+                "message": f"{e.code().name}: {e.details()}",
+                "status_code": e.code().name,
+                "image_data": b"",
+                "width": 0,
+                "height": 0,
+                "execution_time_ms": 0
+            }
         except Exception as e:
-            self.logger.error(f"Take screenshot failed: {e}")
+            self.logger.error("Take screenshot failed: %s", e)
             return {
                 "success": False,
                 "message": str(e),
@@ -219,55 +583,61 @@ class WebAutomationClient:
             target_user: Target user for agent routing
             
         Returns:
-            Dict with success, message, page_info, structured_data
+            Dict with success, message, page_info, structured_data.
+            page_info behaves as a dict, copied from the response field on first access; use
+            dict() for json.dumps(). status_code (gRPC status name) is set when the RPC failed
         """
         self._ensure_connected()
 
         try:
-            request = web_automation_service_pb2.PageInfoRequest(
-                target_user=target_user
-            )
+            request = self._reused_request("page_info", web_automation_service_pb2.PageInfoRequest)
+            request.target_user = target_user
 
             # Map string info types to protobuf enum values
             if info_types:
-                type_mapping = {
-                    "url": web_automation_service_pb2.URL,
-                    "title": web_automation_service_pb2.TITLE,
-                    "user_agent": web_automation_service_pb2.USER_AGENT,
-                    "viewport_size": web_automation_service_pb2.VIEWPORT_SIZE,
-                    "scroll_position": web_automation_service_pb2.SCROLL_POSITION,
-                    "performance_metrics": web_automation_service_pb2.PERFORMANCE_METRICS
-                }
-                
-                for info_type in info_types:
-                    if info_type in type_mapping:
-                        request.info_types.append(type_mapping[info_type])
+                # One extend call instead of an append per type; unknown names are skipped
+                request.info_types.extend(
+                    enum_value for info_type in info_types
+                    if (enum_value := _INFO_TYPE_MAP.get(info_type)) is not None
+                )
 
-            response = self.stub.GetPageInfo(request)
+            response = self._invoke("GetPageInfo", request)
 
             result = {
                 "success": response.success,
                 "message": response.message,
-                "page_info": dict(response.page_info),
+                "page_info": _LazyDict(response.page_info),
                 "structured_data": {},
                 "execution_time_ms": response.execution_time_ms
             }
 
-            # Process structured data
+            # Process structured data, keeping the raw text for entries that are not valid JSON
+            structured_data = result["structured_data"]
             for key, data in response.structured_data.items():
+                json_data = data.json_data
                 try:
-                    result["structured_data"][key] = json.loads(data.json_data)
-                except:
-                    result["structured_data"][key] = data.json_data
+                    structured_data[key] = _json_loads(json_data)
+                except ValueError:
+                    structured_data[key] = json_data
 
             return result
 
+        except grpc.RpcError as e:
+            self.logger.error("Get page info failed: %s: %s", e.code().name, e.details())
+            return {
+                "success": False,
+                "message": f"{e.code().name}: {e.details()}",
+                "status_code": e.code().name,
+                "page_info": _LazyDict(),
+                "structured_data": {},
+                "execution_time_ms": 0
+            }
         except Exception as e:
-            self.logger.error(f"Get page info failed: {e}")
+            self.logger.error("Get page info failed: %s", e)
             return {
                 "success": False,
                 "message": str(e),
-                "page_info": {},
+                "page_info": _LazyDict(),
                 "structured_data": {},
                 "execution_time_ms": 0
             }
@@ -278,137 +648,39 @@ class WebAutomationClient:
 
     def navigate_to_url(self, url: str) -> Dict[str, Any]:
         """Navigate to a URL by generating JavaScript"""
-        script = f"window.location.href = '{url}';"
+        script = f"window.location.href = '{url.translate(_JS_STR_ESC)}';"
         return self.execute_script(script)
 
     def click_element(self, selector: str, wait_timeout: int = 5000) -> Dict[str, Any]:
         """Click an element by generating JavaScript with wait logic"""
-        script = f"""
-        (function() {{
-            const startTime = Date.now();
-            const timeout = {wait_timeout};
-            
-            function tryClick() {{
-                const element = document.querySelector('{selector}');
-                if (element) {{
-                    element.click();
-                    return {{success: true, message: 'Element clicked successfully'}};
-                }} else if (Date.now() - startTime < timeout) {{
-                    setTimeout(tryClick, 100);
-                    return null;
-                }} else {{
-                    return {{success: false, message: 'Element not found within timeout'}};
-                }}
-            }}
-            
-            return tryClick();
-        }})();
-        """
+        script = _CLICK_ELEMENT_JS % {"selector": selector.translate(_JS_STR_ESC), "timeout": wait_timeout}
         return self.execute_script(script)
 
     def type_text(self, selector: str, text: str, clear_first: bool = True) -> Dict[str, Any]:
         """Type text into an element by generating JavaScript"""
-        clear_script = "element.value = '';" if clear_first else ""
-        
-        script = f"""
-        (function() {{
-            const element = document.querySelector('{selector}');
-            if (element) {{
-                element.focus();
-                {clear_script}
-                element.value = '{text}';
-                
-                // Trigger input events
-                element.dispatchEvent(new Event('input', {{bubbles: true}}));
-                element.dispatchEvent(new Event('change', {{bubbles: true}}));
-                
-                return {{success: true, message: 'Text typed successfully'}};
-            }} else {{
-                return {{success: false, message: 'Element not found'}};
-            }}
-        }})();
-        """
+        script = _TYPE_TEXT_JS_BY_CLEAR[bool(clear_first)] % {
+            "selector": selector.translate(_JS_STR_ESC), "text": text.translate(_JS_STR_ESC)
+        }
         return self.execute_script(script)
 
     def wait_for_element(self, selector: str, timeout: int = 10000) -> Dict[str, Any]:
         """Wait for an element to appear by generating JavaScript"""
-        script = f"""
-        (function() {{
-            return new Promise((resolve) => {{
-                const startTime = Date.now();
-                const timeout = {timeout};
-                
-                function check() {{
-                    const element = document.querySelector('{selector}');
-                    if (element) {{
-                        resolve({{success: true, message: 'Element found'}});
-                    }} else if (Date.now() - startTime < timeout) {{
-                        setTimeout(check, 100);
-                    }} else {{
-                        resolve({{success: false, message: 'Element not found within timeout'}});
-                    }}
-                }}
-                
-                check();
-            }});
-        }})();
-        """
+        script = _WAIT_FOR_ELEMENT_JS % {"selector": selector.translate(_JS_STR_ESC), "timeout": timeout}
         return self.execute_script(script)
 
     def get_element_text(self, selector: str) -> Dict[str, Any]:
         """Get text content of an element"""
-        script = f"""
-        (function() {{
-            const element = document.querySelector('{selector}');
-            if (element) {{
-                return {{
-                    success: true, 
-                    text: element.textContent || element.innerText,
-                    message: 'Text retrieved successfully'
-                }};
-            }} else {{
-                return {{success: false, message: 'Element not found'}};
-            }}
-        }})();
-        """
+        script = _GET_ELEMENT_TEXT_JS % {"selector": selector.translate(_JS_STR_ESC)}
         return self.execute_script(script)
 
     def scroll_to_element(self, selector: str) -> Dict[str, Any]:
         """Scroll to an element"""
-        script = f"""
-        (function() {{
-            const element = document.querySelector('{selector}');
-            if (element) {{
-                element.scrollIntoView({{behavior: 'smooth', block: 'center'}});
-                return {{success: true, message: 'Scrolled to element'}};
-            }} else {{
-                return {{success: false, message: 'Element not found'}};
-            }}
-        }})();
-        """
+        script = _SCROLL_TO_ELEMENT_JS % {"selector": selector.translate(_JS_STR_ESC)}
         return self.execute_script(script)
 
     def wait_for_page_load(self) -> Dict[str, Any]:
         """Wait for page to finish loading"""
-        script = """
-        (function() {
-            if (document.readyState === 'complete') {
-                return {success: true, message: 'Page already loaded'};
-            }
-            
-            return new Promise((resolve) => {
-                window.addEventListener('load', () => {
-                    resolve({success: true, message: 'Page loaded successfully'});
-                });
-                
-                // Timeout after 30 seconds
-                setTimeout(() => {
-                    resolve({success: false, message: 'Page load timeout'});
-                }, 30000);
-            });
-        })();
-        """
-        return self.execute_script(script)
+        return self._execute_static_script(_WAIT_FOR_PAGE_LOAD_JS)
 
     # =============================================================================
     # High-Level macOS Automation (AppleScript Generation)
@@ -416,22 +688,12 @@ class WebAutomationClient:
 
     def click_coordinates_macos(self, x: int, y: int, click_type: str = "single") -> Dict[str, Any]:
         """Click at coordinates on macOS using AppleScript"""
-        click_commands = {
-            "single": f"click at {{{x}, {y}}}",
-            "double": f"double click at {{{x}, {y}}}",
-            "right": f"right click at {{{x}, {y}}}"
-        }
-        
-        command = click_commands.get(click_type, click_commands["single"])
-        script = f'tell application "System Events" to {command}'
-        
-        return self.execute_script(script)
+        command = _MACOS_CLICK_SCRIPTS.get(click_type, _MACOS_CLICK_SCRIPTS["single"])
+        return self.execute_script(command % (x, y))
 
     def type_text_macos(self, text: str) -> Dict[str, Any]:
         """Type text on macOS using AppleScript"""
-        # Escape quotes in the text
-        escaped_text = text.replace('"', '\\"')
-        script = f'tell application "System Events" to keystroke "{escaped_text}"'
+        script = f'tell application "System Events" to keystroke "{text.translate(_AS_STR_ESC)}"'
         
         return self.execute_script(script)
 
@@ -446,14 +708,14 @@ class WebAutomationClient:
 
     def open_application_macos(self, app_name: str) -> Dict[str, Any]:
         """Open an application on macOS using AppleScript"""
-        script = f'tell application "{app_name}" to activate'
+        script = f'tell application "{app_name.translate(_AS_STR_ESC)}" to activate'
         return self.execute_script(script)
 
     def get_window_info_macos(self, app_name: str) -> Dict[str, Any]:
         """Get window information for an app on macOS"""
         script = f"""
         tell application "System Events"
-            tell application process "{app_name}"
+            tell application process "{app_name.translate(_AS_STR_ESC)}"
                 try
                     set frontWindow to front window
                     set windowTitle to title of frontWindow
@@ -486,8 +748,7 @@ class WebAutomationClient:
 
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information using shell commands"""
-        script = "uname -a && sw_vers && whoami && hostname"
-        return self.execute_script(script)
+        return self._execute_static_script(_SYSTEM_INFO_SCRIPT)
 
     def check_process(self, process_name: str) -> Dict[str, Any]:
         """Check if a process is running"""
@@ -498,37 +759,179 @@ class WebAutomationClient:
     # Workflow and Batch Operations
     # =============================================================================
 
-    def execute_workflow(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Execute a sequence of operations as a workflow"""
+    def _do_navigate(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.navigate_to_url(operation["url"])
+
+    def _do_click(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.click_element(operation["selector"])
+
+    def _do_type(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.type_text(operation["selector"], operation["text"])
+
+    def _do_wait(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.wait_for_element(operation["selector"], operation.get("timeout", 10000))
+
+    def _do_screenshot(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.take_screenshot(save_path=operation.get("save_path"))
+
+    def _do_script(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.execute_script(operation["script"])
+
+    def _do_click_coords(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        return self.click_coordinates_macos(operation["x"], operation["y"])
+
+    def _do_delay(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        # The wait itself is the operation's delay_after, applied by the workflow loop
+        return {"success": True, "message": f"Waited {operation.get('delay_after', 0)}ms"}
+
+    # Workflow operation "action" -> handler
+    _OPERATION_DISPATCH = {
+        "navigate": _do_navigate,
+        "click": _do_click,
+        "type": _do_type,
+        "wait": _do_wait,
+        "screenshot": _do_screenshot,
+        "script": _do_script,
+        "click_coords": _do_click_coords,
+        "delay": _do_delay,
+    }
+
+    def _execute_operation(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single workflow operation and return its result"""
+        action = operation.get("action")
+        handler = self._OPERATION_DISPATCH.get(action)
+        if handler is None:
+            return {"success": False, "message": f"Unknown action: {action}"}
+        return handler(self, operation)
+
+    @staticmethod
+    def _workflow_result(operations: List[Dict[str, Any]], results: List[Dict[str, Any]],
+                         failed_count: int) -> Dict[str, Any]:
+        """Summarize operation results into the workflow result dict, from the loop's failure count"""
+        return {
+            "overall_success": failed_count == 0,
+            "operation_count": len(operations),
+            "successful_operations": len(results) - failed_count,
+            "failed_operations": failed_count,
+            "operation_results": results
+        }
+
+    def _bundle_step(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate a click/type/wait operation into a step of _WORKFLOW_BUNDLE_JS"""
+        action = operation["action"]
+        step = {
+            "action": action,
+            "selector": operation["selector"],
+            "stop": operation.get("stop_on_error", True),
+            "delay": operation.get("delay_after", 0)
+        }
+        if action == "click":
+            step["timeout"] = 5000
+        elif action == "wait":
+            step["timeout"] = operation.get("timeout", 10000)
+        else:
+            step["text"] = operation["text"]
+        return step
+
+    @staticmethod
+    def _bundle_failure(operations: List[Dict[str, Any]], message: str) -> List[Dict[str, Any]]:
+        """
+        Attribute a failure of a whole bundle to each of its operations, up to and including the
+        first one with stop_on_error, as if they had run one by one
+        """
+        results = []
+        for operation in operations:
+            results.append({"success": False, "message": message, "result_value": "", "execution_time_ms": 0})
+            if operation.get("stop_on_error", True):
+                break
+        return results
+
+    def _execute_js_bundle(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run consecutive click/type/wait operations in a single ExecuteScript call
+
+        Returns one result per executed operation; the list is shorter than operations when a
+        step failed with stop_on_error. If the bundle as a whole fails, the error is reported
+        for each operation through _bundle_failure().
+        """
+        steps = json.dumps([self._bundle_step(op) for op in operations])
+        response = self.execute_script(_WORKFLOW_BUNDLE_JS % {"steps": steps})
+        if not response["success"]:
+            return self._bundle_failure(operations, response["message"])
+
+        try:
+            step_results = _json_loads(response["result_value"])
+            # Servers that JSON-encode the returned value wrap our JSON string once more
+            if isinstance(step_results, str):
+                step_results = _json_loads(step_results)
+        except (TypeError, ValueError):
+            step_results = None
+        if not isinstance(step_results, list):
+            # The steps may already have run, so they are not retried one by one
+            return self._bundle_failure(
+                operations, f"Workflow bundle returned no step results: {response['result_value']!r}"
+            )
+
+        return [
+            {
+                "success": bool(step.get("success")),
+                "message": step.get("message", ""),
+                "result_value": "",
+                "execution_time_ms": step.get("execution_time_ms", 0)
+            }
+            for step in step_results
+        ]
+
+    def execute_workflow(self, operations: List[Dict[str, Any]], bundle_js: bool = False) -> Dict[str, Any]:
+        """
+        Execute a sequence of operations as a workflow
+
+        Args:
+            operations: Workflow operations
+            bundle_js: Opt in to sending each run of consecutive click/type/wait operations as
+                one ExecuteScript call instead of one call per operation. Their delay_after then
+                runs in the browser between steps, timed by the page clock, rather than as
+                a Python sleep; this includes a lone click/type/wait that has a delay_after
+
+        Returns:
+            Dict with overall_success, operation counts and per-operation results
+        """
         results = []
-        overall_success = True
+        failed_count = 0
+        index = 0
         
-        for i, operation in enumerate(operations):
+        while index < len(operations):
+            operation = operations[index]
+
+            if bundle_js:
+                end = index
+                while end < len(operations) and operations[end].get("action") in _BUNDLED_ACTIONS:
+                    end += 1
+                # A lone JS step still goes through the bundle when it has a delay to run in the page
+                if end - index > 1 or (end > index and operation.get("delay_after")):
+                    batch = operations[index:end]
+                    try:
+                        batch_results = self._execute_js_bundle(batch)
+                    except Exception as e:
+                        batch_results = self._bundle_failure(batch, str(e))
+                    results.extend(batch_results)
+
+                    failed = [op for op, result in zip(batch, batch_results) if not result["success"]]
+                    if failed:
+                        failed_count += len(failed)
+                        # Results stop at the first failed operation with stop_on_error
+                        if any(op.get("stop_on_error", True) for op in failed):
+                            break
+                    index = end
+                    continue
+
+            index += 1
             try:
-                action = operation.get("action")
-                result = None
-                
-                if action == "navigate":
-                    result = self.navigate_to_url(operation["url"])
-                elif action == "click":
-                    result = self.click_element(operation["selector"])
-                elif action == "type":
-                    result = self.type_text(operation["selector"], operation["text"])
-                elif action == "wait":
-                    result = self.wait_for_element(operation["selector"], operation.get("timeout", 10000))
-                elif action == "screenshot":
-                    result = self.take_screenshot(save_path=operation.get("save_path"))
-                elif action == "script":
-                    result = self.execute_script(operation["script"])
-                elif action == "click_coords":
-                    result = self.click_coordinates_macos(operation["x"], operation["y"])
-                else:
-                    result = {"success": False, "message": f"Unknown action: {action}"}
-                
+                result = self._execute_operation(operation)
                 results.append(result)
                 
                 if not result.get("success"):
-                    overall_success = False
+                    failed_count += 1
                     if operation.get("stop_on_error", True):
                         break
                         
@@ -539,18 +942,55 @@ class WebAutomationClient:
             except Exception as e:
                 result = {"success": False, "message": str(e)}
                 results.append(result)
-                overall_success = False
+                failed_count += 1
                 
                 if operation.get("stop_on_error", True):
                     break
         
-        return {
-            "overall_success": overall_success,
-            "operation_count": len(operations),
-            "successful_operations": sum(1 for r in results if r.get("success")),
-            "failed_operations": sum(1 for r in results if not r.get("success")),
-            "operation_results": results
-        }
+        return self._workflow_result(operations, results, failed_count)
+
+    async def _execute_operation_async(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one operation in the default executor, then await its delay_after"""
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, functools.partial(self._execute_operation, operation))
+        except Exception as e:
+            return {"success": False, "message": str(e)}
+        if operation.get("delay_after"):
+            await asyncio.sleep(operation["delay_after"] / 1000.0)
+        return result
+
+    async def execute_workflow_async(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Async version of execute_workflow that overlaps independent operations
+
+        Consecutive operations with the same "parallel_group" value run concurrently with
+        asyncio.gather; operations without one run in order as before. Each RPC runs in the
+        default executor, spread over the client's pooled channels, and delay_after waits
+        with asyncio.sleep instead of blocking a thread.
+
+        Args:
+            operations: Workflow operations, optionally tagged with "parallel_group"
+
+        Returns:
+            Same dict as execute_workflow; operation_results keep the input order
+        """
+        results = []
+        failed_count = 0
+
+        for _, group in itertools.groupby(
+                enumerate(operations), key=lambda item: item[1].get("parallel_group", (None, item[0]))):
+            group = [operation for _, operation in group]
+            group_results = await asyncio.gather(*(self._execute_operation_async(op) for op in group))
+            results.extend(group_results)
+
+            failed = [op for op, result in zip(group, group_results) if not result.get("success")]
+            if failed:
+                failed_count += len(failed)
+                if any(op.get("stop_on_error", True) for op in failed):
+                    break
+
+        return self._workflow_result(operations, results, failed_count)
 
     # =============================================================================
     # Context Manager Support
@@ -566,10 +1006,16 @@ class WebAutomationClient:
         self.disconnect()
 
     def disconnect(self):
-        """Disconnect from the service"""
+        """
+        Disconnect from the service
+
+        Only drops this instance's stub. The pooled channels stay open in GrpcClientManager and
+        are reused by the next connect() for the same client name; GrpcClientManager.remove_client()
+        or clear() closes them.
+        """
         self._connected = False
         self.stub = None
-        self.logger.info(f"Web Automation Service disconnected for client '{self.client_name}'")
+        self.logger.info("Web Automation Service disconnected for client '%s'", self.client_name)
 
 
 # =============================================================================
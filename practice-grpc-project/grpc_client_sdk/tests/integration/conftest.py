@@ -1,8 +1,14 @@
 import datetime
 import os
+from types import SimpleNamespace
 
 import pytest
 
+from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
+from grpc_client_sdk.services.apple_script_service_client import AppleScriptServiceClient
+from grpc_client_sdk.services.command_service_client import CommandServiceClient
+from grpc_client_sdk.services.connection_service_client import ConnectionServiceClient
+from grpc_client_sdk.services.file_transfer_service_client import FileTransferServiceClient
 from test_framework.utils import LoggerManager, set_test_case, get_logger
 from test_framework.utils.loaders.station_loader import StationLoader
 from test_framework.utils.logger_settings.logger_config import LoggerConfig
@@ -32,6 +38,30 @@ def setup(setup_logging):
     yield stations
 
 
+@pytest.fixture(scope="session")
+def root_clients(setup_logging):
+    """
+    Register the "root" gRPC client once per session and connect the root service clients.
+
+    Every test shares the one channel instead of repeating the connect handshake.
+    Attributes: applescript, connection, file_transfer, command.
+    """
+    target = StationLoader().get_station_endpoint("station1", "grpc")
+    # Two pooled channels are enough for the file-transfer tests' large downloads
+    GrpcClientManager.register_clients(name="root", target=target, pool_size=2)
+    assert GrpcClientManager.get_client("root") is not None, "Client should be registered and connected"
+
+    clients = SimpleNamespace(
+        applescript=AppleScriptServiceClient(client_name="root"),
+        connection=ConnectionServiceClient(client_name="root"),
+        file_transfer=FileTransferServiceClient(client_name="root"),
+        command=CommandServiceClient(client_name="root"),
+    )
+    for client in vars(clients).values():
+        client.connect()
+    yield clients
+
+
 @pytest.fixture(scope="function")
 def test_logger(request, setup_logging):
     """
@@ -1,45 +1,27 @@
-from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
-from grpc_client_sdk.services.apple_script_service_client import AppleScriptServiceClient
-
-
-def test_run_applescript_service(setup):
+def test_run_applescript_service(root_clients):
     """
     Test the AppleScriptServiceClient gRPC client.
     This test verifies the connection to the gRPC server and the execution of a simple AppleScript command.
     It checks if the client is registered and connected, and if the AppleScript command executes successfully.
 
-    :param setup: Fixture that sets up the gRPC server and client.
+    :param root_clients: Session fixture holding the connected root service clients.
     """
-    target = setup
-    GrpcClientManager.register_clients(name="root", target=target)
-
-    client = GrpcClientManager.get_client("root")
-    assert client is not None, "Client should be registered and connected"
-
-    script_client = AppleScriptServiceClient(client_name="root")
-    script_client.connect()
+    script_client = root_clients.applescript
 
     response = script_client.run_applescript(script='return "Hello from user"')
     assert response["success"]
     assert response["exit_code"] == 0
     assert "Hello from user" in response["stdout"]
 
-def test_stream_applescript_service(setup):
+def test_stream_applescript_service(root_clients):
     """
     Test the AppleScriptServiceClient gRPC client with streaming.
     This test verifies the connection to the gRPC server and the execution of a simple AppleScript command.
     It checks if the client is registered and connected, and if the AppleScript command executes successfully.
 
-    :param setup: Fixture that sets up the gRPC server and client.
+    :param root_clients: Session fixture holding the connected root service clients.
     """
-    target = setup
-    GrpcClientManager.register_clients(name="root", target=target)
-
-    client = GrpcClientManager.get_client("root")
-    assert client is not None, "Client should be registered and connected"
-
-    script_client = AppleScriptServiceClient(client_name="root")
-    script_client.connect()
+    script_client = root_clients.applescript
 
     response = script_client.stream_applescript(script='return "Hello from user"')
     assert response is not None, "Response should not be None"
@@ -1,27 +1,12 @@
-from grpc_client_sdk.core.grpc_client_manager import GrpcClientManager
-from grpc_client_sdk.services.connection_service_client import ConnectionServiceClient
-
-
-def test_get_server_info(setup):
+def test_get_server_info(root_clients):
     """
     Test the ConnectionServiceClient for retrieving server information.
     get_server_info() method is used to fetch system-level metadata such as hostname,
     OS version, uptime, available services, and IP address.
 
-    :param setup: Fixture that sets up the gRPC client and server.
+    :param root_clients: Session fixture holding the connected root service clients.
     """
-    # Register the client with the GrpcClientManager
-    target = setup
-    GrpcClientManager.register_clients(name="root", target=target)
-
-    # Get the registered client
-    client = GrpcClientManager.get_client("root")
-    assert client is not None, "Client should be registered and connected"
-    #
-    # # Create a CommandServiceClient instance
-    connection_client = ConnectionServiceClient(client_name="root")
-    # Connect to the gRPC server
-    connection_client.connect()
+    connection_client = root_clients.connection
 
     # Test if the client can retrieve server information
     server_info = connection_client.get_server_info()
@@ -44,26 +29,15 @@ def test_get_server_info(setup):
     )
 
 
-def test_get_logged_in_username(setup):
+def test_get_logged_in_username(root_clients):
     """
     Test the ConnectionServiceClient for retrieving the logged-in username.
     get_logged_in_username() method is used to fetch the current logged-in user
     via hostname resolution.
 
-    :param setup: Fixture that sets up the gRPC client and server.
+    :param root_clients: Session fixture holding the connected root service clients.
     """
-    # Register the client with the GrpcClientManager
-    target = setup
-    GrpcClientManager.register_clients(name="root", target=target)
-
-    # Get the registered client
-    client = GrpcClientManager.get_client("root")
-    assert client is not None, "Client should be registered and connected"
-
-    # Create a CommandServiceClient instance
-    connection_client = ConnectionServiceClient(client_name="root")
-    # Connect to the gRPC server
-    connection_client.connect()
+    connection_client = root_clients.connection
 
     # Test if the client can retrieve the logged-in username
     logged_in_username = connection_client.get_logged_in_username()
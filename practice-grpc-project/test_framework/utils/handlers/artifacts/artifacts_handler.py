@@ -1,5 +1,5 @@
 import os
-from typing import Union
+from typing import Iterable, Union
 
 from test_framework.utils import get_logger
 from test_framework.utils.logger_settings.logger_config import LoggerConfig
@@ -40,4 +40,35 @@ def save_to_artifacts(content: Union[bytes, str], filename: str, subfolder: str
         return file_path
     except Exception as e:
         logger.error(f"Failed to save file {filename}: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+def save_stream_to_artifacts(chunks: Iterable[bytes], filename: str, subfolder: str = "downloads") -> str:
+    """
+    Save a stream of byte chunks to the artifacts' directory.
+    Each chunk is written as it arrives, so the full content is never held in memory.
+
+    :param chunks: Iterable of bytes chunks, e.g. FileTransferServiceClient.download_file_stream()
+    :param filename: Name of the file to save
+    :param subfolder: Subfolder within artifacts directory (default: "downloads")
+    :return: str: Full path to the saved file
+    """
+
+    logger = get_logger("file_utils")
+
+    target_dir = os.path.join(LoggerConfig.ARTIFACTS_DIR, subfolder)
+    os.makedirs(target_dir, exist_ok=True)
+    file_path = os.path.join(target_dir, filename)
+
+    try:
+        size = 0
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+
+        logger.info(f"Saved {size} bytes to {file_path}")
+        return file_path
+    except Exception as e:
+        logger.error(f"Failed to save file {filename}: {e}")
+        raise
@@ -41,15 +41,24 @@ class LogExtractor:
             self._logged_timestamp_errors.add(timestamp_str)
         return datetime.min
 
+    @staticmethod
+    def _normalize_criteria(criteria: dict) -> List[Tuple[str, str]]:
+        """Stringify criteria values once, so per-entry checks only convert the entry's fields."""
+        return [(field_name, str(pattern)) for field_name, pattern in criteria.items()]
+
     def _matches_criteria(self, entry: LogEntry, **criteria) -> bool:
         """Check if entry matches field criteria."""
-        for field_name, pattern in criteria.items():
+        return self._matches_normalized(entry, self._normalize_criteria(criteria))
+
+    @staticmethod
+    def _matches_normalized(entry: LogEntry, normalized: List[Tuple[str, str]]) -> bool:
+        """Check if entry matches criteria prepared by _normalize_criteria."""
+        for field_name, pattern_str in normalized:
             if not hasattr(entry, field_name):
                 return False
 
             field_value = getattr(entry, field_name)
             field_str = str(field_value) if field_value is not None else ""
-            pattern_str = str(pattern)
 
             if pattern_str not in field_str.lower():
                 return False
@@ -136,7 +145,8 @@ class LogExtractor:
         Usage:
             filtered = extractor.filter_entries(entries, component="AuthService", type="Info")
         """
-        results = [entry for entry in entries if self._matches_criteria(entry, **criteria)]
+        normalized = self._normalize_criteria(criteria)
+        results = [entry for entry in entries if self._matches_normalized(entry, normalized)]
         self.logger.info(f"Filtered {len(results)} entries from {len(entries)} with criteria: {criteria}")
         return results
 
@@ -157,13 +167,14 @@ class LogExtractor:
         if isinstance(end_time, str):
             end_time = self._parse_timestamp(end_time)
 
+        normalized = self._normalize_criteria(criteria)
         results = []
         for entry in entries:
             if entry.timestamp:  # Skip entries without timestamps
                 entry_time = self._parse_timestamp(entry.timestamp)
 
                 if start_time <= entry_time <= end_time:
-                    if not criteria or self._matches_criteria(entry, **criteria):
+                    if not normalized or self._matches_normalized(entry, normalized):
                         results.append(entry)
 
         self.logger.info(f"Found {len(results)} entries in time range")
@@ -204,6 +215,7 @@ class LogExtractor:
         else:
             target_time = test_time
 
+        normalized = self._normalize_criteria(criteria)
         results = []
         for entry in entries:
             if entry.timestamp:  # Skip entries without timestamps
@@ -211,7 +223,7 @@ class LogExtractor:
                 time_diff = abs((entry_time - target_time).total_seconds())
 
                 if time_diff <= time_window_seconds:
-                    if not criteria or self._matches_criteria(entry, **criteria):
+                    if not normalized or self._matches_normalized(entry, normalized):
                         results.append((entry, time_diff))
 
         # Sort by time proximity (closest first)
@@ -184,41 +184,52 @@ class LogMonitorStreaming:
         
         # Additional component filtering (if multiple components specified)
         if criteria.required_components and len(criteria.required_components) > 1:
+            components = [comp.lower() for comp in criteria.required_components]
             component_filtered = []
             for entry in filtered_entries:
-                if any(comp.lower() in entry.component.lower() for comp in criteria.required_components):
+                component = entry.component.lower()
+                if any(comp in component for comp in components):
                     component_filtered.append(entry)
             filtered_entries = component_filtered
         
+        # Patterns are lowercased once here and each message once per entry, not once per pattern
         # Message contains filtering
         if criteria.message_contains:
+            contains = [pattern.lower() for pattern in criteria.message_contains]
             message_filtered = []
             for entry in filtered_entries:
-                if all(pattern.lower() in entry.message.lower() for pattern in criteria.message_contains):
+                message = entry.message.lower()
+                if all(pattern in message for pattern in contains):
                     message_filtered.append(entry)
             filtered_entries = message_filtered
         
         # Message excludes filtering
         if criteria.message_excludes:
+            excludes = [pattern.lower() for pattern in criteria.message_excludes]
             exclude_filtered = []
             for entry in filtered_entries:
-                if not any(pattern.lower() in entry.message.lower() for pattern in criteria.message_excludes):
+                message = entry.message.lower()
+                if not any(pattern in message for pattern in excludes):
                     exclude_filtered.append(entry)
             filtered_entries = exclude_filtered
         
         # Additional entry type filtering (if multiple types specified)
         if criteria.entry_types and len(criteria.entry_types) > 1:
+            entry_types = [entry_type.lower() for entry_type in criteria.entry_types]
             type_filtered = []
             for entry in filtered_entries:
-                if any(entry_type.lower() in entry.type.lower() for entry_type in criteria.entry_types):
+                type_value = entry.type.lower()
+                if any(entry_type in type_value for entry_type in entry_types):
                     type_filtered.append(entry)
             filtered_entries = type_filtered
         
         # Additional process name filtering (if multiple names specified)
         if criteria.process_names and len(criteria.process_names) > 1:
+            process_names = [proc.lower() for proc in criteria.process_names]
             process_filtered = []
             for entry in filtered_entries:
-                if any(proc.lower() in entry.process_name.lower() for proc in criteria.process_names):
+                process_name = entry.process_name.lower()
+                if any(proc in process_name for proc in process_names):
                     process_filtered.append(entry)
             filtered_entries = process_filtered
         
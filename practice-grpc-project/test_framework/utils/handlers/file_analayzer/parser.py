@@ -1,5 +1,6 @@
+import io
 import re
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from test_framework.utils.handlers.file_analayzer.entry import LogEntry
 from test_framework.utils import get_logger
@@ -92,7 +93,6 @@ class LogParser:
         :return: List of LogEntry objects
         """
         self.logger.info(f"Parsing log file: {file_path}")
-        entries = []
 
         try:
             for encodings in ['utf-8', 'utf-8-sig', 'latin-1']:
@@ -109,15 +109,46 @@ class LogParser:
                     file_content = f.readlines()
                 self.logger.debug("Successfully opened file with utf-8 encoding.")
 
-            for i, line in enumerate(file_content, 1):
-                if line.strip():
-                    entry = self.parse_line(line, i)
-                    if entry:
-                            entries.append(entry)
-
+            entries = self._parse_lines(file_content)
             self.logger.info(f"Parsed {len(entries)} entries from {file_path}")
             return entries
         except Exception as e:
             self.logger.error(f"Failed to parse file {file_path}: {str(e)}")
             return []
 
+    def parse_bytes(self, content: Union[bytes, bytearray, memoryview]) -> List[LogEntry]:
+        """
+        Parse log content already held in memory, e.g. a downloaded log tail.
+        Decodes and splits lines the same way parse_file reads a file, without a disk round-trip.
+
+        :param content: Raw log content
+        :return: List of LogEntry objects
+        """
+        try:
+            for encodings in ['utf-8', 'utf-8-sig', 'latin-1']:
+                try:
+                    text = str(content, encodings)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                text = str(content, 'utf-8', 'replace')
+
+            # newline=None gives the same universal-newline splitting as a file opened in text mode
+            entries = self._parse_lines(io.StringIO(text, newline=None).readlines())
+            self.logger.info(f"Parsed {len(entries)} entries from {len(content)} bytes of log data")
+            return entries
+        except Exception as e:
+            self.logger.error(f"Failed to parse log content: {str(e)}")
+            return []
+
+    def _parse_lines(self, lines: List[str]) -> List[LogEntry]:
+        """Parse lines into entries, skipping blank lines; line numbers start at 1."""
+        entries = []
+        for i, line in enumerate(lines, 1):
+            if line.strip():
+                entry = self.parse_line(line, i)
+                if entry:
+                    entries.append(entry)
+        return entries
+
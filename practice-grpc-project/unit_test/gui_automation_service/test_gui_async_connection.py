@@ -0,0 +1,38 @@
+"""
+Unit tests for GuiAutomationServiceClient construction and its grpc.aio connection.
+
+These run without protobuf modules or a registered gRPC client: connect_async()
+then returns None and the *_async methods fall back to the sync calls.
+"""
+
+import asyncio
+
+from grpc_client_sdk.services.gui_automation_service_client import GuiAutomationServiceClient
+
+
+class TestAsyncConnection:
+    """Test suite for connect_async() and disconnect() without a live server."""
+
+    def test_client_can_be_constructed(self):
+        """Test every attribute set in __init__ is declared in __slots__."""
+        client = GuiAutomationServiceClient("user")
+        assert client.async_stub is None
+        assert client._async_channel is None
+        assert client._async_loop is None
+
+    def test_connect_async_without_registered_client(self):
+        """Test connect_async() returns None when no connected client is registered."""
+        client = GuiAutomationServiceClient("unit_test_unregistered")
+
+        async def connect():
+            return client.connect_async()
+
+        assert asyncio.run(connect()) is None
+        assert client._async_channel is None
+
+    def test_disconnect_without_async_channel(self):
+        """Test disconnect() works when no async channel was ever opened."""
+        client = GuiAutomationServiceClient("user")
+        client.disconnect()
+        assert client.async_stub is None
+        assert not client._connected
@@ -0,0 +1,138 @@
+"""
+Unit tests for batch operation compaction in GuiAutomationServiceClient.
+
+A GuiWorkflowBuilder run-length encodes repeated operations ({"repeat": n}) and
+records waits as {"action": "delay"} entries. The sync and async batch paths must
+expand and fold these identically before building requests. These tests use fake
+stubs, so no live server is needed.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from grpc_client_sdk.services.gui_automation_service_client import (
+    PROTOBUF_AVAILABLE,
+    GuiAutomationServiceClient,
+    GuiWorkflowBuilder,
+    _compact_ops,
+)
+
+
+def _fake_response(request):
+    """Build a PerformBatch response with one successful result per request operation."""
+    results = [
+        SimpleNamespace(success=True, message="", result_location=SimpleNamespace(x=0, y=0),
+                        execution_time_ms=1)
+        for _ in request.operations
+    ]
+    return SimpleNamespace(
+        operation_results=results,
+        overall_success=True,
+        successful_operations=len(results),
+        failed_operations=0,
+    )
+
+
+class _FakeStub:
+    """Sync stub recording the number of operations in each PerformBatch call."""
+
+    def __init__(self):
+        self.sent = []
+
+    def PerformBatch(self, request, timeout=None):
+        self.sent.append(len(request.operations))
+        return _fake_response(request)
+
+
+class _FakeAsyncStub:
+    """grpc.aio stub recording the number of operations in each PerformBatch call."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def PerformBatch(self, request, timeout=None):
+        self.sent.append(len(request.operations))
+        return _fake_response(request)
+
+
+class _FakeStubClient(GuiAutomationServiceClient):
+    """Connected client whose sync and async stubs are fakes."""
+
+    def __init__(self):
+        super().__init__("user")
+        self.stub = _FakeStub()
+        self._connected = True
+        self.fake_async_stub = _FakeAsyncStub()
+
+    def connect_async(self):
+        return self.fake_async_stub
+
+
+def _rle_workflow():
+    """Three identical clicks (one RLE entry), a wait and one other click."""
+    return (GuiWorkflowBuilder()
+            .click(10, 10)
+            .click(10, 10)
+            .click(10, 10)
+            .wait(100)
+            .click(20, 20))
+
+
+class TestCompactOps:
+    """Test suite for _compact_ops expansion and folding."""
+
+    def test_builder_run_length_encodes_repeats(self):
+        """Test repeated identical clicks are recorded as one entry with a repeat count."""
+        operations = _rle_workflow().operations
+        assert operations[0]["repeat"] == 3
+        assert len(_compact_ops(operations)) == 4
+
+    def test_compaction_does_not_modify_input(self):
+        """Test the builder's operation dicts are left untouched."""
+        operations = _rle_workflow().operations
+        _compact_ops(operations)
+        assert operations[0]["repeat"] == 3
+        assert operations[1]["action"] == "delay"
+
+    def test_leading_delays_fold_into_first_operation(self):
+        """Test delays before the first operation become its delay_before_operation."""
+        operations = (GuiWorkflowBuilder()
+                      .wait(100)
+                      .click(10, 10)
+                      .click(10, 10)
+                      .click(20, 20)).operations
+        operations.insert(1, {"action": "delay", "duration_ms": 50})
+        compacted = _compact_ops(operations)
+        assert [op["action"] for op in compacted] == ["click", "click", "click"]
+        assert compacted[0]["delay_before_operation"] == 150
+        assert "delay_before_operation" not in compacted[1]
+        assert operations[0] == {"action": "delay", "duration_ms": 100}
+
+    def test_delay_only_list_is_kept(self):
+        """Test a list of nothing but delays is returned unchanged for individual mode."""
+        operations = [{"action": "delay", "duration_ms": 100}]
+        assert _compact_ops(operations) == operations
+
+    def test_compaction_is_idempotent(self):
+        """Test compacting an already compacted list is a no-op."""
+        compacted = _compact_ops(_rle_workflow().operations)
+        assert _compact_ops(compacted) == compacted
+
+
+@pytest.mark.skipif(not PROTOBUF_AVAILABLE, reason="generated protobuf modules not available")
+class TestBatchPathsAgree:
+    """Test suite comparing the sync and async batch paths on an RLE'd workflow."""
+
+    def test_sync_and_async_send_same_operation_count(self):
+        """Test an RLE'd builder sends and returns the same number of operations on both paths."""
+        operations = _rle_workflow().operations
+        client = _FakeStubClient()
+
+        sync_result = client.perform_batch_operations(operations)
+        async_result = asyncio.run(client.perform_batch_operations_async(operations))
+
+        assert client.stub.sent == [4]
+        assert client.fake_async_stub.sent == [4]
+        assert len(sync_result["operation_results"]) == len(async_result["operation_results"]) == 4
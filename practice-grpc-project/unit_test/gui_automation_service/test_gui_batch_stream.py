@@ -0,0 +1,69 @@
+"""
+Unit tests for GuiAutomationServiceClient.perform_batch_operations_stream().
+
+Requests are built by a stand-in for _build_request_from_operation and sent to a fake
+grpc.aio stub, so these run without protobuf modules or a live server.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from grpc_client_sdk.services.gui_automation_service_client import GuiAutomationServiceClient
+
+
+class _FakeAsyncStub:
+    """grpc.aio stub whose PerformAction fails for operations marked "fail"."""
+
+    async def PerformAction(self, request, timeout=None):
+        if request.get("fail") == "raise":
+            raise ValueError("boom")
+        return SimpleNamespace(success=not request.get("fail"), message="done",
+                               result_location=SimpleNamespace(x=1, y=2), execution_time_ms=3)
+
+
+class _StreamClient(GuiAutomationServiceClient):
+    """Client that sends operation dicts as requests; "bogus" actions cannot be built."""
+
+    def __init__(self):
+        super().__init__("user")
+        self._connected = True
+        self.fake_async_stub = _FakeAsyncStub()
+
+    def connect_async(self):
+        return self.fake_async_stub
+
+    def _build_request_from_operation(self, operation, target_user):
+        return None if operation["action"] == "bogus" else operation
+
+
+def _stream(operations, stop_on_error):
+    """Collect every result the stream yields."""
+    async def collect():
+        client = _StreamClient()
+        return [result async for result in client.perform_batch_operations_stream(
+            operations, stop_on_error=stop_on_error)]
+    return asyncio.run(collect())
+
+
+class TestBatchStream:
+    """Test suite for result alignment and error handling in the streamed batch."""
+
+    def test_invalid_operation_yields_failed_result(self):
+        """Test an operation that cannot be built still yields a result in its position."""
+        results = _stream([{"action": "click"}, {"action": "bogus"}, {"action": "click"}],
+                          stop_on_error=False)
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[1]["message"] == "Invalid operation"
+
+    def test_invalid_operation_honours_stop_on_error(self):
+        """Test an invalid operation ends the stream when stop_on_error is set."""
+        results = _stream([{"action": "bogus"}, {"action": "click"}], stop_on_error=True)
+        assert [result["success"] for result in results] == [False]
+
+    def test_exception_yields_failed_result(self):
+        """Test a non-gRPC exception is reported as a failed result instead of ending the stream."""
+        results = _stream([{"action": "click", "fail": "raise"}, {"action": "click"}],
+                          stop_on_error=False)
+        assert [result["success"] for result in results] == [False, True]
+        assert results[0]["message"] == "boom"
+        assert isinstance(results[1], dict)
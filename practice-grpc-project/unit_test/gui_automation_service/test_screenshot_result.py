@@ -0,0 +1,71 @@
+"""
+Unit tests for ScreenshotResult returned by GuiAutomationServiceClient.take_screenshot().
+
+Membership, keys and JSON encoding only see the bytes kept in memory, while
+result["screenshot_data"], get() and load_screenshot_data() read the image back from
+"file_path" when it was not kept.
+"""
+
+import json
+
+import pytest
+
+from grpc_client_sdk.services.gui_automation_service_client import ScreenshotResult
+
+
+def _saved_result(file_path):
+    """Result of a screenshot saved to file_path without keeping the bytes."""
+    return ScreenshotResult(success=True, message="ok", screenshot_size=3, file_path=str(file_path))
+
+
+class TestScreenshotResult:
+    """Test suite for ScreenshotResult mapping behavior."""
+
+    def test_contains_matches_keys(self, tmp_path):
+        """Test "in" and keys() agree when the bytes were not kept."""
+        result = _saved_result(tmp_path / "shot.png")
+        assert "file_path" in result
+        assert "screenshot_data" not in result
+        assert "screenshot_data" not in result.keys()
+        assert len(result) == len(list(result.keys())) == 4
+
+    def test_get_on_missing_file(self, tmp_path):
+        """Test get(), subscripting and load_screenshot_data() do not raise when the file is gone."""
+        result = _saved_result(tmp_path / "missing.png")
+        assert result.get("screenshot_data") == b""
+        assert result["screenshot_data"] == b""
+        assert result.load_screenshot_data() == b""
+
+    def test_subscript_reads_saved_file(self, tmp_path):
+        """Test result["screenshot_data"] and get() read the saved file without storing it."""
+        file_path = tmp_path / "shot.png"
+        file_path.write_bytes(b"png")
+        result = _saved_result(file_path)
+        assert result["screenshot_data"] == b"png"
+        assert result.get("screenshot_data") == b"png"
+        assert "screenshot_data" not in result
+
+    def test_other_missing_keys_raise(self, tmp_path):
+        """Test only "screenshot_data" falls back; other missing keys behave as in a dict."""
+        result = _saved_result(tmp_path / "shot.png")
+        assert result.get("width") is None
+        with pytest.raises(KeyError):
+            result["width"]
+
+    def test_load_screenshot_data_reads_file(self, tmp_path):
+        """Test load_screenshot_data() reads the saved file without adding it to the dict."""
+        file_path = tmp_path / "shot.png"
+        file_path.write_bytes(b"png")
+        result = _saved_result(file_path)
+        assert result.load_screenshot_data() == b"png"
+        assert "screenshot_data" not in result
+
+    def test_load_screenshot_data_prefers_kept_bytes(self):
+        """Test bytes kept with include_data are returned as-is."""
+        result = ScreenshotResult(success=True, screenshot_data=b"png", screenshot_size=3)
+        assert result.load_screenshot_data() == b"png"
+
+    def test_json_dumps(self, tmp_path):
+        """Test the result encodes to JSON with the same keys it reports."""
+        result = _saved_result(tmp_path / "shot.png")
+        assert json.loads(json.dumps(result)) == dict(result)